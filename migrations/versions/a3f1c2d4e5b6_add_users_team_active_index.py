@@ -0,0 +1,43 @@
+"""add users team/active index
+
+Revision ID: a3f1c2d4e5b6
+Revises: 766c90678ca0
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3f1c2d4e5b6"
+down_revision = "766c90678ca0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if _has_table("users") and not _has_index("users", "ix_users_team_active"):
+        op.create_index(
+            "ix_users_team_active",
+            "users",
+            ["team_id", "is_active"],
+            unique=False,
+        )
+
+
+def downgrade():
+    if _has_index("users", "ix_users_team_active"):
+        op.drop_index("ix_users_team_active", table_name="users")
+
+
+def _has_table(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return bool(inspector.has_table(table_name))
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table_name):
+        return False
+    return index_name in {index["name"] for index in inspector.get_indexes(table_name)}
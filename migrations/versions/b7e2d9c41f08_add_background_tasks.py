@@ -0,0 +1,51 @@
+"""add background tasks
+
+Revision ID: b7e2d9c41f08
+Revises: a3f1c2d4e5b6
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7e2d9c41f08"
+down_revision = "a3f1c2d4e5b6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if _has_table("background_tasks"):
+        return
+    op.create_table(
+        "background_tasks",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column(
+            "user_id", sa.String(length=36), sa.ForeignKey("users.id"), nullable=True
+        ),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_background_tasks_created_at",
+        "background_tasks",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade():
+    if _has_table("background_tasks"):
+        op.drop_index("ix_background_tasks_created_at", table_name="background_tasks")
+        op.drop_table("background_tasks")
+
+
+def _has_table(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return bool(inspector.has_table(table_name))
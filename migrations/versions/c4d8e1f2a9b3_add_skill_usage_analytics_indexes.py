@@ -0,0 +1,86 @@
+"""add skill usage analytics indexes
+
+Revision ID: c4d8e1f2a9b3
+Revises: b7e2d9c41f08
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4d8e1f2a9b3"
+down_revision = "b7e2d9c41f08"
+branch_labels = None
+depends_on = None
+
+_INCLUDE = ["skill_name", "skill_source", "confidence"]
+_INDEXES = {
+    "ix_skill_usages_team_created": ["team_id", "created_at"],
+    "ix_skill_usages_user_created": ["user_id", "created_at"],
+}
+# Leading-column prefixes of the composite indexes above
+_REDUNDANT_INDEXES = {
+    "ix_skill_usages_team_id": ["team_id"],
+    "ix_skill_usages_user_id": ["user_id"],
+}
+
+
+def upgrade():
+    if not _has_table("skill_usages"):
+        return
+    # CONCURRENTLY keeps skill usage logging writable on Postgres while the
+    # indexes build; it cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for index_name, columns in _INDEXES.items():
+            if not _has_index("skill_usages", index_name):
+                op.create_index(
+                    index_name,
+                    "skill_usages",
+                    columns,
+                    unique=False,
+                    postgresql_include=_INCLUDE,
+                    postgresql_concurrently=True,
+                )
+        for index_name in _REDUNDANT_INDEXES:
+            if _has_index("skill_usages", index_name):
+                op.drop_index(
+                    index_name,
+                    table_name="skill_usages",
+                    postgresql_concurrently=True,
+                )
+
+
+def downgrade():
+    if not _has_table("skill_usages"):
+        return
+    with op.get_context().autocommit_block():
+        for index_name, columns in _REDUNDANT_INDEXES.items():
+            if not _has_index("skill_usages", index_name):
+                op.create_index(
+                    index_name,
+                    "skill_usages",
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                )
+        for index_name in _INDEXES:
+            if _has_index("skill_usages", index_name):
+                op.drop_index(
+                    index_name,
+                    table_name="skill_usages",
+                    postgresql_concurrently=True,
+                )
+
+
+def _has_table(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return bool(inspector.has_table(table_name))
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table_name):
+        return False
+    return index_name in {index["name"] for index in inspector.get_indexes(table_name)}
@@ -0,0 +1,54 @@
+"""add skill usage name/created index
+
+Revision ID: d1a7f3b5c6e2
+Revises: c4d8e1f2a9b3
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d1a7f3b5c6e2"
+down_revision = "c4d8e1f2a9b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if _has_table("skill_usages") and not _has_index(
+        "skill_usages", "ix_skill_usages_name_created"
+    ):
+        # CONCURRENTLY keeps skill usage logging writable on Postgres while
+        # the index builds; it cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_skill_usages_name_created",
+                "skill_usages",
+                ["skill_name", "created_at"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    if _has_index("skill_usages", "ix_skill_usages_name_created"):
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                "ix_skill_usages_name_created",
+                table_name="skill_usages",
+                postgresql_concurrently=True,
+            )
+
+
+def _has_table(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return bool(inspector.has_table(table_name))
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table_name):
+        return False
+    return index_name in {index["name"] for index in inspector.get_indexes(table_name)}
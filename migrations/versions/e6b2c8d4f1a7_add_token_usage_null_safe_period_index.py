@@ -0,0 +1,112 @@
+"""add null-safe token usage period index
+
+Revision ID: e6b2c8d4f1a7
+Revises: d1a7f3b5c6e2
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e6b2c8d4f1a7"
+down_revision = "d1a7f3b5c6e2"
+branch_labels = None
+depends_on = None
+
+_INDEX_NAME = "uq_token_usage_period_keys"
+_COUNTERS = ("input_tokens", "output_tokens", "total_tokens", "request_count")
+
+_token_usages = sa.table(
+    "token_usages",
+    sa.column("id", sa.String),
+    sa.column("user_id", sa.String),
+    sa.column("team_id", sa.String),
+    sa.column("period_year", sa.Integer),
+    sa.column("period_month", sa.Integer),
+    sa.column("input_tokens", sa.BigInteger),
+    sa.column("output_tokens", sa.BigInteger),
+    sa.column("total_tokens", sa.BigInteger),
+    sa.column("request_count", sa.Integer),
+    sa.column("monthly_limit", sa.BigInteger),
+)
+
+
+def upgrade():
+    if not _has_table("token_usages"):
+        return
+    # uq_token_usage_period treats NULL keys as distinct, so racing first
+    # requests may already have split a period across several rows
+    _merge_duplicate_periods()
+    # CONCURRENTLY keeps token accounting writable on Postgres while the
+    # index builds; it cannot run inside a transaction. Expression indexes
+    # are not reflected on every backend, hence IF NOT EXISTS over _has_index.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            _INDEX_NAME,
+            "token_usages",
+            [
+                sa.text("coalesce(user_id, '')"),
+                sa.text("coalesce(team_id, '')"),
+                "period_year",
+                "period_month",
+            ],
+            unique=True,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    if not _has_table("token_usages"):
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            _INDEX_NAME,
+            table_name="token_usages",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def _merge_duplicate_periods() -> None:
+    """Fold each period's duplicate rows into one, summing the counters."""
+    bind = op.get_bind()
+    t = _token_usages
+    keys = (
+        sa.func.coalesce(t.c.user_id, ""),
+        sa.func.coalesce(t.c.team_id, ""),
+        t.c.period_year,
+        t.c.period_month,
+    )
+    duplicates = bind.execute(
+        sa.select(*keys).group_by(*keys).having(sa.func.count() > 1)
+    ).all()
+    for values in duplicates:
+        rows = bind.execute(
+            sa.select(t)
+            .where(*(key == value for key, value in zip(keys, values, strict=True)))
+            .order_by(t.c.id)
+        ).all()
+        # Keep a row carrying a custom limit if there is one
+        keep = next((row for row in rows if row.monthly_limit is not None), rows[0])
+        bind.execute(
+            sa.update(t)
+            .where(t.c.id == keep.id)
+            .values(
+                {
+                    counter: sum(getattr(row, counter) or 0 for row in rows)
+                    for counter in _COUNTERS
+                }
+            )
+        )
+        bind.execute(
+            sa.delete(t).where(t.c.id.in_([row.id for row in rows if row is not keep]))
+        )
+
+
+def _has_table(table_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return bool(inspector.has_table(table_name))
+
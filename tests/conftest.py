@@ -33,3 +33,37 @@ def db(app):
     from webapp.models import db as _db
 
     return _db
+
+
+@pytest.fixture
+def count_queries(app):
+    """Capture the SQL statements run inside a ``with`` block.
+
+    Usage: ``with count_queries("messages") as statements: ...``. With table
+    names given, only statements mentioning one of those tables are kept.
+    """
+    import re
+    from contextlib import contextmanager
+
+    from sqlalchemy import event
+
+    from webapp.models import db as _db
+
+    @contextmanager
+    def _count_queries(*tables):
+        alternatives = "|".join(re.escape(table) for table in tables)
+        pattern = re.compile(rf"\b(?:{alternatives})\b") if tables else None
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            if pattern is None or pattern.search(statement):
+                statements.append(statement)
+
+        engine = _db.engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    return _count_queries
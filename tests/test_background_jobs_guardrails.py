@@ -1,24 +1,152 @@
 """Tests for background job guardrail behavior."""
 
+import concurrent.futures
+import threading
 import time
 
-from webapp.services.background_jobs import _run_job_once
+import pytest
+from flask import Flask
 
+from webapp.services import background_jobs
+from webapp.services.background_jobs import (
+    ManagedJob,
+    _run_job_once,
+    _run_job_with_retries,
+    _wrap_job,
+)
 
-def test_run_job_once_times_out():
+
+@pytest.fixture
+def executor():
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_run_job_once_times_out(executor):
     def slow_job():
         time.sleep(1.2)
 
-    result = _run_job_once(slow_job, max_runtime_seconds=1)
+    result = _run_job_once(slow_job, executor=executor, max_runtime_seconds=1)
     assert result["ok"] is False
     assert result["timed_out"] is True
 
 
-def test_run_job_once_reports_exception():
+def test_run_job_once_reports_exception(executor):
     def failing_job():
         raise ValueError("boom")
 
-    result = _run_job_once(failing_job, max_runtime_seconds=5)
+    result = _run_job_once(failing_job, executor=executor, max_runtime_seconds=5)
     assert result["ok"] is False
     assert result["timed_out"] is False
     assert "ValueError" in str(result["reason"])
+
+
+def test_run_job_once_runs_on_the_given_pool():
+    seen = []
+
+    def job():
+        seen.append(threading.current_thread().name)
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="bg-job-test"
+    ) as pool:
+        for _ in range(3):
+            result = _run_job_once(job, executor=pool, max_runtime_seconds=5)
+            assert result["ok"] is True
+    assert seen == ["bg-job-test_0"] * 3
+
+
+class _RecordingEvent:
+    """Stand-in for the shutdown event that records retry waits."""
+
+    def __init__(self, shutting_down: bool = False):
+        self.waits: list[float] = []
+        self.shutting_down = shutting_down
+
+    def wait(self, timeout: float) -> bool:
+        self.waits.append(timeout)
+        return self.shutting_down
+
+
+def _retry_failing_job(executor, max_retries: int) -> list[str]:
+    calls = []
+
+    def failing_job():
+        calls.append("run")
+        raise ValueError("boom")
+
+    _run_job_with_retries(
+        app=Flask(__name__),
+        job=ManagedJob(job_id="flaky", func=failing_job),
+        executor=executor,
+        max_runtime_seconds=5,
+        max_retries=max_retries,
+        retry_backoff_seconds=2.0,
+        max_retry_delay_seconds=5.0,
+        started_monotonic=time.monotonic(),
+    )
+    return calls
+
+
+def test_retry_backoff_is_capped(executor, monkeypatch):
+    event = _RecordingEvent()
+    monkeypatch.setattr(background_jobs, "_SHUTDOWN_EVENT", event)
+
+    calls = _retry_failing_job(executor, max_retries=4)
+
+    assert len(calls) == 5
+    assert event.waits == [2.0, 4.0, 5.0, 5.0]
+
+
+def test_retry_wait_stops_on_shutdown(executor, monkeypatch):
+    event = _RecordingEvent(shutting_down=True)
+    monkeypatch.setattr(background_jobs, "_SHUTDOWN_EVENT", event)
+
+    calls = _retry_failing_job(executor, max_retries=4)
+
+    assert len(calls) == 1
+    assert event.waits == [2.0]
+
+
+def _wrap(job, executor):
+    return _wrap_job(
+        app=Flask(__name__),
+        job=job,
+        lock=threading.Lock(),
+        executor=executor,
+        max_runtime_seconds=1,
+        max_retries=0,
+        retry_backoff_seconds=0.0,
+        max_retry_delay_seconds=0.0,
+    )
+
+
+def test_hung_job_holds_at_most_one_worker(executor):
+    release = threading.Event()
+    hung_starts = []
+    healthy_runs = []
+
+    def hung_job():
+        hung_starts.append("run")
+        release.wait(10)
+
+    hung = _wrap(ManagedJob(job_id="hung", func=hung_job), executor)
+    healthy = _wrap(
+        ManagedJob(job_id="healthy", func=lambda: healthy_runs.append("run")),
+        executor,
+    )
+    try:
+        hung()  # times out but keeps running on one of the two workers
+        hung()  # skipped by the overlap guard instead of taking the other
+        healthy()
+        assert hung_starts == ["run"]
+        assert healthy_runs == ["run"]
+    finally:
+        release.set()
+
+    # The guard is released once the hung run finally finishes
+    deadline = time.monotonic() + 5
+    while len(hung_starts) < 2 and time.monotonic() < deadline:
+        hung()
+    assert len(hung_starts) == 2
@@ -132,6 +132,36 @@ class TestNextDeadline:
         assert result is not None
 
 
+class TestDeadlineMemoization:
+    """Test that deadline computation is reused within a day."""
+
+    def test_repeat_calls_hit_cache_and_return_copies(self, app):
+        """Same-day calls reuse the computation but hand out fresh dicts."""
+        from webapp.services.bas_deadlines import (
+            _compute_upcoming_deadlines,
+            get_upcoming_deadlines,
+        )
+
+        _compute_upcoming_deadlines.cache_clear()
+        ref = date(2025, 10, 1)
+        first = get_upcoming_deadlines(frequency="quarterly", reference_date=ref)
+        first[0]["due_date"] = first[0]["due_date"].isoformat()
+        second = get_upcoming_deadlines(frequency="quarterly", reference_date=ref)
+
+        assert _compute_upcoming_deadlines.cache_info().hits == 1
+        assert isinstance(second[0]["due_date"], date)
+
+    def test_settings_are_part_of_the_key(self, app):
+        """Different frequencies are computed separately."""
+        from webapp.services.bas_deadlines import get_upcoming_deadlines
+
+        ref = date(2025, 10, 1)
+        quarterly = get_upcoming_deadlines(frequency="quarterly", reference_date=ref)
+        monthly = get_upcoming_deadlines(frequency="monthly", reference_date=ref)
+        assert {d["type"] for d in quarterly} == {"quarterly"}
+        assert {d["type"] for d in monthly} == {"monthly"}
+
+
 class TestDeadlineStatus:
     """Test deadline status function."""
 
@@ -240,6 +270,30 @@ class TestRemindersBlueprint:
         assert "reminders" in data
         assert "status" in data
 
+    def test_reminder_dates_are_iso_formatted(self, app):
+        """Reminder dates are ISO strings, not the provider's HTTP dates."""
+        from unittest.mock import patch
+
+        client = app.test_client()
+        client.post(
+            "/api/auth/register",
+            json={"email": "test@test.com", "password": "password123", "name": "Test"},
+        )
+        reminder = {
+            "quarter": "Q1",
+            "period_end": date(2025, 9, 30),
+            "due_date": date(2025, 10, 28),
+        }
+        with patch(
+            "webapp.blueprints.reminders.get_reminders_for_user",
+            return_value=[reminder],
+        ):
+            res = client.get("/api/reminders/bas")
+        assert res.status_code == 200
+        data = res.get_json()
+        assert data["reminders"][0]["period_end"] == "2025-09-30"
+        assert data["reminders"][0]["due_date"] == "2025-10-28"
+
     def test_get_settings(self, app):
         """Test getting reminder settings."""
         client = app.test_client()
@@ -0,0 +1,41 @@
+"""Tests for the shared blueprint login decorator."""
+
+from flask import Flask
+from flask_login import LoginManager
+
+from webapp.blueprints._auth import login_required_or_testing
+
+
+def _make_app(testing: bool) -> Flask:
+    app = Flask(__name__)
+    app.config["TESTING"] = testing
+    app.config["SECRET_KEY"] = "test-secret"
+    login_manager = LoginManager(app)
+    login_manager.user_loader(lambda user_id: None)
+
+    @app.route("/protected")
+    @login_required_or_testing
+    def protected():
+        return {"ok": True}
+
+    return app
+
+
+class TestLoginRequiredOrTesting:
+    """Tests for login_required_or_testing."""
+
+    def test_bypassed_in_testing_mode(self):
+        client = _make_app(testing=True).test_client()
+        res = client.get("/protected")
+        assert res.status_code == 200
+        assert res.get_json() == {"ok": True}
+
+    def test_rejects_anonymous_user(self):
+        client = _make_app(testing=False).test_client()
+        res = client.get("/protected")
+        assert res.status_code == 401
+        assert res.get_json() == {"error": "Authentication required"}
+
+    def test_preserves_wrapped_name(self):
+        app = _make_app(testing=True)
+        assert "protected" in app.view_functions
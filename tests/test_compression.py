@@ -0,0 +1,107 @@
+"""Tests for gzip response compression."""
+
+import gzip
+
+from flask import Flask, Response, jsonify, request, send_file
+
+from webapp.compression import init_response_compression
+
+PAYLOAD = {"rows": [{"name": f"employee-{i}", "amount": i * 1.5} for i in range(200)]}
+
+
+def _compressed_app(**config) -> Flask:
+    app = Flask(__name__)
+    app.config.update(config)
+    init_response_compression(app)
+
+    @app.route("/json")
+    def json_view():
+        return jsonify(PAYLOAD)
+
+    @app.route("/small")
+    def small_view():
+        return jsonify({"ok": True})
+
+    @app.route("/csv")
+    def csv_view():
+        rows = (f"row-{i},value-{i}\n" for i in range(1000))
+        return Response(rows, mimetype="text/csv")
+
+    @app.route("/etag")
+    def etag_view():
+        response = jsonify(PAYLOAD)
+        response.set_etag("payload-v1")
+        return response.make_conditional(request)
+
+    @app.route("/file")
+    def file_view():
+        return send_file(__file__, mimetype="text/plain")
+
+    return app
+
+
+class TestResponseCompression:
+    """Tests for init_response_compression."""
+
+    def test_gzips_large_json(self):
+        client = _compressed_app().test_client()
+        resp = client.get("/json", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert int(resp.headers["Content-Length"]) == len(resp.data)
+        body = gzip.decompress(resp.data)
+        assert Flask(__name__).json.loads(body) == PAYLOAD
+
+    def test_leaves_response_alone_without_accept_encoding(self):
+        client = _compressed_app().test_client()
+        resp = client.get("/json")
+        assert "Content-Encoding" not in resp.headers
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert resp.get_json() == PAYLOAD
+
+    def test_skips_small_bodies(self):
+        client = _compressed_app().test_client()
+        resp = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in resp.headers
+        assert resp.get_json() == {"ok": True}
+
+    def test_gzips_streamed_csv(self):
+        client = _compressed_app().test_client()
+        resp = client.get("/csv", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in resp.headers
+        text = gzip.decompress(resp.data).decode()
+        assert text.startswith("row-0,value-0\n")
+        assert text.endswith("row-999,value-999\n")
+
+    def test_skips_passthrough_files(self):
+        client = _compressed_app().test_client()
+        resp = client.get("/file", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in resp.headers
+        resp.close()
+
+    def test_disabled_by_config(self):
+        client = _compressed_app(COMPRESS_ENABLED=False).test_client()
+        resp = client.get("/json", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in resp.headers
+
+    def test_weakens_etag_and_matches_conditional_get(self):
+        client = _compressed_app().test_client()
+        resp = client.get("/etag", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.headers["ETag"] == 'W/"payload-v1"'
+
+        revalidated = client.get(
+            "/etag",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": resp.headers["ETag"]},
+        )
+        assert revalidated.status_code == 304
+
+    def test_keeps_strong_etag_when_not_compressed(self):
+        client = _compressed_app().test_client()
+        resp = client.get("/etag")
+        assert "Content-Encoding" not in resp.headers
+        assert resp.headers["ETag"] == '"payload-v1"'
+
+        revalidated = client.get("/etag", headers={"If-None-Match": '"payload-v1"'})
+        assert revalidated.status_code == 304
@@ -109,10 +109,41 @@ class TestConversationModel:
             db.session.add(msg)
             db.session.commit()
 
-            assert conv.messages.count() == 1
+            assert len(conv.messages) == 1
             assert msg.conversation == conv
 
 
+class TestRaiseloadSwitch:
+    """Tests for the SQLALCHEMY_RAISELOAD switch."""
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_raiseload_follows_config(self, enabled):
+        """Lazy loads raise only when SQLALCHEMY_RAISELOAD is on."""
+        from sqlalchemy.exc import InvalidRequestError
+
+        from webapp.models import raiseload_if_enabled
+
+        app = create_app(TestingConfig)
+        app.config["SQLALCHEMY_RAISELOAD"] = enabled
+        with app.app_context():
+            db.create_all()
+            conv = Conversation(user_id="user-123")
+            db.session.add(conv)
+            db.session.flush()
+            db.session.add(Message(conversation_id=conv.id, role="user", content="hi"))
+            db.session.commit()
+            db.session.expunge_all()
+
+            loaded = Conversation.query.options(*raiseload_if_enabled()).one()
+            if enabled:
+                with pytest.raises(InvalidRequestError):
+                    list(loaded.messages)
+            else:
+                assert len(list(loaded.messages)) == 1
+            db.session.remove()
+            db.drop_all()
+
+
 class TestMessageModel:
     """Tests for Message model."""
 
@@ -213,6 +244,29 @@ class TestMessageModel:
 
             assert db.session.get(Message, msg_id) is None
 
+    def test_message_to_dicts_matches_to_dict(self, app):
+        """Column-level serialization matches per-instance to_dict, in order."""
+        with app.app_context():
+            conv = Conversation(user_id="user-123")
+            db.session.add(conv)
+            db.session.flush()
+            now = utcnow()
+            for i, role in enumerate(("user", "assistant")):
+                db.session.add(
+                    Message(
+                        conversation_id=conv.id,
+                        role=role,
+                        content=f"Message {i}",
+                        skills_used=["gst"] if i else None,
+                        created_at=now + timedelta(seconds=i),
+                    )
+                )
+            db.session.commit()
+
+            expected = [m.to_dict() for m in conv.messages]
+            assert Message.to_dicts(Message.conversation_id == conv.id) == expected
+            assert [m["role"] for m in expected] == ["user", "assistant"]
+
 
 class TestConversationEndpoints:
     """Tests for conversation API endpoints."""
@@ -258,6 +312,42 @@ class TestConversationEndpoints:
         data = response.get_json()
         assert "error" in data
 
+    def test_list_conversations_counts_messages_in_one_query(
+        self, client, app, count_queries
+    ):
+        """Message counts come from one grouped query, not one per conversation."""
+        res = client.post(
+            "/api/auth/register",
+            json={
+                "email": "lister@test.com",
+                "password": "password123",
+                "name": "Lister",
+            },
+        )
+        user_id = res.get_json()["user"]["id"]
+        # The chat blueprint only resolves the logged-in user outside TESTING
+        app.config["TESTING"] = False
+        with app.app_context():
+            for i in range(3):
+                conv = Conversation(user_id=user_id)
+                db.session.add(conv)
+                db.session.flush()
+                for _ in range(i):
+                    db.session.add(
+                        Message(conversation_id=conv.id, role="user", content="hi")
+                    )
+            db.session.commit()
+
+            with count_queries("messages") as statements:
+                response = client.get("/api/conversations")
+
+        assert response.status_code == 200
+        counts = sorted(
+            c["message_count"] for c in response.get_json()["conversations"]
+        )
+        assert counts == [0, 1, 2]
+        assert len(statements) == 1
+
     def test_get_conversation_not_found(self, client):
         """Test getting non-existent conversation."""
         response = client.get("/api/conversations/nonexistent")
@@ -381,6 +471,25 @@ class TestConversationCleanup:
         with app.app_context():
             assert Message.query.count() == 0
 
+    def test_cleanup_keeps_messages_of_live_conversations(self, app):
+        """Bulk cleanup only removes messages that belong to expired conversations."""
+        with app.app_context():
+            for days in (-1, 10):
+                conv = Conversation(user_id="user-1")
+                conv.expires_at = utcnow() + timedelta(days=days)
+                db.session.add(conv)
+                db.session.flush()
+                db.session.add(
+                    Message(conversation_id=conv.id, role="user", content="Hi")
+                )
+            db.session.commit()
+
+        assert cleanup_expired_conversations(app) == 1
+
+        with app.app_context():
+            (message,) = Message.query.all()
+            assert message.conversation.expires_at > utcnow()
+
 
 class TestChatPersistence:
     """Tests for chat message persistence."""
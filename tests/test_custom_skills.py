@@ -100,6 +100,28 @@ class TestSkillLoader:
         assert skill.owner_id == "user123"
         assert skill.path.startswith("r2://")
 
+    def test_skill_to_dict(self):
+        """Test API serialization of a loaded skill."""
+        from webapp.skills import SkillLoader
+
+        loader = SkillLoader()
+        skill = loader.load_from_content(
+            VALID_SKILL_CONTENT, path="test", source="shared", owner_id="team1"
+        )
+
+        assert skill.to_dict() == {
+            "name": "test_skill",
+            "description": "A test skill for unit testing",
+            "version": "1.0.0",
+            "author": "Test Author",
+            "triggers": ["run test", "execute test"],
+            "industries": ["general"],
+            "tags": ["test", "unit-test"],
+            "source": "shared",
+            "owner_id": "team1",
+            "path": "test",
+        }
+
     def test_load_from_content_no_frontmatter(self):
         """Test loading content without frontmatter fails."""
         from webapp.skills import SkillLoader
@@ -445,6 +467,63 @@ class TestCustomSkillService:
 
             db.drop_all()
 
+    def test_get_skill_content_cached_per_content_hash(self, app, service):
+        """Unchanged skills are read from R2 once; edits fetch fresh content."""
+        from webapp.models import db
+
+        with app.app_context():
+            db.create_all()
+
+            skill = service.create_skill(
+                content=VALID_SKILL_CONTENT,
+                scope="private",
+                user_id="user123",
+                created_by="user123",
+            )
+            r2 = service.r2_loader
+            r2.is_enabled = True
+            r2.download.return_value = VALID_SKILL_CONTENT
+
+            assert service.get_skill_content(skill.id) == VALID_SKILL_CONTENT
+            assert service.get_skill_content(skill.id) == VALID_SKILL_CONTENT
+            assert r2.download.call_count == 1
+
+            updated = VALID_SKILL_CONTENT.replace("1.0.0", "1.1.0")
+            service.update_skill(skill.id, updated, user_id="user123")
+            r2.download.return_value = updated
+
+            assert service.get_skill_content(skill.id) == updated
+            assert r2.download.call_count == 2
+
+            db.drop_all()
+
+    def test_get_skills_content_downloads_misses_concurrently(self, service):
+        """Cache misses are fetched from R2 in parallel; hits are reused."""
+        import threading
+
+        skills = [
+            MagicMock(id=f"skill-{i}", storage_key=f"key-{i}", content_hash="h")
+            for i in range(3)
+        ]
+        r2 = service.r2_loader
+        r2.is_enabled = True
+        # Every download waits for the others, so this only finishes in parallel
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _download(storage_key):
+            barrier.wait()
+            return f"content for {storage_key}"
+
+        r2.download.side_effect = _download
+
+        contents = service.get_skills_content(skills)
+        assert contents == {f"skill-{i}": f"content for key-{i}" for i in range(3)}
+
+        assert service.get_skills_content(skills[:1]) == {
+            "skill-0": "content for key-0"
+        }
+        assert r2.download.call_count == 3
+
 
 class TestSkillRegistry:
     """Tests for SkillRegistry multi-source discovery."""
@@ -609,6 +688,241 @@ class TestSkillsBlueprint:
         # Should either return 401 or skills list
         assert response.status_code in [200, 401]
 
+    def test_list_skills_reuses_cached_listing(self, client):
+        """Repeat listings skip discovery until the stored skills change."""
+        from unittest.mock import patch
+
+        from webapp.blueprints import skills as skills_module
+        from webapp.models import CustomSkill, db
+
+        skills_module._skill_list_cache.clear()
+        user = MagicMock(id="user-1", team_id="team-1")
+        skill = MagicMock()
+        skill.to_dict.return_value = {"name": "test_skill"}
+        registry = MagicMock()
+        registry.discover_all_skills.return_value = {
+            "private": [skill],
+            "shared": [],
+            "public": [],
+        }
+
+        with (
+            patch.object(skills_module, "get_current_user", return_value=user),
+            patch.object(skills_module, "get_registry", return_value=registry),
+        ):
+            first = client.get("/skills/api/skills")
+            second = client.get("/skills/api/skills")
+            assert registry.discover_all_skills.call_count == 1
+            assert first.get_json() == second.get_json()
+            assert second.get_json()["skills"]["private"] == [{"name": "test_skill"}]
+
+            # A change written by another worker, which cannot clear this
+            # process's cache, still forces a fresh listing
+            db.session.add(
+                CustomSkill(
+                    user_id="user-1",
+                    created_by="user-1",
+                    name="added_elsewhere",
+                    storage_key="skills/user-1/added_elsewhere/SKILL.md",
+                    scope="private",
+                )
+            )
+            db.session.commit()
+            client.get("/skills/api/skills")
+            assert registry.discover_all_skills.call_count == 2
+
+            # Skills of other users and teams do not affect this listing
+            db.session.add(
+                CustomSkill(
+                    team_id="team-2",
+                    created_by="user-2",
+                    name="other_team",
+                    storage_key="skills/team-2/other_team/SKILL.md",
+                    scope="shared",
+                )
+            )
+            db.session.commit()
+            client.get("/skills/api/skills")
+            assert registry.discover_all_skills.call_count == 2
+
+        skills_module._skill_list_cache.clear()
+
+    def test_list_skills_conditional_get(self, client):
+        """Listing responses carry an ETag and honour If-None-Match."""
+        from unittest.mock import patch
+
+        from webapp.blueprints import skills as skills_module
+        from webapp.models import CustomSkill, db
+
+        skills_module._skill_list_cache.clear()
+        user = MagicMock(id="user-1", team_id="team-1")
+        skill = MagicMock()
+        skill.to_dict.return_value = {"name": "test_skill"}
+        registry = MagicMock()
+        registry.discover_all_skills.return_value = {
+            "private": [skill],
+            "shared": [],
+            "public": [],
+        }
+
+        with (
+            patch.object(skills_module, "get_current_user", return_value=user),
+            patch.object(skills_module, "get_registry", return_value=registry),
+        ):
+            first = client.get("/skills/api/skills")
+            etag = first.headers["ETag"]
+            assert first.status_code == 200
+
+            # A worker without the cached body answers from the version alone
+            skills_module._skill_list_cache.clear()
+            second = client.get(
+                "/skills/api/skills", headers={"If-None-Match": etag}
+            )
+            assert second.status_code == 304
+            assert second.data == b""
+            assert registry.discover_all_skills.call_count == 1
+
+            stale = client.get(
+                "/skills/api/skills", headers={"If-None-Match": '"stale"'}
+            )
+            assert stale.status_code == 200
+            assert stale.get_json()["skills"]["private"] == [{"name": "test_skill"}]
+
+            # A change written by another worker invalidates the old ETag
+            db.session.add(
+                CustomSkill(
+                    user_id="user-1",
+                    created_by="user-1",
+                    name="added_elsewhere",
+                    storage_key="skills/user-1/added_elsewhere/SKILL.md",
+                    scope="private",
+                )
+            )
+            db.session.commit()
+            changed = client.get("/skills/api/skills", headers={"If-None-Match": etag})
+            assert changed.status_code == 200
+            assert changed.headers["ETag"] != etag
+
+        skills_module._skill_list_cache.clear()
+
+    def test_content_size_check(self):
+        """Size checks count UTF-8 bytes, not characters."""
+        from webapp.blueprints.skills import MAX_SKILL_FILE_SIZE, _content_too_large
+
+        assert not _content_too_large("a" * 100)
+        assert not _content_too_large("a" * MAX_SKILL_FILE_SIZE)
+        assert _content_too_large("a" * (MAX_SKILL_FILE_SIZE + 1))
+        # 3 bytes per character in UTF-8
+        assert _content_too_large("\u20ac" * (MAX_SKILL_FILE_SIZE // 3 + 1))
+        assert not _content_too_large("\u20ac" * (MAX_SKILL_FILE_SIZE // 3))
+
+    def test_get_skills_batch(self, client):
+        """Batch reads return accessible skills with content, keyed by ID."""
+        from unittest.mock import patch
+
+        from webapp.blueprints import skills as skills_module
+
+        user = MagicMock(id="user-1", team_id="team-1")
+        own_id = "12345678-1234-5678-1234-567812345678"
+        other_id = "87654321-4321-8765-4321-876543218765"
+        shared_id = "11111111-2222-3333-4444-555555555555"
+        other_shared_id = "99999999-8888-7777-6666-555555555555"
+        own = MagicMock(id=own_id, scope="private", user_id="user-1")
+        own.to_dict.return_value = {"id": own_id}
+        other = MagicMock(id=other_id, scope="private", user_id="user-2")
+        shared = MagicMock(id=shared_id, scope="shared", team_id="team-1")
+        shared.to_dict.return_value = {"id": shared_id}
+        other_shared = MagicMock(id=other_shared_id, scope="shared", team_id="team-2")
+        service = MagicMock()
+        service.get_skills.return_value = [own, other, shared, other_shared]
+        service.get_skills_content.side_effect = lambda skills: {
+            skill.id: VALID_SKILL_CONTENT for skill in skills
+        }
+
+        with (
+            patch.object(skills_module, "get_current_user", return_value=user),
+            patch.object(
+                skills_module, "get_custom_skill_service", return_value=service
+            ),
+        ):
+            ids = [own_id, other_id, own_id, shared_id, other_shared_id]
+            response = client.post("/skills/api/skills/batch", json={"ids": ids})
+            assert response.status_code == 200
+            skills = response.get_json()["skills"]
+            # Other users' private skills and other teams' shared skills are hidden
+            assert list(skills) == [own_id, shared_id]
+            assert skills[own_id]["content"] == VALID_SKILL_CONTENT
+            service.get_skills.assert_called_once_with(
+                [own_id, other_id, shared_id, other_shared_id]
+            )
+            service.get_skills_content.assert_called_once_with([own, shared])
+
+            bad = client.post("/skills/api/skills/batch", json={"ids": ["nope"]})
+            assert bad.status_code == 400
+
+            too_many = client.post(
+                "/skills/api/skills/batch",
+                json={"ids": [own_id] * (skills_module.MAX_BATCH_SKILL_IDS + 1)},
+            )
+            assert too_many.status_code == 400
+
+    def test_validate_uuid(self):
+        """Only canonical hyphenated UUIDs are accepted as skill IDs."""
+        import uuid
+
+        from webapp.blueprints.skills import validate_uuid
+
+        value = str(uuid.uuid4())
+        assert validate_uuid(value)
+        assert validate_uuid(value.upper())
+        assert not validate_uuid(value.replace("-", ""))
+        assert not validate_uuid(value + "\n")
+        assert not validate_uuid("not-a-uuid")
+        assert not validate_uuid(None)
+
+    def test_generate_uuid_is_random_v4(self):
+        """Primary keys are canonical version 4 UUIDs that skill routes accept."""
+        import uuid
+
+        from webapp.blueprints.skills import validate_uuid
+        from webapp.models import generate_uuid
+
+        values = {generate_uuid() for _ in range(1000)}
+        assert len(values) == 1000
+        for value in values:
+            parsed = uuid.UUID(value)
+            assert str(parsed) == value
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert validate_uuid(value)
+
+    def test_upload_rejects_oversized_file(self, client):
+        """Oversized uploads are rejected without creating a skill."""
+        import io
+        from unittest.mock import patch
+
+        from webapp.blueprints import skills as skills_module
+
+        user = MagicMock(id="user-1", team_id="team-1")
+        service = MagicMock()
+        big = io.BytesIO(b"a" * (skills_module.MAX_SKILL_FILE_SIZE + 1))
+
+        with (
+            patch.object(skills_module, "get_current_user", return_value=user),
+            patch.object(
+                skills_module, "get_custom_skill_service", return_value=service
+            ),
+        ):
+            response = client.post(
+                "/skills/api/skills/upload",
+                data={"file": (big, "SKILL.md")},
+                content_type="multipart/form-data",
+            )
+
+        assert response.status_code == 400
+        assert "too large" in response.get_json()["error"]
+        service.create_skill.assert_not_called()
+
     def test_validate_skill_endpoint(self, client):
         """Test skill validation endpoint."""
         response = client.post(
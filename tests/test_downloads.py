@@ -0,0 +1,26 @@
+"""Tests for shared download helpers."""
+
+from webapp.blueprints._downloads import attachment_disposition
+
+
+class TestAttachmentDisposition:
+    """Tests for attachment_disposition."""
+
+    def test_ascii_name(self):
+        assert (
+            attachment_disposition("compliance-summary.pdf")
+            == "attachment; filename=compliance-summary.pdf"
+        )
+
+    def test_quotes_names_with_spaces(self):
+        assert (
+            attachment_disposition("stp summary.xlsx")
+            == 'attachment; filename="stp summary.xlsx"'
+        )
+
+    def test_non_ascii_name_gets_rfc5987_form(self):
+        value = attachment_disposition("café report.pdf")
+        assert value == (
+            'attachment; filename="cafe report.pdf"; '
+            "filename*=UTF-8''caf%C3%A9%20report.pdf"
+        )
@@ -0,0 +1,127 @@
+"""Tests for the orjson-backed JSON provider."""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from flask import Flask, jsonify
+
+from webapp.json_provider import (
+    ORJSONProvider,
+    dumps_column_json,
+    init_column_json,
+    init_json_provider,
+)
+
+
+def _provider_app() -> Flask:
+    app = Flask(__name__)
+    init_json_provider(app)
+    return app
+
+
+class TestORJSONProvider:
+    """Tests for ORJSONProvider."""
+
+    def test_installed_on_app(self):
+        assert isinstance(_provider_app().json, ORJSONProvider)
+
+    def test_matches_default_provider_output(self):
+        app = _provider_app()
+        payload = {
+            "b": 1,
+            "a": [1.5, None, True],
+            "when": datetime(2026, 1, 2, 3, 4, 5),
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+            "amount": Decimal("10.50"),
+        }
+        fast = json.loads(app.json.dumps(payload))
+        expected = json.loads(Flask(__name__).json.dumps(payload))
+        assert fast == expected
+        assert fast["when"] == "Fri, 02 Jan 2026 03:04:05 GMT"
+
+    def test_sorts_keys_by_default(self):
+        app = _provider_app()
+        assert app.json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+    def test_respects_sort_keys_flag(self):
+        app = _provider_app()
+        app.json.sort_keys = False
+        assert app.json.dumps({"b": 1, "a": 2}) == '{"b":1,"a":2}'
+
+    def test_non_string_keys(self):
+        app = _provider_app()
+        app.json.sort_keys = False
+        assert app.json.dumps({3: "x"}) == '{"3":"x"}'
+
+    def test_falls_back_for_oversized_integers(self):
+        app = _provider_app()
+        assert app.json.dumps({"n": 2**70}) == json.dumps({"n": 2**70})
+
+    def test_jsonify_response(self):
+        app = _provider_app()
+        with app.test_request_context():
+            resp = jsonify({"success": True, "items": [1, 2]})
+        assert resp.mimetype == "application/json"
+        assert resp.get_json() == {"success": True, "items": [1, 2]}
+
+    def test_loads(self):
+        app = _provider_app()
+        assert app.json.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_config_disables_sorting_and_indent(self):
+        app = Flask(__name__)
+        app.config.update(DEBUG=True, JSON_SORT_KEYS=False, JSON_COMPACT=True)
+        init_json_provider(app)
+        with app.test_request_context():
+            resp = jsonify({"b": 1, "a": 2})
+        assert resp.get_data() == b'{"b":1,"a":2}\n'
+
+
+class TestColumnJSON:
+    """Tests for the orjson JSON column codec."""
+
+    def test_dumps_matches_stdlib(self):
+        value = {"items": [{"done": True, "note": "ok"}], 3: None}
+        assert json.loads(dumps_column_json(value)) == json.loads(json.dumps(value))
+        assert dumps_column_json({"n": 2**70}) == json.dumps({"n": 2**70})
+
+    def test_init_keeps_existing_engine_options(self):
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "pool_pre_ping": True,
+            "json_deserializer": json.loads,
+        }
+        init_column_json(app)
+        options = app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+        assert options["pool_pre_ping"] is True
+        assert options["json_serializer"] is dumps_column_json
+        assert options["json_deserializer"] is json.loads
+
+    def test_json_columns_round_trip(self):
+        from webapp.app import create_app
+        from webapp.config import TestingConfig
+        from webapp.models import Conversation, Message, db
+
+        app = create_app(TestingConfig)
+        with app.app_context():
+            db.create_all()
+            assert db.engine.dialect._json_serializer is dumps_column_json
+            conv = Conversation(user_id="user-123")
+            db.session.add(conv)
+            db.session.flush()
+            msg = Message(
+                conversation_id=conv.id,
+                role="assistant",
+                content="Hi",
+                skills_used=["gst", {"name": "bas"}],
+            )
+            db.session.add(msg)
+            db.session.commit()
+            db.session.expire_all()
+            assert db.session.get(Message, msg.id).skills_used == [
+                "gst",
+                {"name": "bas"},
+            ]
+            db.drop_all()
@@ -371,6 +371,45 @@ class TestLeaveFlags:
         assert result[0]["balance_remaining"] == 64.0  # 80 - 16
         assert result[0]["low_balance_warning"] is False  # 64 >= 40
 
+    @patch("webapp.app_services.payroll_review_service.get_xero_session")
+    def test_get_employee_leave_balances(self, mock_session):
+        """Should fetch every employee, keeping failures as empty balances."""
+        import requests
+
+        from webapp.app_services.payroll_review_service import (
+            get_employee_leave_balances,
+        )
+
+        def fake_get(url, **kwargs):
+            emp_id = url.rsplit("/", 1)[1]
+            if emp_id == "emp2":
+                raise requests.ConnectionError("boom")
+            response = MagicMock()
+            response.json.return_value = {
+                "Employees": [
+                    {
+                        "LeaveBalances": [
+                            {
+                                "LeaveTypeID": "leave1",
+                                "LeaveName": "Annual Leave",
+                                "NumberOfUnits": f"{emp_id[-1]}0",
+                            }
+                        ]
+                    }
+                ]
+            }
+            return response
+
+        mock_session.return_value.get.side_effect = fake_get
+
+        result = get_employee_leave_balances("tok", "t-1", ["emp1", "emp2", "emp3"])
+
+        assert list(result) == ["emp1", "emp2", "emp3"]
+        assert result["emp1"][0]["balance"] == 10.0
+        assert result["emp2"] == []
+        assert result["emp3"][0]["balance"] == 30.0
+        assert get_employee_leave_balances("tok", "t-1", []) == {}
+
 
 # =============================================================================
 # Employee Excel Parsing Tests
@@ -822,3 +861,38 @@ class TestHelperFunctions:
         # Invalid
         result = _parse_date_string("invalid")
         assert result is None
+
+    def test_generate_employee_template_layout(self):
+        """Generated template should have headers, widths and state validation."""
+        import openpyxl
+
+        from webapp.blueprints.payroll_review import (
+            _TEMPLATE_COLUMNS,
+            _generate_employee_template,
+        )
+
+        wb = openpyxl.load_workbook(_generate_employee_template())
+        ws = wb["Employees"]
+
+        headers = [cell.value for cell in ws[1]]
+        assert headers == [header for header, _ in _TEMPLATE_COLUMNS]
+        assert ws.column_dimensions["A"].width == 15
+        assert ws.column_dimensions["H"].width == 8
+        assert ws["A1"].font.bold is True
+        assert ws["A2"].value == "John"
+
+        validations = ws.data_validations.dataValidation
+        assert len(validations) == 1
+        assert str(validations[0].sqref) == "H2:H100"
+
+    def test_generate_employee_template_reuses_cached_bytes(self):
+        """Template should only be built once and returned as fresh streams."""
+        from webapp.blueprints import payroll_review
+
+        first = payroll_review._generate_employee_template()
+        with patch.object(payroll_review, "_build_employee_template") as build:
+            second = payroll_review._generate_employee_template()
+
+        build.assert_not_called()
+        assert first is not second
+        assert first.read() == second.read()
@@ -0,0 +1,139 @@
+"""Tests for payroll tax blueprint endpoints."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    from webapp.blueprints.payroll_tax import _result_cache
+
+    _result_cache.clear()
+    yield
+    _result_cache.clear()
+
+
+class TestPayrollTaxRates:
+    """Tests for the static state rates endpoint."""
+
+    def test_rates_returns_all_states(self, client):
+        from webapp.app_services.payroll_tax_service import get_all_state_rates
+
+        res = client.get("/payroll-tax/api/rates")
+        assert res.status_code == 200
+        data = res.get_json()
+        assert data["success"] is True
+        assert data["rates"] == get_all_state_rates()
+        assert res.headers["ETag"]
+        assert "max-age=3600" in res.headers["Cache-Control"]
+
+    def test_rates_not_modified_for_matching_etag(self, client):
+        etag = client.get("/payroll-tax/api/rates").headers["ETag"]
+
+        res = client.get("/payroll-tax/api/rates", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.data == b""
+
+    def test_rates_full_response_for_stale_etag(self, client):
+        res = client.get("/payroll-tax/api/rates", headers={"If-None-Match": '"stale"'})
+        assert res.status_code == 200
+        assert res.get_json()["success"] is True
+
+
+class TestPayrollTaxDownload:
+    """Tests for the Excel download endpoint."""
+
+    def test_download_streams_workbook(self, client):
+        import io
+
+        import openpyxl
+
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        result = {
+            "success": True,
+            "period": {"from_date": "2026-01-01", "to_date": "2026-01-31"},
+            "data": {
+                "state": "NSW",
+                "wages": {"gross_wages": 1000.0, "taxable_wages": 1000.0},
+                "calculation": {"tax_payable": 54.5},
+            },
+        }
+        with patch(
+            "webapp.blueprints.payroll_tax.calculate_payroll_tax", return_value=result
+        ):
+            res = client.get(
+                "/payroll-tax/api/download"
+                "?from_date=2026-01-01&to_date=2026-01-31&state=NSW"
+            )
+
+        assert res.status_code == 200
+        assert res.mimetype == (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+        assert "payroll_tax_NSW_2026-01-01_to_2026-01-31.xlsx" in res.headers[
+            "Content-Disposition"
+        ]
+        ws = openpyxl.load_workbook(io.BytesIO(res.data)).active
+        assert ws["A1"].value == "Payroll Tax Calculation"
+
+    def test_download_reuses_recent_generate_result(self, client):
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        result = {
+            "success": True,
+            "period": {"from_date": "2026-01-01", "to_date": "2026-01-31"},
+            "data": {"state": "NSW"},
+        }
+        query = "?from_date=2026-01-01&to_date=2026-01-31&state=NSW"
+        with patch(
+            "webapp.blueprints.payroll_tax.calculate_payroll_tax", return_value=result
+        ) as calculate:
+            assert client.get("/payroll-tax/api/generate" + query).status_code == 200
+            assert client.get("/payroll-tax/api/download" + query).status_code == 200
+            assert (
+                client.get(
+                    "/payroll-tax/api/download"
+                    "?from_date=2026-01-01&to_date=2026-01-31&state=VIC"
+                ).status_code
+                == 200
+            )
+
+        assert calculate.call_count == 2
+
+    def test_failed_results_are_not_cached(self, client):
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        query = "?from_date=2026-01-01&to_date=2026-01-31&state=NSW"
+        with patch(
+            "webapp.blueprints.payroll_tax.calculate_payroll_tax",
+            return_value={"success": False, "error": "Xero error"},
+        ) as calculate:
+            client.get("/payroll-tax/api/generate" + query)
+            client.get("/payroll-tax/api/generate" + query)
+
+        assert calculate.call_count == 2
+
+
+class TestPayrollTaxErrors:
+    """Tests for the fixed validation error responses."""
+
+    def test_generate_without_xero_connection(self, client):
+        res = client.get("/payroll-tax/api/generate")
+        assert res.status_code == 400
+        assert res.mimetype == "application/json"
+        assert res.get_json() == {"error": "Xero not connected"}
+
+    def test_generate_without_state(self, client):
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        res = client.get(
+            "/payroll-tax/api/generate?from_date=2026-01-01&to_date=2026-01-31"
+        )
+        assert res.status_code == 400
+        assert res.get_json() == {"error": "state is required"}
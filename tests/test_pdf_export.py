@@ -149,6 +149,27 @@ class TestPdfExportService:
         assert pdf_bytes is not None
         assert len(pdf_bytes) > 0
 
+    def test_export_bulk_conversations_batches_message_loads(
+        self, app, db, count_queries
+    ):
+        """Messages for every conversation are loaded with one extra query."""
+        from webapp.models import Conversation, Message
+        from webapp.services.pdf_export import export_bulk_conversations
+
+        conversation_ids = []
+        for i in range(3):
+            conv = Conversation(user_id="test-user-123", title=f"Conv {i}")
+            db.session.add(conv)
+            db.session.flush()
+            db.session.add(Message(conversation_id=conv.id, role="user", content="Hi"))
+            conversation_ids.append(conv.id)
+        db.session.commit()
+
+        with count_queries() as statements:
+            export_bulk_conversations(conversation_ids)
+
+        assert len(statements) == 2
+
 
 class TestExportBlueprint:
     """Tests for the export API endpoints."""
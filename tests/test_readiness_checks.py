@@ -1,6 +1,7 @@
 """Tests for readiness checks service and blueprint."""
 
 from datetime import date
+from unittest.mock import patch
 
 import pytest
 
@@ -268,6 +269,56 @@ class TestChecklistProgress:
         history = get_checklist_history(team.id)
         assert len(history) == 2
 
+    def test_summary_matches_full_checklist(self, app, db):
+        """Test the status summary agrees with the full checklist counts."""
+        from webapp.models import Team
+
+        team = Team(name="Test Team", owner_id="owner-1")
+        db.session.add(team)
+        db.session.commit()
+
+        from webapp.services.readiness_checks import (
+            get_current_checklist,
+            get_current_checklist_summary,
+            save_checklist_progress,
+        )
+
+        save_checklist_progress(
+            team_id=team.id,
+            user_id="user-1",
+            checklist_type="month_end",
+            period="2026-01",
+            items=[
+                {"key": "bank_rec", "completed": True},
+                {"key": "gst_rec", "completed": True},
+                {"key": "not_a_template_key", "completed": True},
+            ],
+            tenant_id="t-1",
+        )
+
+        for tenant_id in ("t-1", None):
+            ref = date(2026, 1, 15)
+            full = get_current_checklist(team.id, reference_date=ref, tenant_id=tenant_id)
+            summary = get_current_checklist_summary(
+                team.id, reference_date=ref, tenant_id=tenant_id
+            )
+            assert summary == {
+                key: full[key]
+                for key in (
+                    "checklist_type",
+                    "period",
+                    "total",
+                    "completed",
+                    "percentage",
+                    "is_complete",
+                )
+            }
+        assert summary["completed"] == 0
+
+        eofy = get_current_checklist_summary(team.id, reference_date=date(2026, 6, 1))
+        assert eofy["checklist_type"] == "eofy"
+        assert eofy["period"] == "2026-06"
+
 
 class TestPerClientChecklists:
     """Tests for per-tenant (per-client) checklist isolation."""
@@ -579,6 +630,44 @@ class TestChecklistComments:
         assert len(grouped["bank_rec"]) == 2
         assert len(grouped["gst_rec"]) == 1
 
+    def test_get_comments_query_count_is_constant(self, app, db, count_queries):
+        """Authors and assignees are eager-loaded rather than fetched per comment."""
+        from webapp.models import User as UserModel
+        from webapp.services.readiness_checks import (
+            add_checklist_comment,
+            get_checklist_comments,
+        )
+
+        team, user, progress = self._create_progress(db)
+        for i in range(3):
+            teammate = UserModel(
+                email=f"mate{i}@test.com",
+                password_hash="fakehash",
+                name=f"Mate {i}",
+                team_id=team.id,
+            )
+            db.session.add(teammate)
+            db.session.flush()
+            add_checklist_comment(
+                checklist_progress_id=progress.id,
+                item_key="bank_rec",
+                user_id=teammate.id,
+                content=f"Note {i}",
+                assigned_to=user.id,
+            )
+        progress_id = progress.id
+        db.session.expire_all()
+
+        with count_queries() as statements:
+            grouped = get_checklist_comments(progress_id)
+
+        assert [c["author_name"] for c in grouped["bank_rec"]] == [
+            "Mate 0",
+            "Mate 1",
+            "Mate 2",
+        ]
+        assert len(statements) == 3
+
     def test_comment_with_assignment(self, app, db):
         """Test adding a comment with teammate assignment."""
         team, user, progress = self._create_progress(db)
@@ -627,6 +716,106 @@ class TestChecklistComments:
         assert "author_name" in d
         assert "created_at" in d
 
+    def test_team_scoped_comment_is_one_statement(self, app, db, count_queries):
+        """The team-scoped insert returns the new row without re-selecting it."""
+        team, user, progress = self._create_progress(db)
+        progress_id = progress.id
+
+        from webapp.services.readiness_checks import add_checklist_comment
+
+        with count_queries("checklist_comments") as statements:
+            comment = add_checklist_comment(
+                checklist_progress_id=progress_id,
+                item_key="bank_rec",
+                user_id=user.id,
+                content="Done",
+                team_id=team.id,
+            )
+
+        assert len(statements) == 1
+        assert statements[0].startswith("INSERT")
+        assert comment.content == "Done"
+
+    def test_team_scoped_comment_with_assignment(self, app, db):
+        """Test the team-scoped insert path stores the comment and assignee."""
+        team, user, progress = self._create_progress(db)
+        from webapp.models import User as UserModel
+
+        teammate = UserModel(
+            email="teammate@test.com",
+            password_hash="fakehash",
+            name="Teammate",
+            team_id=team.id,
+        )
+        db.session.add(teammate)
+        db.session.commit()
+
+        from webapp.services.readiness_checks import add_checklist_comment
+
+        comment = add_checklist_comment(
+            checklist_progress_id=progress.id,
+            item_key="bank_rec",
+            user_id=user.id,
+            content="<b>Please handle</b>",
+            assigned_to=teammate.id,
+            team_id=team.id,
+        )
+        d = comment.to_dict()
+        assert d["content"] == "&lt;b&gt;Please handle&lt;/b&gt;"
+        assert d["assignee_name"] == "Teammate"
+        assert d["author_name"] == "Commenter"
+        assert d["created_at"] is not None
+
+    def test_team_scoped_comment_rejects_other_team(self, app, db):
+        """Test a checklist owned by another team is reported as not found."""
+        _, user, progress = self._create_progress(db)
+
+        from webapp.models import ChecklistComment, Team
+        from webapp.services.readiness_checks import (
+            ChecklistNotFoundError,
+            add_checklist_comment,
+        )
+
+        # A rejected insert must not roll back the caller's pending work
+        pending = Team(name="Pending Team", owner_id="owner-2")
+        db.session.add(pending)
+
+        with pytest.raises(ChecklistNotFoundError):
+            add_checklist_comment(
+                checklist_progress_id=progress.id,
+                item_key="bank_rec",
+                user_id=user.id,
+                content="Test",
+                team_id="other-team",
+            )
+        assert ChecklistComment.query.count() == 0
+        assert pending in db.session
+
+    def test_team_scoped_comment_rejects_outside_assignee(self, app, db):
+        """Test assigning to a user outside the team is rejected."""
+        team, user, progress = self._create_progress(db)
+        from webapp.models import User as UserModel
+
+        outsider = UserModel(
+            email="outsider@test.com",
+            password_hash="fakehash",
+            name="Outsider",
+        )
+        db.session.add(outsider)
+        db.session.commit()
+
+        from webapp.services.readiness_checks import add_checklist_comment
+
+        with pytest.raises(ValueError, match="not a team member"):
+            add_checklist_comment(
+                checklist_progress_id=progress.id,
+                item_key="bank_rec",
+                user_id=user.id,
+                content="Test",
+                assigned_to=outsider.id,
+                team_id=team.id,
+            )
+
 
 class TestReadinessBlueprint:
     """Tests for readiness API endpoints."""
@@ -685,6 +874,31 @@ class TestReadinessBlueprint:
         )
         assert res.status_code == 400
 
+    def test_update_rejects_malformed_items(self, client, db):
+        """Test malformed items are rejected before touching the database."""
+        _register(client)
+        bad_payloads = [
+            ["bank_rec"],
+            [{"completed": True}],
+            [{"key": 5, "completed": True}],
+            [{"key": "bank_rec", "completed": "yes"}],
+        ]
+        for items in bad_payloads:
+            with patch(
+                "webapp.services.readiness_checks.save_checklist_progress"
+            ) as save:
+                res = client.put(
+                    "/api/readiness/checklist",
+                    json={
+                        "checklist_type": "month_end",
+                        "period": "2026-01",
+                        "items": items,
+                    },
+                )
+            assert res.status_code == 400, items
+            assert "error" in res.get_json()
+            save.assert_not_called()
+
     def test_get_history(self, client, db):
         """Test getting checklist history."""
         _register(client)
@@ -699,6 +913,15 @@ class TestReadinessBlueprint:
         assert res.status_code == 400
         assert "error" in res.get_json()
 
+    def test_get_history_limit_bounds(self, client, db):
+        """Test history limit parsing for valid, negative and superscript input."""
+        _register(client)
+        assert client.get("/api/readiness/history?limit=5").status_code == 200
+        assert client.get("/api/readiness/history?limit=500").status_code == 200
+        assert client.get("/api/readiness/history?limit=-1").status_code == 400
+        assert client.get("/api/readiness/history?limit=0").status_code == 400
+        assert client.get("/api/readiness/history?limit=%C2%B2").status_code == 400
+
     def test_get_status(self, client, db):
         """Test getting quick status."""
         _register(client)
@@ -728,6 +951,7 @@ class TestReadinessBlueprint:
         data = res.get_json()
         assert "members" in data
         assert len(data["members"]) >= 1  # At least the registered user
+        assert set(data["members"][0]) == {"user_id", "full_name", "email", "role"}
 
     def test_comments_post_requires_progress_id(self, client, db):
         """Test that POST comment requires checklist_progress_id."""
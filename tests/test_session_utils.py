@@ -0,0 +1,25 @@
+"""Tests for shared blueprint session helpers."""
+
+from flask import session
+
+from webapp.blueprints._session_utils import get_xero_credentials
+
+
+class TestGetXeroCredentials:
+    """Tests for get_xero_credentials."""
+
+    def test_reads_active_connection(self, app):
+        with app.test_request_context():
+            session["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+            assert get_xero_credentials() == ("tok", "t-1")
+
+    def test_falls_back_to_legacy_keys(self, app):
+        with app.test_request_context():
+            session["xero_connection"] = None
+            session["xero_access_token"] = "legacy-tok"
+            session["xero_tenant_id"] = "legacy-tenant"
+            assert get_xero_credentials() == ("legacy-tok", "legacy-tenant")
+
+    def test_missing_credentials(self, app):
+        with app.test_request_context():
+            assert get_xero_credentials() == (None, None)
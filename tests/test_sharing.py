@@ -72,6 +72,49 @@ class TestAccountantInvite:
         assert acct is not None
         assert acct.role == "accountant"
 
+    def test_invite_new_accountant_skips_duplicate_check(self, client, count_queries):
+        """A brand-new accountant cannot have a share, so none is looked up."""
+        _register_user(client, "owner@example.com", "Owner")
+        with count_queries("accountant_shares") as statements:
+            res = client.post(
+                "/api/sharing/invite",
+                json={"email": "new-acct@example.com", "name": "New Accountant"},
+            )
+
+        assert res.status_code == 201
+        assert not any(
+            "accountant_shares.team_id = " in statement for statement in statements
+        )
+
+    def test_new_accountant_password_is_unusable(self, client, db):
+        """New accountants share one cached placeholder hash nobody can log in with."""
+        from unittest.mock import patch
+
+        from webapp.blueprints import sharing
+
+        _register_user(client, "owner@example.com", "Owner")
+        sharing._unusable_password_hash = None
+        with patch.object(
+            sharing,
+            "generate_password_hash",
+            wraps=sharing.generate_password_hash,
+        ) as hash_password:
+            for i in range(2):
+                res = client.post(
+                    "/api/sharing/invite",
+                    json={"email": f"acct{i}@example.com", "name": f"Acct {i}"},
+                )
+                assert res.status_code == 201
+        assert hash_password.call_count == 1
+        assert sharing._unusable_password_hash.startswith("$2b$04$")
+        client.post("/api/auth/logout")
+
+        res = client.post(
+            "/api/auth/login",
+            json={"email": "acct0@example.com", "password": "securepass123"},
+        )
+        assert res.status_code == 401
+
     def test_invite_existing_user(self, client, db):
         """Test inviting an existing user."""
         _register_user(client, "owner@example.com", "Owner")
@@ -149,6 +192,52 @@ class TestShareListing:
         data = res.get_json()
         assert len(data["shares"]) == 2
 
+    def test_list_invites_excludes_expired(self, client, db):
+        """Expired shares are filtered out of the team listing."""
+        from datetime import timedelta
+
+        from webapp.models import AccountantShare
+        from webapp.time_utils import utcnow
+
+        _register_user(client, "owner@example.com", "Owner")
+        for i in range(2):
+            client.post(
+                "/api/sharing/invite",
+                json={"email": f"acct{i}@example.com", "name": f"Acct {i}"},
+            )
+        expired = AccountantShare.query.all()[0]
+        expired.expires_at = utcnow() - timedelta(minutes=1)
+        db.session.commit()
+
+        res = client.get("/api/sharing/invites")
+        shares = res.get_json()["shares"]
+        assert len(shares) == 1
+        assert shares[0]["id"] != expired.id
+        assert all(s["is_expired"] is False for s in shares)
+
+    def test_list_invites_query_count_is_constant(self, client, db, count_queries):
+        """Accountants are eager-loaded rather than fetched per share."""
+        _register_user(client, "owner@example.com", "Owner")
+        for i in range(3):
+            client.post(
+                "/api/sharing/invite",
+                json={"email": f"acct{i}@example.com", "name": f"Acct {i}"},
+            )
+        db.session.expire_all()
+
+        with count_queries("accountant_shares", "users") as statements:
+            res = client.get("/api/sharing/invites")
+
+        assert res.status_code == 200
+        shares = res.get_json()["shares"]
+        assert sorted(s["accountant_email"] for s in shares) == [
+            "acct0@example.com",
+            "acct1@example.com",
+            "acct2@example.com",
+        ]
+        # current_user refresh, the share query and one accountant query
+        assert len(statements) <= 3
+
     def test_shared_with_me(self, client, db):
         """Test accountant seeing shared teams."""
         _register_user(client, "owner@example.com", "Owner")
@@ -169,6 +258,47 @@ class TestShareListing:
         # Will be 401 since random password, but endpoint should exist
         assert res.status_code in (200, 401)
 
+    def test_shared_with_me_lists_active_teams(self, client, db):
+        """Accountant sees each shared team once, without expired shares."""
+        from datetime import timedelta
+
+        from webapp.models import AccountantShare, Team, User
+        from webapp.time_utils import utcnow
+
+        _register_user(client, "acct@example.com", "Accountant")
+        client.post("/api/auth/logout")
+        _register_user(client, "owner@example.com", "Owner")
+        client.post(
+            "/api/sharing/invite",
+            json={"email": "acct@example.com", "name": "Accountant"},
+        )
+        client.post("/api/auth/logout")
+
+        owner = User.query.filter_by(email="owner@example.com").first()
+        accountant = User.query.filter_by(email="acct@example.com").first()
+        expired_team = Team(name="Expired Co", owner_id=owner.id)
+        db.session.add(expired_team)
+        db.session.flush()
+        db.session.add(
+            AccountantShare(
+                team_id=expired_team.id,
+                accountant_user_id=accountant.id,
+                shared_by_user_id=owner.id,
+                expires_at=utcnow() - timedelta(days=1),
+            )
+        )
+        db.session.commit()
+
+        client.post(
+            "/api/auth/login",
+            json={"email": "acct@example.com", "password": "securepass123"},
+        )
+        res = client.get("/api/sharing/shared-with-me")
+        assert res.status_code == 200
+        teams = res.get_json()["shared_teams"]
+        assert [t["team"]["id"] for t in teams] == [owner.team_id]
+        assert teams[0]["access_level"] == "read_only"
+
 
 class TestShareRevocation:
     """Tests for revoking shares."""
@@ -198,6 +328,23 @@ class TestShareRevocation:
         res = client.delete("/api/sharing/invites/nonexistent-id")
         assert res.status_code == 404
 
+    def test_revoke_other_team_share_denied(self, client, db):
+        """Owners cannot revoke shares belonging to another team."""
+        from webapp.models import AccountantShare
+
+        _register_user(client, "owner@example.com", "Owner")
+        res = client.post(
+            "/api/sharing/invite",
+            json={"email": "acct@example.com", "name": "Accountant"},
+        )
+        share_id = res.get_json()["share"]["id"]
+        client.post("/api/auth/logout")
+
+        _register_user(client, "other@example.com", "Other Owner")
+        res = client.delete(f"/api/sharing/invites/{share_id}")
+        assert res.status_code == 403
+        assert db.session.get(AccountantShare, share_id) is not None
+
 
 class TestSharingPages:
     """Tests for sharing pages."""
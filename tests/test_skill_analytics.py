@@ -65,6 +65,29 @@ class TestSkillAnalyticsService:
 
             assert usage.team_id == "team-abc"
 
+    def test_log_usages_inserts_all_rows(self, app, service):
+        """Test logging several usages in one batch."""
+        with app.app_context():
+            count = service.log_usages(
+                [
+                    {"skill_name": "tax_agent", "skill_source": "public"},
+                    {
+                        "skill_name": "accountant",
+                        "skill_source": "private",
+                        "user_id": "user-123",
+                        "confidence": 0.5,
+                    },
+                ]
+            )
+
+            assert count == 2
+            rows = SkillUsage.query.order_by(SkillUsage.skill_name).all()
+            assert [r.skill_name for r in rows] == ["accountant", "tax_agent"]
+            assert rows[0].confidence == 0.5
+            assert all(r.id and r.created_at for r in rows)
+            assert rows[0].id != rows[1].id
+            assert service.log_usages([]) == 0
+
     def test_get_top_skills(self, app, service):
         """Test getting top skills."""
         with app.app_context():
@@ -24,6 +24,21 @@ def test_startup_config_audit_flags_production_defaults(monkeypatch):
     assert any("SQLALCHEMY_DATABASE_URI" in error for error in result["errors"])
 
 
+def test_startup_config_audit_flags_debug_in_production(monkeypatch):
+    app = Flask(__name__)
+    app.config["DEBUG"] = True
+    app.config["PROPAGATE_EXCEPTIONS"] = True
+
+    monkeypatch.setenv("FLASK_ENV", "production")
+    result = run_startup_config_audit(app)
+    assert any("DEBUG" in error for error in result["errors"])
+    assert any("PROPAGATE_EXCEPTIONS" in error for error in result["errors"])
+
+    monkeypatch.setenv("FLASK_ENV", "development")
+    result = run_startup_config_audit(app)
+    assert not any("DEBUG" in error for error in result["errors"])
+
+
 def test_health_ready_endpoint_reports_ready(client):
     response = client.get("/health/ready")
     assert response.status_code == 200
@@ -0,0 +1,266 @@
+"""Tests for STP tracker blueprint endpoints."""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_cache():
+    from webapp.blueprints.stp_tracker import _result_cache
+
+    _result_cache.clear()
+    yield
+    _result_cache.clear()
+
+
+class TestStpTrackerDownload:
+    """Tests for the Excel download endpoint."""
+
+    def test_download_streams_workbook(self, client):
+        import io
+
+        import openpyxl
+
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        result = {
+            "success": True,
+            "financial_year": 2025,
+            "data": {
+                "ytd_totals": {"gross_wages": 1000.5, "pay_run_count": 4},
+                "quarters": [
+                    {
+                        "quarter": "Q1",
+                        "period": "Jul - Sep 2024",
+                        "gross_wages": 1000.5,
+                        "payg_withheld": 200.0,
+                        "super": 115.06,
+                        "pay_run_count": 4,
+                    }
+                ],
+            },
+        }
+        with patch(
+            "webapp.blueprints.stp_tracker.generate_stp_summary", return_value=result
+        ):
+            res = client.get("/stp-tracker/api/download?financial_year=2025")
+
+        assert res.status_code == 200
+        assert res.mimetype == (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+        assert "stp_summary_fy2024_2025.xlsx" in res.headers["Content-Disposition"]
+
+        ws = openpyxl.load_workbook(io.BytesIO(res.data)).active
+        assert ws.title == "STP Summary"
+        assert ws["A1"].value == "STP Submission Tracker"
+        assert ws["A1"].font.b
+        assert ws["B5"].value == 1000.5
+        assert ws["B5"].number_format == '"$"#,##0.00'
+        assert ws["A12"].value == "Quarter"
+        assert ws["A12"].fill.fgColor.rgb == "000066CC"
+        assert [c.value for c in ws[13]] == [
+            "Q1",
+            "Jul - Sep 2024",
+            1000.5,
+            200.0,
+            115.06,
+            4,
+        ]
+        assert ws["A16"].value.startswith("Note:")
+        assert {str(r) for r in ws.merged_cells.ranges} == {"A1:F1", "A16:F16"}
+        assert ws.column_dimensions["A"].width == 18
+
+
+    def test_download_reuses_recent_generate_result(self, client):
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        result = {"success": True, "financial_year": 2025, "data": {}}
+        with patch(
+            "webapp.blueprints.stp_tracker.generate_stp_summary", return_value=result
+        ) as generate:
+            query = "?financial_year=2025"
+            assert client.get("/stp-tracker/api/generate" + query).status_code == 200
+            assert client.get("/stp-tracker/api/download" + query).status_code == 200
+            assert (
+                client.get("/stp-tracker/api/download?financial_year=2024").status_code
+                == 200
+            )
+
+        assert generate.call_count == 2
+
+    def test_failed_results_are_not_cached(self, client):
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        with patch(
+            "webapp.blueprints.stp_tracker.generate_stp_summary",
+            return_value={"success": False, "error": "Xero error"},
+        ) as generate:
+            client.get("/stp-tracker/api/generate?financial_year=2025")
+            client.get("/stp-tracker/api/generate?financial_year=2025")
+
+        assert generate.call_count == 2
+
+
+class TestStpTrackerJobs:
+    """Tests for background STP generation."""
+
+    def test_job_result_is_polled_and_downloaded(self, client):
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        result = {"success": True, "financial_year": "FY2024-25", "data": {}}
+        with patch(
+            "webapp.blueprints.stp_tracker.generate_stp_summary", return_value=result
+        ) as generate:
+            res = client.post("/stp-tracker/api/jobs?financial_year=2025")
+            assert res.status_code == 202
+            job_id = res.get_json()["job_id"]
+
+            job = client.get(f"/api/jobs/{job_id}").get_json()
+            assert job["status"] == "succeeded"
+            assert job["result"] == result
+
+            _result_cache_clear()
+            res = client.get(
+                f"/stp-tracker/api/download?financial_year=2025&job_id={job_id}"
+            )
+
+        assert res.status_code == 200
+        generate.assert_called_once_with("tok", "t-1", 2025)
+
+    def test_download_ignores_job_for_other_year(self, client):
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        result = {"success": True, "financial_year": "FY2024-25", "data": {}}
+        with patch(
+            "webapp.blueprints.stp_tracker.generate_stp_summary", return_value=result
+        ) as generate:
+            res = client.post("/stp-tracker/api/jobs?financial_year=2025")
+            job_id = res.get_json()["job_id"]
+            client.get(f"/stp-tracker/api/download?financial_year=2024&job_id={job_id}")
+
+        assert generate.call_count == 2
+        generate.assert_called_with("tok", "t-1", 2024)
+
+    def test_job_requires_xero_connection(self, client):
+        res = client.post("/stp-tracker/api/jobs")
+        assert res.status_code == 400
+        assert res.get_json() == {"error": "Xero not connected"}
+
+
+def _result_cache_clear():
+    from webapp.blueprints.stp_tracker import _result_cache
+
+    _result_cache.clear()
+
+
+class TestStpTrackerParams:
+    """Tests for shared credential and financial year handling."""
+
+    @pytest.mark.parametrize(
+        ("today", "expected"),
+        [
+            (date(2025, 6, 30), 2025),
+            (date(2025, 7, 1), 2026),
+            (date(2026, 1, 15), 2026),
+        ],
+    )
+    def test_default_financial_year(self, today, expected):
+        from webapp.blueprints.stp_tracker import _default_financial_year
+
+        assert _default_financial_year(today) == expected
+
+    @pytest.mark.parametrize("endpoint", ["generate", "download"])
+    def test_requires_xero_connection(self, client, endpoint):
+        res = client.get(f"/stp-tracker/api/{endpoint}")
+        assert res.status_code == 400
+        assert res.get_json() == {"error": "Xero not connected"}
+
+    @pytest.mark.parametrize("endpoint", ["generate", "download"])
+    def test_rejects_invalid_financial_year(self, client, endpoint):
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        res = client.get(f"/stp-tracker/api/{endpoint}?financial_year=abc")
+        assert res.status_code == 400
+        assert res.get_json() == {"error": "Invalid financial_year"}
+
+    def test_generate_defaults_to_current_financial_year(self, client):
+        from webapp.blueprints.stp_tracker import _default_financial_year
+
+        with client.session_transaction() as sess:
+            sess["xero_connection"] = {"access_token": "tok", "tenant_id": "t-1"}
+
+        with patch(
+            "webapp.blueprints.stp_tracker.generate_stp_summary",
+            return_value={"success": True},
+        ) as generate:
+            res = client.get("/stp-tracker/api/generate")
+
+        assert res.status_code == 200
+        generate.assert_called_once_with(
+            "tok", "t-1", _default_financial_year(date.today())
+        )
+
+
+class TestStpTrackerService:
+    """Tests for the STP summary service."""
+
+    def test_summary_uses_shared_xero_session(self):
+        from unittest.mock import MagicMock
+
+        from webapp.app_services import stp_tracker_service
+        from webapp.app_services.xero_http import get_xero_session
+
+        response = MagicMock()
+        response.json.return_value = {
+            "PayRuns": [
+                {
+                    "PayRunID": "pr-1",
+                    "PaymentDate": "/Date(1723075200000+0000)/",
+                    "PayRunStatus": "POSTED",
+                    "Wages": 1000,
+                    "Tax": 200,
+                    "Super": 115,
+                    "Payslips": [{}, {}],
+                }
+            ]
+        }
+        with patch.object(
+            get_xero_session(), "get", return_value=response
+        ) as session_get:
+            result = stp_tracker_service.generate_stp_summary("tok", "t-1", 2025)
+
+        session_get.assert_called_once()
+        assert result["success"] is True
+        assert result["data"]["quarters"][0]["gross_wages"] == 1000
+        assert result["data"]["ytd_totals"]["max_employees"] == 2
+
+    def test_shared_xero_session_ignores_cookies(self):
+        import email.message
+        import urllib.request
+
+        from webapp.app_services.xero_http import get_xero_session
+
+        class _Response:
+            def info(self):
+                headers = email.message.Message()
+                headers["Set-Cookie"] = "affinity=tenant-a; Path=/"
+                return headers
+
+        jar = get_xero_session().cookies
+        try:
+            jar.extract_cookies(
+                _Response(),
+                urllib.request.Request("https://api.xero.com/payroll.xro/1.0/PayRuns"),
+            )
+            assert len(jar) == 0
+        finally:
+            jar.clear()
@@ -0,0 +1,115 @@
+"""Tests for the database-backed background task queue."""
+
+from datetime import timedelta
+
+from webapp.models import BackgroundTask, db
+from webapp.services.task_queue import (
+    TaskQueue,
+    fail_stale_tasks,
+    get_task,
+    get_task_queue,
+    purge_finished_tasks,
+)
+from webapp.time_utils import utcnow
+
+
+def _add(a, b):
+    return {"total": a + b}
+
+
+def _boom():
+    raise RuntimeError("secret token leaked in message")
+
+
+class TestTaskQueue:
+    """Tests for TaskQueue."""
+
+    def test_registered_on_app(self, app):
+        assert isinstance(get_task_queue(app), TaskQueue)
+
+    def test_eager_task_records_result(self, app):
+        task_id = get_task_queue(app).submit("add", _add, 2, 3)
+
+        task = get_task(task_id, None)
+        assert task.status == "succeeded"
+        assert task.result == {"total": 5}
+        assert task.finished_at is not None
+
+    def test_failed_task_hides_exception_text(self, app):
+        task_id = get_task_queue(app).submit("boom", _boom)
+
+        task = get_task(task_id, None)
+        assert task.status == "failed"
+        assert task.error == "Task failed"
+        assert task.result is None
+
+    def test_threaded_task_records_result(self, app):
+        queue = TaskQueue(app, max_workers=1)
+        task_id = queue.submit("add", _add, 1, 1)
+        queue.shutdown(wait=True)
+
+        db.session.expire_all()
+        task = get_task(task_id, None)
+        assert task.status == "succeeded"
+        assert task.result == {"total": 2}
+        assert queue.size() == 0
+
+    def test_get_task_hides_other_users_tasks(self, app):
+        task_id = get_task_queue(app).submit("add", _add, 1, 2, user_id=None)
+        assert get_task(task_id, "someone-else") is None
+        assert get_task("missing", None) is None
+
+    def test_purge_finished_tasks(self, app):
+        old = utcnow() - timedelta(hours=48)
+        db.session.add_all(
+            [
+                BackgroundTask(kind="old", status="succeeded", created_at=old),
+                BackgroundTask(kind="stuck", status="running", created_at=old),
+                BackgroundTask(kind="new", status="failed"),
+            ]
+        )
+        db.session.commit()
+
+        # The orphaned running task is failed first, then purged with the rest
+        assert purge_finished_tasks(app) == 2
+        assert {task.kind for task in BackgroundTask.query.all()} == {"new"}
+
+    def test_fail_stale_tasks(self, app):
+        stale = utcnow() - timedelta(hours=1)
+        db.session.add_all(
+            [
+                BackgroundTask(kind="queued", status="queued", created_at=stale),
+                BackgroundTask(kind="running", status="running", created_at=stale),
+                BackgroundTask(kind="recent", status="running"),
+                BackgroundTask(kind="done", status="succeeded", created_at=stale),
+            ]
+        )
+        db.session.commit()
+
+        assert fail_stale_tasks(app) == 2
+        db.session.expire_all()
+        tasks = {task.kind: task for task in BackgroundTask.query.all()}
+        assert tasks["queued"].status == "failed"
+        assert tasks["running"].status == "failed"
+        assert tasks["running"].error
+        assert tasks["running"].finished_at is not None
+        assert tasks["recent"].status == "running"
+        assert tasks["done"].status == "succeeded"
+
+
+class TestJobStatusEndpoint:
+    """Tests for GET /api/jobs/<id>."""
+
+    def test_returns_task(self, app, client):
+        task_id = get_task_queue(app).submit("add", _add, 2, 2)
+
+        res = client.get(f"/api/jobs/{task_id}")
+        assert res.status_code == 200
+        data = res.get_json()
+        assert data["status"] == "succeeded"
+        assert data["result"] == {"total": 4}
+
+    def test_unknown_job(self, client):
+        res = client.get("/api/jobs/does-not-exist")
+        assert res.status_code == 404
+        assert res.get_json() == {"error": "Job not found"}
@@ -114,6 +114,27 @@ class TestTokenTracker:
             # Should still be allowed when enforcement disabled
             assert allowed is True
 
+    def test_check_and_get_usage(self, app):
+        """Test combined limit check and usage stats."""
+        with app.app_context():
+            tracker = TokenTracker(default_limit=1000)
+
+            tracker.record_usage("user-123", None, 300, 200)
+
+            allowed, remaining, stats = tracker.check_and_get_usage("user-123")
+
+            assert (allowed, remaining) == tracker.check_limit("user-123")
+            assert stats == tracker.get_usage("user-123")
+            assert remaining == 500
+
+            tracker.record_usage("user-123", None, 300, 300)
+
+            allowed, remaining, stats = tracker.check_and_get_usage("user-123")
+
+            assert allowed is False
+            assert remaining == 0
+            assert stats["current_period"]["total_tokens"] == 1100
+
     def test_get_usage_stats(self, app):
         """Test getting usage statistics."""
         with app.app_context():
@@ -182,6 +203,47 @@ class TestTokenTracker:
 
             assert stats["current_period"]["total_tokens"] == 300
 
+    def test_record_usage_increments_with_one_statement(self, app, count_queries):
+        """An existing period record is updated in SQL without a SELECT first."""
+        with app.app_context():
+            tracker = TokenTracker()
+            tracker.record_usage("user-123", "team-abc", 100, 200)
+
+            with count_queries("token_usages") as statements:
+                tracker.record_usage("user-123", "team-abc", 10, 20)
+
+            assert len(statements) == 1
+            assert statements[0].startswith("UPDATE")
+            usage = TokenUsage.query.one()
+            assert usage.total_tokens == 330
+            assert usage.request_count == 2
+
+    # A NULL team_id must conflict too, or the losing insert adds a second row
+    @pytest.mark.parametrize("team_id", ["team-abc", None])
+    def test_record_usage_recovers_from_concurrent_create(
+        self, app, monkeypatch, team_id
+    ):
+        """Losing the race to create the record falls back to incrementing it."""
+        with app.app_context():
+            tracker = TokenTracker()
+            tracker.record_usage("user-123", team_id, 100, 200)
+
+            # Make the first increment miss, as if the record did not exist yet
+            increment = tracker._increment_usage
+            calls = []
+
+            def _increment(*args):
+                calls.append(args)
+                return None if len(calls) == 1 else increment(*args)
+
+            monkeypatch.setattr(tracker, "_increment_usage", _increment)
+
+            usage = tracker.record_usage("user-123", team_id, 10, 20)
+
+            assert len(calls) == 2
+            assert usage.total_tokens == 330
+            assert TokenUsage.query.count() == 1
+
     def test_no_user_or_team_skips_tracking(self, app):
         """Test that recording without user/team is skipped."""
         with app.app_context():
@@ -261,6 +323,41 @@ class TestUsageEndpoints:
         assert "percentage_used" in period
 
 
+    def test_usage_supports_conditional_requests(self, app, client):
+        """Polling clients get 304 until the user's usage changes."""
+        client.post(
+            "/api/auth/register",
+            json={
+                "email": "poller@example.com",
+                "password": "securepass123",
+                "name": "Poller",
+            },
+        )
+        # Outside testing mode the endpoints read the signed-in user's usage
+        app.config["TESTING"] = False
+
+        for endpoint in ("/api/usage", "/api/usage/check"):
+            first = client.get(endpoint)
+            assert first.status_code == 200
+            assert first.headers["ETag"]
+            assert "private" in first.headers["Cache-Control"]
+
+            etag = first.headers["ETag"]
+            again = client.get(endpoint, headers={"If-None-Match": etag})
+            assert again.status_code == 304
+            assert again.data == b""
+
+        etag = client.get("/api/usage").headers["ETag"]
+        with app.app_context():
+            from webapp.models import User
+
+            user = User.query.filter_by(email="poller@example.com").first()
+            TokenTracker().record_usage(user.id, user.team_id, 10, 20)
+
+        changed = client.get("/api/usage", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.get_json()["current_period"]["total_tokens"] == 30
+
 class TestTokenTrackerInit:
     """Tests for token tracker initialization."""
 
@@ -0,0 +1,40 @@
+"""Tests for the in-process TTL cache."""
+
+from unittest.mock import patch
+
+from webapp.services.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set(("a", 1), {"value": 1})
+        assert cache.get(("a", 1)) == {"value": 1}
+        assert cache.get(("a", 2)) is None
+
+    def test_entries_expire(self):
+        cache = TTLCache(ttl_seconds=10)
+        with patch("webapp.services.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("k", "v")
+        with patch("webapp.services.ttl_cache.time.monotonic", return_value=109.0):
+            assert cache.get("k") == "v"
+        with patch("webapp.services.ttl_cache.time.monotonic", return_value=110.0):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self):
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_clear(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a", 1)
+        cache.clear()
+        assert cache.get("a") is None
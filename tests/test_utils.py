@@ -15,6 +15,12 @@ class TestValidateEmail:
         assert validate_email("@example.com") is False
         assert validate_email("user@") is False
 
+    def test_rejects_overlong_email(self):
+        domain = "example.com"
+        local = "a" * (254 - len(domain) - 1)
+        assert validate_email(f"{local}@{domain}") is True
+        assert validate_email(f"a{local}@{domain}") is False
+
 
 class TestSanitizeInput:
     """Tests for sanitize_input function."""
@@ -24,6 +30,11 @@ class TestSanitizeInput:
         assert "<" not in result
         assert ">" not in result
 
+    def test_escapes_quotes_and_brackets(self):
+        assert sanitize_input("""<a href="x">'b'</a>""") == (
+            "&lt;a href=&quot;x&quot;&gt;&#39;b&#39;&lt;/a&gt;"
+        )
+
     def test_empty_string(self):
         assert sanitize_input("") == ""
 
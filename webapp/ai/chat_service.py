@@ -143,16 +143,20 @@ class ChatService:
             return
 
         try:
-            for match in matches[:3]:  # Only top 3 skills are used
-                self.analytics_service.log_usage(
-                    skill_name=match.skill.name,
-                    skill_source=match.skill.source,
-                    user_id=user_id,
-                    team_id=team_id,
-                    trigger=match.trigger,
-                    confidence=match.confidence,
-                    conversation_id=conversation_id,
-                )
+            self.analytics_service.log_usages(
+                [
+                    {
+                        "skill_name": match.skill.name,
+                        "skill_source": match.skill.source,
+                        "user_id": user_id,
+                        "team_id": team_id,
+                        "trigger": match.trigger,
+                        "confidence": match.confidence,
+                        "conversation_id": conversation_id,
+                    }
+                    for match in matches[:3]  # Only top 3 skills are used
+                ]
+            )
         except Exception as e:
             logger.warning(f"Failed to log skill usage: {e}")
 
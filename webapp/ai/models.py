@@ -29,7 +29,7 @@ class ChatResponse:
     conversation_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """A chunk of streaming response data."""
 
@@ -10,6 +10,8 @@ import logging
 from typing import TYPE_CHECKING
 
 from flask import current_app
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
 
 from webapp.models import TokenUsage, db
 from webapp.time_utils import utcnow
@@ -176,24 +178,84 @@ class TokenTracker:
             logger.warning("Cannot record usage without user_id or team_id")
             return None
 
-        usage = self._get_or_create_usage(user_id, team_id)
-
-        # Atomically increment counters
-        usage.input_tokens = (usage.input_tokens or 0) + input_tokens
-        usage.output_tokens = (usage.output_tokens or 0) + output_tokens
-        usage.total_tokens = (usage.total_tokens or 0) + input_tokens + output_tokens
-        usage.request_count = (usage.request_count or 0) + 1
-
+        year, month = self._get_current_period()
+        usage = self._increment_usage(
+            user_id, team_id, year, month, input_tokens, output_tokens
+        )
+        if usage is None:
+            usage = TokenUsage(
+                user_id=user_id,
+                team_id=team_id,
+                period_year=year,
+                period_month=month,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                total_tokens=input_tokens + output_tokens,
+                request_count=1,
+            )
+            try:
+                with db.session.begin_nested():
+                    db.session.add(usage)
+            except IntegrityError:
+                # A concurrent request created this period's record first.
+                # uq_token_usage_period_keys coalesces NULL user/team IDs, so
+                # this also fires for users without a team.
+                usage = self._increment_usage(
+                    user_id, team_id, year, month, input_tokens, output_tokens
+                )
+
+        total_now = usage.total_tokens if usage is not None else None
         db.session.commit()
 
         logger.debug(
             f"Recorded usage: user={user_id}, team={team_id}, "
             f"input={input_tokens}, output={output_tokens}, "
-            f"total_now={usage.total_tokens}"
+            f"total_now={total_now}"
         )
 
         return usage
 
+    def _increment_usage(
+        self,
+        user_id: str | None,
+        team_id: str | None,
+        year: int,
+        month: int,
+        input_tokens: int,
+        output_tokens: int,
+    ) -> TokenUsage | None:
+        """Add to a period's counters in one UPDATE ... RETURNING statement.
+
+        The increments happen in SQL, so concurrent requests cannot overwrite
+        each other's counts. Returns None if the period has no record yet.
+        """
+        record_id = (
+            select(TokenUsage.id)
+            .where(
+                TokenUsage.user_id == user_id,
+                TokenUsage.team_id == team_id,
+                TokenUsage.period_year == year,
+                TokenUsage.period_month == month,
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(TokenUsage)
+            .where(TokenUsage.id == record_id)
+            .values(
+                input_tokens=func.coalesce(TokenUsage.input_tokens, 0) + input_tokens,
+                output_tokens=func.coalesce(TokenUsage.output_tokens, 0)
+                + output_tokens,
+                total_tokens=func.coalesce(TokenUsage.total_tokens, 0)
+                + input_tokens
+                + output_tokens,
+                request_count=func.coalesce(TokenUsage.request_count, 0) + 1,
+            )
+            .returning(TokenUsage)
+        )
+        return db.session.execute(stmt).scalars().first()
+
     def get_usage(
         self,
         user_id: str | None,
@@ -210,14 +272,54 @@ class TokenTracker:
             Dictionary with usage statistics
         """
         year, month = self._get_current_period()
+        usage = self._find_usage(user_id, team_id, year, month)
+        return self._usage_stats(usage, year, month)
 
-        usage = TokenUsage.query.filter_by(
+    def check_and_get_usage(
+        self,
+        user_id: str | None,
+        team_id: str | None = None,
+    ) -> tuple[bool, int, dict]:
+        """
+        Check the token limit and get usage statistics from a single lookup.
+
+        Equivalent to calling check_limit() and get_usage() back to back,
+        but reads the current period's record once and does not create it.
+
+        Args:
+            user_id: User ID to check
+            team_id: Optional team ID for team-based limits
+
+        Returns:
+            Tuple of (allowed, remaining_tokens, usage_stats)
+        """
+        year, month = self._get_current_period()
+        usage = self._find_usage(user_id, team_id, year, month)
+        stats = self._usage_stats(usage, year, month)
+
+        if not self.enforce_limits or (user_id is None and team_id is None):
+            return True, self.default_limit, stats
+
+        remaining = stats["current_period"]["remaining"]
+        return remaining > 0, remaining, stats
+
+    def _find_usage(
+        self,
+        user_id: str | None,
+        team_id: str | None,
+        year: int,
+        month: int,
+    ) -> TokenUsage | None:
+        """Look up the usage record for a period without creating it."""
+        return TokenUsage.query.filter_by(  # type: ignore[no-any-return]
             user_id=user_id,
             team_id=team_id,
             period_year=year,
             period_month=month,
         ).first()
 
+    def _usage_stats(self, usage: TokenUsage | None, year: int, month: int) -> dict:
+        """Build the usage statistics dictionary for a period's record."""
         limit = self.default_limit
         total_tokens = 0
         input_tokens = 0
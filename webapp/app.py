@@ -17,10 +17,13 @@ from webapp.blueprints.auth import auth_bp
 from webapp.blueprints.cashflow import cashflow_bp
 from webapp.blueprints.chat import chat_bp
 from webapp.blueprints.forecast import forecast_bp
+from webapp.blueprints.jobs import jobs_bp
 from webapp.blueprints.pages import pages_bp
 from webapp.blueprints.skills import skills_bp
 from webapp.blueprints.usage import usage_bp
+from webapp.compression import init_response_compression
 from webapp.config import Config
+from webapp.json_provider import init_column_json, init_json_provider
 from webapp.models import User, db
 from webapp.routes import api_bp
 from webapp.services.background_jobs import ManagedJob, start_background_scheduler
@@ -38,6 +41,7 @@ from webapp.services.startup_checks import (
     run_startup_config_audit,
     should_fail_fast_on_config_audit,
 )
+from webapp.services.task_queue import init_task_queue, purge_finished_tasks
 from webapp.skills.analytics_service import init_analytics_service
 from webapp.skills.r2_skill_loader import init_r2_loader
 
@@ -107,6 +111,9 @@ def create_app(config_class: type = Config) -> Flask:
     """Create and configure the Flask application."""
     app = Flask(__name__)
     app.config.from_object(config_class)
+    init_json_provider(app)
+    init_column_json(app)
+    init_response_compression(app)
 
     config_audit = run_startup_config_audit(app)
     app.extensions["startup_config_audit"] = config_audit
@@ -159,6 +166,9 @@ def create_app(config_class: type = Config) -> Flask:
     # Initialize analytics service
     init_analytics_service(app)
 
+    # Thread pool for slow report generation, polled via /api/jobs/<id>
+    init_task_queue(app)
+
     # Register blueprints
     app.register_blueprint(api_bp, url_prefix="/api")
     app.register_blueprint(auth_bp)
@@ -169,6 +179,7 @@ def create_app(config_class: type = Config) -> Flask:
     app.register_blueprint(usage_bp)
     app.register_blueprint(cashflow_bp)
     app.register_blueprint(forecast_bp)
+    app.register_blueprint(jobs_bp)
 
     # Import and register Phase 2-5 blueprints
     from webapp.blueprints.sharing import sharing_bp
@@ -252,6 +263,17 @@ def create_app(config_class: type = Config) -> Flask:
                 max_retries=0,
                 retry_backoff_seconds=1.0,
             ),
+            ManagedJob(
+                job_id="purge_finished_tasks",
+                func=lambda: purge_finished_tasks(app),
+                cron_env_var="PURGE_FINISHED_TASKS_CRON",
+                interval_env_var="PURGE_FINISHED_TASKS_MINUTES",
+                default_interval_minutes=60,
+                fallback_minute=30,
+                max_runtime_seconds=60,
+                max_retries=0,
+                retry_backoff_seconds=1.0,
+            ),
         ],
     )
     app.extensions["runtime_scheduler_state"] = {
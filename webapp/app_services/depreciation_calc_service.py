@@ -263,7 +263,7 @@ def _fetch_depreciation_journals(
 
             # Parse journal date
             try:
-                journal_date = datetime.strptime(journal_date_str[:10], "%Y-%m-%d")
+                journal_date = datetime.fromisoformat(journal_date_str[:10])
             except ValueError:
                 continue
 
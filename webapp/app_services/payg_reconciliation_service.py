@@ -116,7 +116,7 @@ def _fetch_pay_runs(
             if not payment_date:
                 continue
 
-            payment_dt = datetime.strptime(payment_date, "%Y-%m-%d")
+            payment_dt = datetime.fromisoformat(payment_date)
             if from_dt <= payment_dt <= to_dt:
                 pay_runs.append(
                     {
@@ -10,20 +10,31 @@ Core business logic for:
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
 from typing import Any
 
 import requests
 
+from webapp.app_services.xero_http import get_xero_session
+from webapp.utils import validate_email
+
 logger = logging.getLogger(__name__)
 
 # Xero Payroll AU API base URL
 XERO_PAYROLL_AU_URL = "https://api.xero.com/payroll.xro/1.0"
 
+# Xero allows 5 calls in progress per tenant; stay under it
+XERO_MAX_CONCURRENT_REQUESTS = 4
+
 # Australian states for validation
 AUSTRALIAN_STATES = {"NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"}
 
+# Field formats checked for every uploaded employee row
+_TFN_MATCH = re.compile(r"^\d{9}$").match
+_BSB_MATCH = re.compile(r"^\d{6}$").match
+
 
 # =============================================================================
 # Pay Run Functions
@@ -278,6 +289,9 @@ def get_employee_leave_balances(
     """
     Fetch leave balances for a list of employees.
 
+    Employees are fetched concurrently, a few at a time, since Xero has no
+    bulk endpoint for leave balances.
+
     Returns a dict mapping employee_id -> list of leave balances.
     """
     headers = {
@@ -286,37 +300,43 @@ def get_employee_leave_balances(
         "Accept": "application/json",
     }
 
-    balances: dict[str, list[dict]] = {}
+    if not employee_ids:
+        return {}
 
-    for emp_id in employee_ids:
-        try:
-            resp = requests.get(
-                f"{XERO_PAYROLL_AU_URL}/Employees/{emp_id}",
-                headers=headers,
-                timeout=15,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            employees = data.get("Employees", [])
-            if employees:
-                emp = employees[0]
-                leave_balances = []
-                for lb in emp.get("LeaveBalances", []):
-                    leave_balances.append(
-                        {
-                            "leave_type_id": lb.get("LeaveTypeID"),
-                            "leave_name": lb.get("LeaveName", "Leave"),
-                            "balance": float(lb.get("NumberOfUnits", 0) or 0),
-                        }
-                    )
-                balances[emp_id] = leave_balances
+    workers = min(XERO_MAX_CONCURRENT_REQUESTS, len(employee_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda emp_id: _fetch_employee_leave_balances(emp_id, headers),
+            employee_ids,
+        )
+        return dict(zip(employee_ids, results, strict=True))
 
-        except requests.RequestException as e:
-            logger.warning("Failed to fetch leave balance for %s: %s", emp_id, e)
-            balances[emp_id] = []
 
-    return balances
+def _fetch_employee_leave_balances(emp_id: str, headers: dict) -> list[dict]:
+    """Fetch one employee's leave balances (empty on failure)."""
+    try:
+        resp = get_xero_session().get(
+            f"{XERO_PAYROLL_AU_URL}/Employees/{emp_id}",
+            headers=headers,
+            timeout=15,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+    except requests.RequestException as e:
+        logger.warning("Failed to fetch leave balance for %s: %s", emp_id, e)
+        return []
+
+    employees = data.get("Employees", [])
+    if not employees:
+        return []
+    return [
+        {
+            "leave_type_id": lb.get("LeaveTypeID"),
+            "leave_name": lb.get("LeaveName", "Leave"),
+            "balance": float(lb.get("NumberOfUnits", 0) or 0),
+        }
+        for lb in employees[0].get("LeaveBalances", [])
+    ]
 
 
 def build_leave_flags_response(
@@ -561,14 +581,14 @@ def validate_employee_data(employees: list[dict]) -> list[dict]:
         tfn = str(emp.get("tfn", "") or "").replace(" ", "")
         if not tfn:
             errors.append("TFN is required")
-        elif not re.match(r"^\d{9}$", tfn):
+        elif not _TFN_MATCH(tfn):
             errors.append("TFN must be 9 digits")
 
         # BSB validation (6 digits)
         bsb = str(emp.get("bank_bsb", "") or "").replace("-", "").replace(" ", "")
         if not bsb:
             errors.append("Bank BSB is required")
-        elif not re.match(r"^\d{6}$", bsb):
+        elif not _BSB_MATCH(bsb):
             errors.append("Bank BSB must be 6 digits")
 
         # Bank account number
@@ -826,8 +846,7 @@ def _is_valid_email(email: str) -> bool:
     """Basic email validation."""
     if not email:
         return False
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return validate_email(email)
 
 
 def _build_xero_employee_payload(emp: dict) -> dict:
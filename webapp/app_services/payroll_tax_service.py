@@ -8,10 +8,11 @@ thresholds and rates.
 import logging
 from datetime import datetime
 from io import BytesIO
-from typing import Any
+from typing import IO, Any
 
 import requests
 
+from webapp.app_services.xero_http import get_xero_session
 from webapp.time_utils import utcnow_iso
 
 logger = logging.getLogger(__name__)
@@ -156,7 +157,7 @@ def _fetch_pay_runs(
     }
 
     try:
-        resp = requests.get(
+        resp = get_xero_session().get(
             f"{XERO_PAYROLL_AU_URL}/PayRuns",
             headers=headers,
             timeout=30,
@@ -173,7 +174,7 @@ def _fetch_pay_runs(
             if not payment_date:
                 continue
 
-            payment_dt = datetime.strptime(payment_date, "%Y-%m-%d")
+            payment_dt = datetime.fromisoformat(payment_date)
             if from_dt <= payment_dt <= to_dt:
                 if pr.get("PayRunStatus") == "POSTED":
                     pay_runs.append(
@@ -272,8 +273,13 @@ def get_all_state_rates() -> dict[str, dict]:
     return PAYROLL_TAX_RATES
 
 
-def export_to_excel(data: dict[str, Any]) -> BytesIO:
-    """Export payroll tax calculation to Excel."""
+def export_to_excel(data: dict[str, Any], dst: IO[bytes] | None = None) -> IO[bytes]:
+    """
+    Export payroll tax calculation to Excel.
+
+    The workbook is written to ``dst`` when given (e.g. a spooled temp
+    file), otherwise to a new BytesIO. The stream is rewound and returned.
+    """
     try:
         import openpyxl
         from openpyxl.styles import Font
@@ -347,7 +353,7 @@ def export_to_excel(data: dict[str, Any]) -> BytesIO:
     ws.column_dimensions["A"].width = 25
     ws.column_dimensions["B"].width = 20
 
-    output = BytesIO()
+    output = dst if dst is not None else BytesIO()
     wb.save(output)
     output.seek(0)
     return output
@@ -7,7 +7,7 @@ Track prepaid expenses and amortization schedules.
 import logging
 from datetime import datetime
 from io import BytesIO
-from typing import Any
+from typing import IO, Any
 
 import requests
 
@@ -201,7 +201,7 @@ def _build_prepayment_schedule(
 
         for j in account_journals:
             try:
-                journal_dt = datetime.strptime(j.get("date", ""), "%Y-%m-%d")
+                journal_dt = datetime.fromisoformat(j.get("date", ""))
             except ValueError:
                 continue
 
@@ -267,8 +267,13 @@ def _calculate_totals(schedule: list[dict]) -> dict[str, Any]:
     }
 
 
-def export_to_excel(data: dict[str, Any]) -> BytesIO:
-    """Export prepayment schedule to Excel."""
+def export_to_excel(data: dict[str, Any], dst: IO[bytes] | None = None) -> IO[bytes]:
+    """
+    Export prepayment schedule to Excel.
+
+    The workbook is written to ``dst`` when given (e.g. a spooled temp
+    file), otherwise to a new BytesIO. The stream is rewound and returned.
+    """
     try:
         import openpyxl
         from openpyxl.styles import Font, PatternFill
@@ -371,7 +376,7 @@ def export_to_excel(data: dict[str, Any]) -> BytesIO:
     for col in range(2, 8):
         ws.column_dimensions[get_column_letter(col)].width = 15
 
-    output = BytesIO()
+    output = dst if dst is not None else BytesIO()
     wb.save(output)
     output.seek(0)
     return output
@@ -7,16 +7,19 @@ Track STP lodgement status and payroll totals by quarter.
 import logging
 from datetime import datetime
 from io import BytesIO
-from typing import Any
+from typing import IO, Any
 
 import requests
 
+from webapp.app_services.xero_http import get_xero_session
 from webapp.time_utils import utcnow_iso
 
 logger = logging.getLogger(__name__)
 
 XERO_PAYROLL_AU_URL = "https://api.xero.com/payroll.xro/1.0"
 
+CURRENCY_FORMAT = '"$"#,##0.00'
+
 
 def generate_stp_summary(
     access_token: str,
@@ -84,7 +87,7 @@ def _fetch_pay_runs_for_fy(
     }
 
     try:
-        resp = requests.get(
+        resp = get_xero_session().get(
             f"{XERO_PAYROLL_AU_URL}/PayRuns",
             headers=headers,
             timeout=30,
@@ -101,7 +104,7 @@ def _fetch_pay_runs_for_fy(
             if not payment_date:
                 continue
 
-            payment_dt = datetime.strptime(payment_date, "%Y-%m-%d")
+            payment_dt = datetime.fromisoformat(payment_date)
             if fy_start_dt <= payment_dt <= fy_end_dt:
                 # Only include POSTED pay runs for STP tracking
                 if pr.get("PayRunStatus") == "POSTED":
@@ -182,17 +185,24 @@ def _group_by_quarter(pay_runs: list[dict], financial_year: int) -> list[dict]:
         },
     ]
 
+    # Parse each quarter's bounds once rather than per pay run
+    quarter_bounds = [
+        (
+            q,
+            datetime.fromisoformat(str(q["start_date"])),
+            datetime.fromisoformat(str(q["end_date"])),
+        )
+        for q in quarters
+    ]
+
     for pr in pay_runs:
         payment_date = pr.get("payment_date", "")
         if not payment_date:
             continue
 
-        payment_dt = datetime.strptime(payment_date, "%Y-%m-%d")
-
-        for q in quarters:
-            q_start = datetime.strptime(str(q["start_date"]), "%Y-%m-%d")
-            q_end = datetime.strptime(str(q["end_date"]), "%Y-%m-%d")
+        payment_dt = datetime.fromisoformat(payment_date)
 
+        for q, q_start, q_end in quarter_bounds:
             if q_start <= payment_dt <= q_end:
                 gross: float = float(q.get("gross_wages") or 0)  # type: ignore[arg-type]
                 payg: float = float(q.get("payg_withheld") or 0)  # type: ignore[arg-type]
@@ -248,42 +258,65 @@ def _parse_xero_date(date_value: str | None) -> str | None:
     return str(date_value)
 
 
-def export_to_excel(data: dict[str, Any]) -> BytesIO:
-    """Export STP summary to Excel."""
+def export_to_excel(data: dict[str, Any], dst: IO[bytes] | None = None) -> IO[bytes]:
+    """
+    Export STP summary to Excel.
+
+    Rows are streamed through a write-only workbook, so memory stays flat
+    however many quarters are exported. The workbook is written to ``dst``
+    when given (e.g. a spooled temp file), otherwise to a new BytesIO. The
+    stream is rewound and returned.
+    """
     try:
         import openpyxl
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill
-        from openpyxl.utils import get_column_letter
     except ImportError as err:
         raise ImportError("openpyxl required for Excel export") from err
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "STP Summary"
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("STP Summary")
+
+    # Column widths must be set before any rows are written
+    ws.column_dimensions["A"].width = 18
+    for col in "BCDEF":
+        ws.column_dimensions[col].width = 15
 
     # Styles
     header_fill = PatternFill(
         start_color="0066CC", end_color="0066CC", fill_type="solid"
     )
     header_font = Font(bold=True, color="FFFFFF")
+    bold_font = Font(bold=True)
+
+    def styled(value: Any, **styles: Any) -> WriteOnlyCell:
+        cell = WriteOnlyCell(ws, value=value)
+        for name, style in styles.items():
+            setattr(cell, name, style)
+        return cell
+
+    def currency(value: Any) -> WriteOnlyCell:
+        return styled(value, number_format=CURRENCY_FORMAT)
 
     result = data.get("data", {})
 
     # Title
-    ws["A1"] = "STP Submission Tracker"
-    ws["A1"].font = Font(bold=True, size=14)
-    ws.merge_cells("A1:F1")
-
-    ws["A2"] = f"Financial Year: {data.get('financial_year')}"
-    ws["A2"].font = Font(italic=True)
+    ws.append([styled("STP Submission Tracker", font=Font(bold=True, size=14))])
+    ws.merged_cells.add("A1:F1")
+    ws.append(
+        [
+            styled(
+                f"Financial Year: {data.get('financial_year')}", font=Font(italic=True)
+            )
+        ]
+    )
+    ws.append([])
 
     # YTD Summary
-    row = 4
-    ws[f"A{row}"] = "YTD Summary"
-    ws[f"A{row}"].font = Font(bold=True)
+    ws.append([styled("YTD Summary", font=bold_font)])
+    row = 5
 
     ytd = result.get("ytd_totals", {})
-    row += 1
     ytd_items = [
         ("Gross Wages", ytd.get("gross_wages", 0)),
         ("PAYG Withheld", ytd.get("payg_withheld", 0)),
@@ -293,60 +326,50 @@ def export_to_excel(data: dict[str, Any]) -> BytesIO:
     ]
 
     for label, value in ytd_items:
-        ws.cell(row=row, column=1, value=label)
-        cell = ws.cell(row=row, column=2, value=value)
-        if isinstance(value, float):
-            cell.number_format = '"$"#,##0.00'
+        ws.append([label, currency(value) if isinstance(value, float) else value])
         row += 1
 
+    ws.append([])
     row += 1
 
     # Quarterly breakdown
-    ws[f"A{row}"] = "Quarterly Breakdown"
-    ws[f"A{row}"].font = Font(bold=True)
+    ws.append([styled("Quarterly Breakdown", font=bold_font)])
     row += 1
 
     headers = ["Quarter", "Period", "Gross Wages", "PAYG Withheld", "Super", "Pay Runs"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=row, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-
+    ws.append([styled(h, fill=header_fill, font=header_font) for h in headers])
     row += 1
+
     for q in result.get("quarters", []):
-        ws.cell(row=row, column=1, value=q.get("quarter", ""))
-        ws.cell(row=row, column=2, value=q.get("period", ""))
-        ws.cell(
-            row=row, column=3, value=q.get("gross_wages", 0)
-        ).number_format = '"$"#,##0.00'
-        ws.cell(
-            row=row, column=4, value=q.get("payg_withheld", 0)
-        ).number_format = '"$"#,##0.00'
-        ws.cell(
-            row=row, column=5, value=q.get("super", 0)
-        ).number_format = '"$"#,##0.00'
-        ws.cell(row=row, column=6, value=q.get("pay_run_count", 0))
+        ws.append(
+            [
+                q.get("quarter", ""),
+                q.get("period", ""),
+                currency(q.get("gross_wages", 0)),
+                currency(q.get("payg_withheld", 0)),
+                currency(q.get("super", 0)),
+                q.get("pay_run_count", 0),
+            ]
+        )
         row += 1
 
+    ws.append([])
+    ws.append([])
     row += 2
 
     # Note about STP submission status
-    ws.cell(
-        row=row,
-        column=1,
-        value="Note: STP submission status is not available via Xero API. "
-        "Please check Xero Payroll directly for lodgement confirmation.",
+    ws.append(
+        [
+            styled(
+                "Note: STP submission status is not available via Xero API. "
+                "Please check Xero Payroll directly for lodgement confirmation.",
+                font=Font(italic=True, color="666666"),
+            )
+        ]
     )
-    ws.merge_cells(f"A{row}:F{row}")
-    ws[f"A{row}"].font = Font(italic=True, color="666666")
-
-    # Column widths
-    ws.column_dimensions["A"].width = 18
-    ws.column_dimensions["B"].width = 15
-    for col in range(3, 7):
-        ws.column_dimensions[get_column_letter(col)].width = 15
+    ws.merged_cells.add(f"A{row}:F{row}")
 
-    output = BytesIO()
+    output = dst if dst is not None else BytesIO()
     wb.save(output)
     output.seek(0)
     return output
@@ -0,0 +1,30 @@
+"""
+Shared HTTP session for Xero API calls.
+
+One ``requests.Session`` per worker process keeps TLS connections to
+api.xero.com open between requests, so repeat calls skip the TCP and TLS
+handshakes. The session is shared by every tenant and user (and by
+concurrent fetch threads), so it never stores cookies.
+"""
+
+import atexit
+import http.cookiejar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Keep-alive connections held per host. Xero calls go to a single host,
+# so this caps the idle connections a worker keeps open.
+XERO_POOL_MAXSIZE = 16
+
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=XERO_POOL_MAXSIZE))
+# Refuse every cookie so one tenant's (e.g. load-balancer affinity) cookie is
+# never sent with another tenant's request
+_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+atexit.register(_session.close)
+
+
+def get_xero_session() -> requests.Session:
+    """Return the process-wide session for Xero API requests."""
+    return _session
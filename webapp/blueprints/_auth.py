@@ -0,0 +1,38 @@
+"""
+Authentication helpers shared by the report blueprints.
+"""
+
+from functools import wraps
+
+from flask import current_app
+
+from webapp.blueprints._responses import error_body, error_response
+
+try:
+    from flask_login import current_user
+except ImportError:  # pragma: no cover - flask_login is a hard dependency
+    current_user = None
+
+_ERR_AUTHENTICATION_REQUIRED = error_body("Authentication required")
+
+
+def login_required_or_testing(f):
+    """Require login decorator. Bypassed in testing mode."""
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if current_app.config.get("TESTING"):
+            return f(*args, **kwargs)
+        # Without flask_login or a login manager there is no user to check
+        if not getattr(current_user, "is_authenticated", True):
+            return error_response(_ERR_AUTHENTICATION_REQUIRED, 401)
+        return f(*args, **kwargs)
+
+    return decorated_function
+
+
+def current_user_id() -> str | None:
+    """ID of the signed-in user, or None (e.g. unauthenticated test requests)."""
+    if getattr(current_user, "is_authenticated", False):
+        return str(current_user.id)
+    return None
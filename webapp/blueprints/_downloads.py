@@ -0,0 +1,44 @@
+"""
+File download helpers shared by the report blueprints.
+"""
+
+import tempfile
+import unicodedata
+from typing import IO
+from urllib.parse import quote
+
+from werkzeug.http import dump_options_header
+
+XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Exports larger than this spill from memory to a temp file on disk
+EXPORT_SPOOL_MAX_BYTES = 1024 * 1024
+
+
+def new_export_buffer() -> IO[bytes]:
+    """Return a spooled temp file for building a download.
+
+    Small exports stay in memory; large ones roll over to disk so worker
+    memory stays bounded. ``send_file`` streams the buffer in chunks and
+    closes it when the response finishes.
+    """
+    return tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES)
+
+
+def attachment_disposition(filename: str) -> str:
+    """Build a ``Content-Disposition: attachment`` value for ``filename``.
+
+    Matches what ``send_file(download_name=...)`` sends: the name is quoted
+    as needed, and non-ASCII names get an ASCII fallback plus an RFC 5987
+    ``filename*`` parameter. Static names can be built once at import time.
+    """
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", filename)
+        simple = simple.encode("ascii", "ignore").decode("ascii")
+        quoted = quote(filename, safe="!#$&+^`|~")
+        return dump_options_header(
+            "attachment", {"filename": simple, "filename*": f"UTF-8''{quoted}"}
+        )
+    return dump_options_header("attachment", {"filename": filename})
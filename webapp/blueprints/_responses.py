@@ -0,0 +1,42 @@
+"""
+JSON response helpers shared by the blueprints.
+"""
+
+import hashlib
+import json
+
+from flask import Response, current_app, request
+
+
+def error_body(message: str) -> bytes:
+    """Serialize a static ``{"error": message}`` body.
+
+    Call this at import time for fixed messages so the error path only has
+    to wrap the bytes in a response.
+    """
+    return json.dumps({"error": message}, separators=(",", ":")).encode() + b"\n"
+
+
+def error_response(body: bytes, status: int) -> Response:
+    """Build a JSON error response from a body made by :func:`error_body`."""
+    return current_app.response_class(body, status=status, mimetype="application/json")
+
+
+def json_etag(body: str) -> str:
+    """Strong ETag for a serialized JSON body."""
+    return hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+
+
+def conditional_json_response(body: str, etag: str | None = None) -> Response:
+    """Serve a per-user JSON body with an ETag, answering 304 when it matches.
+
+    The response is marked private and must be revalidated, so polling
+    clients send ``If-None-Match`` and get an empty 304 while the data is
+    unchanged. ``etag`` defaults to :func:`json_etag` of the body.
+    """
+    response = current_app.response_class(body, mimetype="application/json")
+    response.set_etag(etag or json_etag(body))
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.make_conditional(request)
+    return response
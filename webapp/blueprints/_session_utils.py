@@ -0,0 +1,16 @@
+"""
+Session helpers shared by the Xero-backed report blueprints.
+"""
+
+from flask import session
+
+
+def get_xero_credentials() -> tuple[str | None, str | None]:
+    """Get Xero access token and tenant ID from session."""
+    # Resolve the session proxy once instead of on every lookup
+    sess = session._get_current_object()  # type: ignore[attr-defined]
+    conn = sess.get("xero_connection") or {}
+    return (
+        conn.get("access_token") or sess.get("xero_access_token"),
+        conn.get("tenant_id") or sess.get("xero_tenant_id"),
+    )
@@ -456,7 +456,7 @@ def api_list_conversations():
         - total: Total number of conversations
     """
     try:
-        from webapp.models import Conversation
+        from webapp.models import Conversation, raiseload_if_enabled
 
         # Parse pagination params first so invalid input is rejected
         # consistently in both testing and authenticated runtime.
@@ -480,18 +480,24 @@ def api_list_conversations():
                 )
             return jsonify({"error": "Authentication required"}), 401
 
-        # Query conversations
-        query = Conversation.query.filter_by(user_id=user_id).order_by(
-            Conversation.updated_at.desc()
+        # Query conversations. to_dict() gets its message count from the
+        # grouped query below, so any relationship load would be an N+1.
+        query = (
+            Conversation.query.options(*raiseload_if_enabled())
+            .filter_by(user_id=user_id)
+            .order_by(Conversation.updated_at.desc())
         )
 
         total = query.count()
         conversations = query.offset(offset).limit(limit).all()
+        counts = Conversation.message_counts([c.id for c in conversations])
 
         return jsonify(
             {
                 "success": True,
-                "conversations": [c.to_dict() for c in conversations],
+                "conversations": [
+                    c.to_dict(message_count=counts.get(c.id, 0)) for c in conversations
+                ],
                 "total": total,
             }
         )
@@ -14,12 +14,16 @@ import logging
 from flask import Blueprint, Response, jsonify, request
 from flask_login import current_user, login_required
 
+from webapp.blueprints._downloads import attachment_disposition
 from webapp.models import AccountantShare, Conversation, User, db
 
 logger = logging.getLogger(__name__)
 
 export_bp = Blueprint("export", __name__)
 
+_COMPLIANCE_PDF_DISPOSITION = attachment_disposition("compliance-summary.pdf")
+_BULK_PDF_DISPOSITION = attachment_disposition("bulk-export.pdf")
+
 
 def _can_access_conversation(conversation, user):
     """Check if user can access a conversation (owner or shared accountant)."""
@@ -73,7 +77,9 @@ def api_export_conversation_pdf(conversation_id: str):
             pdf_bytes,
             mimetype="application/pdf",
             headers={
-                "Content-Disposition": f'attachment; filename="conversation-{conversation_id[:8]}.pdf"'
+                "Content-Disposition": attachment_disposition(
+                    f"conversation-{conversation_id[:8]}.pdf"
+                )
             },
         )
 
@@ -125,9 +131,7 @@ def api_export_compliance_pdf():
         return Response(
             pdf_bytes,
             mimetype="application/pdf",
-            headers={
-                "Content-Disposition": 'attachment; filename="compliance-summary.pdf"'
-            },
+            headers={"Content-Disposition": _COMPLIANCE_PDF_DISPOSITION},
         )
 
     except Exception as e:
@@ -178,7 +182,7 @@ def api_export_bulk_pdf():
         return Response(
             pdf_bytes,
             mimetype="application/pdf",
-            headers={"Content-Disposition": 'attachment; filename="bulk-export.pdf"'},
+            headers={"Content-Disposition": _BULK_PDF_DISPOSITION},
         )
 
     except Exception as e:
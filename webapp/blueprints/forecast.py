@@ -19,6 +19,8 @@ from functools import wraps
 import requests
 from flask import Blueprint, current_app, jsonify, render_template, request, session
 
+from webapp.services.bas_deadlines import get_deadlines_for_forecast
+
 logger = logging.getLogger(__name__)
 
 forecast_bp = Blueprint("forecast", __name__)
@@ -250,8 +252,6 @@ def api_generate_forecast():
         avg_outflow = round(sum(monthly_outflows.values()) / num_months, 2)
 
         # 4. Get BAS deadlines for the forecast period
-        from webapp.services.bas_deadlines import get_deadlines_for_forecast
-
         deadlines = get_deadlines_for_forecast(
             frequency="quarterly",
             lodge_method=lodge_method,
@@ -416,8 +416,6 @@ def api_forecast_deadlines():
     if lodge_method not in ("self", "agent"):
         lodge_method = "self"
 
-    from webapp.services.bas_deadlines import get_deadlines_for_forecast
-
     deadlines = get_deadlines_for_forecast(
         frequency="quarterly",
         lodge_method=lodge_method,
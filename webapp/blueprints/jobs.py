@@ -0,0 +1,36 @@
+"""
+Background Jobs Blueprint
+
+Status polling for work submitted to the task queue.
+
+Endpoints:
+- GET /api/jobs/<job_id> - Get job status and, once finished, its result
+"""
+
+from flask import Blueprint, jsonify
+
+from webapp.blueprints._auth import current_user_id
+from webapp.blueprints._auth import login_required_or_testing as _login_required
+from webapp.blueprints._responses import error_body, error_response
+from webapp.services.task_queue import get_task
+
+jobs_bp = Blueprint("jobs", __name__)
+
+_ERR_JOB_NOT_FOUND = error_body("Job not found")
+
+
+@jobs_bp.route("/api/jobs/<job_id>", methods=["GET"])
+@_login_required
+def api_job_status(job_id: str):
+    """
+    Get the status of a background job.
+
+    Response:
+        - id, kind, status ("queued", "running", "succeeded" or "failed")
+        - result: the job's result once it has succeeded
+        - error: a generic message if it failed
+    """
+    task = get_task(job_id, current_user_id())
+    if task is None:
+        return error_response(_ERR_JOB_NOT_FOUND, 404)
+    return jsonify(task.to_dict())
@@ -5,7 +5,7 @@ from __future__ import annotations
 import csv
 import io
 from collections import Counter
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 
 from flask import (
@@ -20,6 +20,7 @@ from flask import (
 )
 from flask_login import current_user, login_required
 
+from webapp.blueprints._downloads import attachment_disposition
 from webapp.services.maintenance import (
     cleanup_expired_conversations,
     snapshot_runtime_health,
@@ -31,6 +32,8 @@ pages_bp = Blueprint("pages", __name__)
 
 _ALLOWED_STATUS_FILTERS = {"all", "healthy", "degraded"}
 _ALLOWED_AUTO_REFRESH_SECONDS = {0, 15, 30, 60, 120}
+_CSV_ROWS_PER_CHUNK = 500
+_INCIDENT_CSV_DISPOSITION = attachment_disposition("runtime-health-incidents.csv")
 
 
 @dataclass(frozen=True)
@@ -169,6 +172,23 @@ def _runtime_admin_forbidden_response():
     return render_template("ops/runtime_health_denied.html"), 403
 
 
+def _iter_incident_csv(incident_rows: list[dict]) -> Iterator[str]:
+    """Yield incident CSV text in chunks instead of building it all at once."""
+    csv_buffer = io.StringIO()
+    writer = csv.writer(csv_buffer)
+    writer.writerow(["snapshot_id", "timestamp_utc", "status", "reason"])
+    for start in range(0, len(incident_rows), _CSV_ROWS_PER_CHUNK):
+        writer.writerows(
+            [row["snapshot_id"], row["timestamp_utc"], row["status"], row["reason"]]
+            for row in incident_rows[start : start + _CSV_ROWS_PER_CHUNK]
+        )
+        yield csv_buffer.getvalue()
+        csv_buffer.seek(0)
+        csv_buffer.truncate()
+    if csv_buffer.tell():
+        yield csv_buffer.getvalue()
+
+
 def _build_incident_rows(snapshots: list[dict]) -> list[dict]:
     rows: list[dict] = []
     for snapshot in snapshots:
@@ -265,18 +285,8 @@ def runtime_health_incidents_csv():
     )
     incident_rows = _build_incident_rows(filtered_snapshots)
 
-    csv_buffer = io.StringIO()
-    writer = csv.writer(csv_buffer)
-    writer.writerow(["snapshot_id", "timestamp_utc", "status", "reason"])
-    for row in incident_rows:
-        writer.writerow(
-            [row["snapshot_id"], row["timestamp_utc"], row["status"], row["reason"]]
-        )
-
-    response = Response(csv_buffer.getvalue(), mimetype="text/csv")
-    response.headers[
-        "Content-Disposition"
-    ] = "attachment; filename=runtime-health-incidents.csv"
+    response = Response(_iter_incident_csv(incident_rows), mimetype="text/csv")
+    response.headers["Content-Disposition"] = _INCIDENT_CSV_DISPOSITION
     return response
 
 
@@ -19,6 +19,7 @@ Endpoints:
 import logging
 import os
 from functools import wraps
+from io import BytesIO
 
 from flask import (
     Blueprint,
@@ -405,6 +406,33 @@ def api_employee_template():
 # Helper Functions
 # =============================================================================
 
+# Employee template columns as (header, column width), in sheet order
+_TEMPLATE_COLUMNS = [
+    ("First Name", 15),
+    ("Last Name", 15),
+    ("Date of Birth", 14),
+    ("Email", 25),
+    ("Phone", 15),
+    ("Address Line 1", 25),
+    ("City", 15),
+    ("State", 8),
+    ("Postcode", 10),
+    ("Start Date", 14),
+    ("Job Title", 20),
+    ("TFN", 12),
+    ("Bank BSB", 10),
+    ("Bank Account Number", 18),
+    ("Bank Account Name", 20),
+    ("Super Fund USI", 20),
+    ("Super Member Number", 18),
+]
+
+_AU_STATES = ("NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT")
+_STATE_VALIDATION_FORMULA = '"' + ",".join(_AU_STATES) + '"'
+
+# Cached bytes of the generated employee template (static content)
+_template_bytes: bytes | None = None
+
 
 def _format_pay_run_summary(pay_run: dict) -> dict:
     """Format a pay run for summary display."""
@@ -435,10 +463,17 @@ def _format_pay_run_summary(pay_run: dict) -> dict:
     }
 
 
-def _generate_employee_template():
-    """Generate an Excel template file on-the-fly."""
-    from io import BytesIO
+def _generate_employee_template() -> BytesIO:
+    """Return the Excel template, building it on first use."""
+    global _template_bytes
+
+    if _template_bytes is None:
+        _template_bytes = _build_employee_template()
+    return BytesIO(_template_bytes)
+
 
+def _build_employee_template() -> bytes:
+    """Build the Excel template workbook and return its bytes."""
     try:
         import openpyxl
         from openpyxl.utils import get_column_letter
@@ -449,72 +484,30 @@ def _generate_employee_template():
     ws = wb.active
     ws.title = "Employees"
 
-    # Headers
-    headers = [
-        "First Name",
-        "Last Name",
-        "Date of Birth",
-        "Email",
-        "Phone",
-        "Address Line 1",
-        "City",
-        "State",
-        "Postcode",
-        "Start Date",
-        "Job Title",
-        "TFN",
-        "Bank BSB",
-        "Bank Account Number",
-        "Bank Account Name",
-        "Super Fund USI",
-        "Super Member Number",
-    ]
+    header_font = openpyxl.styles.Font(bold=True)
+    example_font = openpyxl.styles.Font(color="FF808080", italic=True)
 
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = openpyxl.styles.Font(bold=True)
-
-    # Set column widths
-    column_widths = {
-        "First Name": 15,
-        "Last Name": 15,
-        "Date of Birth": 14,
-        "Email": 25,
-        "Phone": 15,
-        "Address Line 1": 25,
-        "City": 15,
-        "State": 8,
-        "Postcode": 10,
-        "Start Date": 14,
-        "Job Title": 20,
-        "TFN": 12,
-        "Bank BSB": 10,
-        "Bank Account Number": 18,
-        "Bank Account Name": 20,
-        "Super Fund USI": 20,
-        "Super Member Number": 18,
-    }
+    headers = [header for header, _ in _TEMPLATE_COLUMNS]
+    col_letters = [get_column_letter(col) for col in range(1, len(headers) + 1)]
 
-    for col, header in enumerate(headers, 1):
-        ws.column_dimensions[get_column_letter(col)].width = column_widths.get(
-            header, 15
-        )
+    for col, (header, width) in enumerate(_TEMPLATE_COLUMNS, 1):
+        cell = ws.cell(row=1, column=col, value=header)
+        cell.font = header_font
+        ws.column_dimensions[col_letters[col - 1]].width = width
 
     # Add data validation for State column
     from openpyxl.worksheet.datavalidation import DataValidation
 
-    state_col = headers.index("State") + 1
     state_validation = DataValidation(
         type="list",
-        formula1='"NSW,VIC,QLD,SA,WA,TAS,NT,ACT"',
+        formula1=_STATE_VALIDATION_FORMULA,
         allow_blank=True,
+        error="Please select a valid Australian state",
+        errorTitle="Invalid State",
     )
-    state_validation.error = "Please select a valid Australian state"
-    state_validation.errorTitle = "Invalid State"
     ws.add_data_validation(state_validation)
-    state_validation.add(
-        f"{get_column_letter(state_col)}2:{get_column_letter(state_col)}100"
-    )
+    state_letter = col_letters[headers.index("State")]
+    state_validation.add(f"{state_letter}2:{state_letter}100")
 
     # Add example row (commented out data)
     example_data = [
@@ -539,11 +532,8 @@ def _generate_employee_template():
 
     for col, value in enumerate(example_data, 1):
         cell = ws.cell(row=2, column=col, value=value)
-        cell.font = openpyxl.styles.Font(color="808080", italic=True)
+        cell.font = example_font
 
-    # Save to BytesIO
     output = BytesIO()
     wb.save(output)
-    output.seek(0)
-
-    return output
+    return output.getvalue()
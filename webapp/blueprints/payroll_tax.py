@@ -7,11 +7,12 @@ Endpoints:
 - GET  /payroll-tax/              - Render main page
 - GET  /payroll-tax/api/generate  - Generate payroll tax calculation
 - GET  /payroll-tax/api/download  - Export to Excel
-- GET  /payroll-tax/api/rates     - Get all state rates
+- GET  /payroll-tax/api/rates     - Get all state rates (ETag cached)
 """
 
+import hashlib
+import json
 import logging
-from functools import wraps
 
 from flask import (
     Blueprint,
@@ -20,7 +21,6 @@ from flask import (
     render_template,
     request,
     send_file,
-    session,
 )
 
 from webapp.app_services.payroll_tax_service import (
@@ -28,37 +28,57 @@ from webapp.app_services.payroll_tax_service import (
     export_to_excel,
     get_all_state_rates,
 )
+from webapp.blueprints._auth import login_required_or_testing as _login_required
+from webapp.blueprints._downloads import XLSX_MIMETYPE, new_export_buffer
+from webapp.blueprints._responses import error_body, error_response
+from webapp.blueprints._session_utils import (
+    get_xero_credentials as _get_xero_credentials,
+)
+from webapp.services.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 payroll_tax_bp = Blueprint("payroll_tax", __name__, url_prefix="/payroll-tax")
 
+# Fixed error bodies, serialized once
+_ERR_XERO_NOT_CONNECTED = error_body("Xero not connected")
+_ERR_DATES_REQUIRED = error_body("from_date and to_date are required")
+_ERR_STATE_REQUIRED = error_body("state is required")
+_ERR_DATES_AND_STATE_REQUIRED = error_body("from_date, to_date and state are required")
+_ERR_CALCULATE_FAILED = error_body("Failed to calculate payroll tax")
+_ERR_DOWNLOAD_FAILED = error_body("Failed to download")
+
+# State rates only change with a deploy, so serialize them and tag them once
+_RATES_BODY = json.dumps(
+    {"success": True, "rates": get_all_state_rates()},
+    sort_keys=True,
+    separators=(",", ":"),
+)
+_RATES_ETAG = hashlib.sha256(_RATES_BODY.encode()).hexdigest()[:32]
+_RATES_MAX_AGE = 3600
 
-def _login_required(f):
-    """Require login decorator. Bypassed in testing mode."""
-
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if current_app.config.get("TESTING"):
-            return f(*args, **kwargs)
-        try:
-            from flask_login import current_user
-
-            if not current_user.is_authenticated:
-                return jsonify({"error": "Authentication required"}), 401
-        except (ImportError, AttributeError):
-            pass
-        return f(*args, **kwargs)
+# Recent calculations, so a download right after a preview skips Xero
+_RESULT_CACHE_TTL_SECONDS = 300
+_result_cache = TTLCache(ttl_seconds=_RESULT_CACHE_TTL_SECONDS)
 
-    return decorated_function
 
+def _compute_payroll_tax(
+    access_token: str, tenant_id: str, from_date: str, to_date: str, state: str
+) -> dict:
+    """Calculate payroll tax, reusing a recent successful result.
 
-def _get_xero_credentials() -> tuple[str | None, str | None]:
-    """Get Xero access token and tenant ID from session."""
-    conn = session.get("xero_connection", {})
-    access_token = conn.get("access_token") or session.get("xero_access_token")
-    tenant_id = conn.get("tenant_id") or session.get("xero_tenant_id")
-    return access_token, tenant_id
+    The access token is not part of the cache key: it rotates often and
+    does not change the result for a tenant.
+    """
+    key = (tenant_id, from_date, to_date, state)
+    result = _result_cache.get(key)
+    if result is None:
+        result = calculate_payroll_tax(
+            access_token, tenant_id, from_date, to_date, state
+        )
+        if result.get("success"):
+            _result_cache.set(key, result)
+    return result
 
 
 @payroll_tax_bp.route("/")
@@ -75,26 +95,27 @@ def api_generate():
     access_token, tenant_id = _get_xero_credentials()
 
     if not access_token or not tenant_id:
-        return jsonify({"error": "Xero not connected"}), 400
+        return error_response(_ERR_XERO_NOT_CONNECTED, 400)
 
-    from_date = request.args.get("from_date")
-    to_date = request.args.get("to_date")
-    state = request.args.get("state")
+    args = request.args
+    from_date = args.get("from_date")
+    to_date = args.get("to_date")
+    state = args.get("state")
 
     if not from_date or not to_date:
-        return jsonify({"error": "from_date and to_date are required"}), 400
+        return error_response(_ERR_DATES_REQUIRED, 400)
 
     if not state:
-        return jsonify({"error": "state is required"}), 400
+        return error_response(_ERR_STATE_REQUIRED, 400)
 
     try:
-        result = calculate_payroll_tax(
+        result = _compute_payroll_tax(
             access_token, tenant_id, from_date, to_date, state
         )
         return jsonify(result)
     except Exception as e:
         logger.exception("Error calculating payroll tax: %s", e)
-        return jsonify({"error": "Failed to calculate payroll tax"}), 500
+        return error_response(_ERR_CALCULATE_FAILED, 500)
 
 
 @payroll_tax_bp.route("/api/download", methods=["GET"])
@@ -104,39 +125,44 @@ def api_download():
     access_token, tenant_id = _get_xero_credentials()
 
     if not access_token or not tenant_id:
-        return jsonify({"error": "Xero not connected"}), 400
+        return error_response(_ERR_XERO_NOT_CONNECTED, 400)
 
-    from_date = request.args.get("from_date")
-    to_date = request.args.get("to_date")
-    state = request.args.get("state")
+    args = request.args
+    from_date = args.get("from_date")
+    to_date = args.get("to_date")
+    state = args.get("state")
 
     if not from_date or not to_date or not state:
-        return jsonify({"error": "from_date, to_date and state are required"}), 400
+        return error_response(_ERR_DATES_AND_STATE_REQUIRED, 400)
 
     try:
-        result = calculate_payroll_tax(
+        result = _compute_payroll_tax(
             access_token, tenant_id, from_date, to_date, state
         )
 
         if not result.get("success"):
             return jsonify({"error": result.get("error", "Generation failed")}), 500
 
-        excel_file = export_to_excel(result)
+        excel_file = export_to_excel(result, new_export_buffer())
 
         filename = f"payroll_tax_{state}_{from_date}_to_{to_date}.xlsx"
         return send_file(
             excel_file,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            mimetype=XLSX_MIMETYPE,
             as_attachment=True,
             download_name=filename,
         )
     except Exception as e:
         logger.exception("Error downloading payroll tax: %s", e)
-        return jsonify({"error": "Failed to download"}), 500
+        return error_response(_ERR_DOWNLOAD_FAILED, 500)
 
 
 @payroll_tax_bp.route("/api/rates", methods=["GET"])
 @_login_required
 def api_rates():
-    """Get all state payroll tax rates."""
-    return jsonify({"success": True, "rates": get_all_state_rates()})
+    """Get all state payroll tax rates (supports If-None-Match)."""
+    response = current_app.response_class(_RATES_BODY, mimetype="application/json")
+    response.set_etag(_RATES_ETAG)
+    response.cache_control.private = True
+    response.cache_control.max_age = _RATES_MAX_AGE
+    return response.make_conditional(request)
@@ -20,12 +20,29 @@ import logging
 from flask import Blueprint, jsonify, render_template, request, session
 from flask_login import current_user, login_required
 
+from webapp.blueprints._responses import error_body, error_response
 from webapp.models import ChecklistProgress, User, db
+from webapp.services.readiness_checks import ChecklistNotFoundError
 
 logger = logging.getLogger(__name__)
 
 readiness_bp = Blueprint("readiness", __name__)
 
+# Fixed error bodies, serialized once
+_ERR_NO_TEAM = error_body("No team found")
+_ERR_JSON_BODY_REQUIRED = error_body("JSON body required")
+_ERR_INVALID_CHECKLIST_TYPE = error_body("checklist_type must be 'month_end' or 'eofy'")
+_ERR_PERIOD_REQUIRED = error_body("period is required")
+_ERR_PROGRESS_ID_REQUIRED = error_body("checklist_progress_id is required")
+_ERR_CHECKLIST_NOT_FOUND = error_body("Checklist not found")
+_ERR_GET_CHECKLIST_FAILED = error_body("Failed to get checklist")
+_ERR_UPDATE_CHECKLIST_FAILED = error_body("Failed to update checklist")
+_ERR_GET_HISTORY_FAILED = error_body("Failed to get history")
+_ERR_GET_STATUS_FAILED = error_body("Failed to get status")
+_ERR_GET_TEAM_MEMBERS_FAILED = error_body("Failed to get team members")
+_ERR_ADD_COMMENT_FAILED = error_body("Failed to add comment")
+_ERR_GET_COMMENTS_FAILED = error_body("Failed to get comments")
+
 
 def _parse_int_query_arg(
     name: str,
@@ -35,9 +52,11 @@ def _parse_int_query_arg(
     maximum: int | None = None,
 ) -> int:
     """Parse and validate integer query arguments."""
-    raw = request.args.get(name, None)
-    if raw in (None, ""):
+    raw = request.args.get(name)
+    if not raw:
         value = default
+    elif raw.isdecimal():
+        value = int(raw)
     else:
         try:
             value = int(raw)
@@ -51,6 +70,21 @@ def _parse_int_query_arg(
     return value
 
 
+def _checklist_items_error(items: object) -> str | None:
+    """Return an error message if the checklist items payload is malformed."""
+    if not items or not isinstance(items, list):
+        return "items list is required"
+    for item in items:
+        if not isinstance(item, dict):
+            return "each item must be an object"
+        key = item.get("key")
+        if not key or not isinstance(key, str):
+            return "each item requires a string key"
+        if not isinstance(item.get("completed", False), bool):
+            return "item completed must be a boolean"
+    return None
+
+
 def _get_tenant() -> tuple[str | None, str | None]:
     """Read tenant_id / tenant_name from session's Xero connection."""
     conn: dict = session.get("xero_connection", {})
@@ -82,7 +116,7 @@ def api_get_checklist():
     try:
         team_id = current_user.team_id
         if not team_id:
-            return jsonify({"error": "No team found"}), 400
+            return error_response(_ERR_NO_TEAM, 400)
 
         tenant_id, tenant_name = _get_tenant()
 
@@ -102,8 +136,8 @@ def api_get_checklist():
         )
 
     except Exception as e:
-        logger.exception(f"Error getting checklist: {e}")
-        return jsonify({"error": "Failed to get checklist"}), 500
+        logger.exception("Error getting checklist: %s", e)
+        return error_response(_ERR_GET_CHECKLIST_FAILED, 500)
 
 
 @readiness_bp.route("/api/readiness/checklist", methods=["PUT"])
@@ -120,26 +154,24 @@ def api_update_checklist():
     try:
         team_id = current_user.team_id
         if not team_id:
-            return jsonify({"error": "No team found"}), 400
+            return error_response(_ERR_NO_TEAM, 400)
 
         data = request.get_json(silent=True)
         if not data:
-            return jsonify({"error": "JSON body required"}), 400
+            return error_response(_ERR_JSON_BODY_REQUIRED, 400)
 
         checklist_type = data.get("checklist_type")
         if checklist_type not in ("month_end", "eofy"):
-            return (
-                jsonify({"error": "checklist_type must be 'month_end' or 'eofy'"}),
-                400,
-            )
+            return error_response(_ERR_INVALID_CHECKLIST_TYPE, 400)
 
         period = data.get("period")
         if not period:
-            return jsonify({"error": "period is required"}), 400
+            return error_response(_ERR_PERIOD_REQUIRED, 400)
 
         items = data.get("items")
-        if not items or not isinstance(items, list):
-            return jsonify({"error": "items list is required"}), 400
+        items_error = _checklist_items_error(items)
+        if items_error:
+            return jsonify({"error": items_error}), 400
 
         tenant_id, tenant_name = _get_tenant()
 
@@ -164,8 +196,8 @@ def api_update_checklist():
 
     except Exception as e:
         db.session.rollback()
-        logger.exception(f"Error updating checklist: {e}")
-        return jsonify({"error": "Failed to update checklist"}), 500
+        logger.exception("Error updating checklist: %s", e)
+        return error_response(_ERR_UPDATE_CHECKLIST_FAILED, 500)
 
 
 @readiness_bp.route("/api/readiness/history", methods=["GET"])
@@ -194,8 +226,8 @@ def api_get_history():
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.exception(f"Error getting history: {e}")
-        return jsonify({"error": "Failed to get history"}), 500
+        logger.exception("Error getting history: %s", e)
+        return error_response(_ERR_GET_HISTORY_FAILED, 500)
 
 
 @readiness_bp.route("/api/readiness/status", methods=["GET"])
@@ -205,33 +237,19 @@ def api_get_status():
     try:
         team_id = current_user.team_id
         if not team_id:
-            return jsonify({"error": "No team found"}), 400
+            return error_response(_ERR_NO_TEAM, 400)
 
-        tenant_id, tenant_name = _get_tenant()
+        tenant_id, _ = _get_tenant()
 
-        from webapp.services.readiness_checks import get_current_checklist
+        from webapp.services.readiness_checks import get_current_checklist_summary
 
-        checklist = get_current_checklist(
-            team_id,
-            tenant_id=tenant_id,
-            tenant_name=tenant_name,
-        )
+        summary = get_current_checklist_summary(team_id, tenant_id=tenant_id)
 
-        return jsonify(
-            {
-                "success": True,
-                "checklist_type": checklist["checklist_type"],
-                "period": checklist["period"],
-                "completed": checklist["completed"],
-                "total": checklist["total"],
-                "percentage": checklist["percentage"],
-                "is_complete": checklist["is_complete"],
-            }
-        )
+        return jsonify({"success": True, **summary})
 
     except Exception as e:
-        logger.exception(f"Error getting status: {e}")
-        return jsonify({"error": "Failed to get status"}), 500
+        logger.exception("Error getting status: %s", e)
+        return error_response(_ERR_GET_STATUS_FAILED, 500)
 
 
 # -----------------------------------------------------------------------
@@ -248,24 +266,28 @@ def api_team_members():
         if not team_id:
             return jsonify({"members": []})
 
-        members = User.query.filter_by(team_id=team_id, is_active=True).all()
+        rows = (
+            db.session.query(User.id, User.name, User.email, User.role)
+            .filter_by(team_id=team_id, is_active=True)
+            .all()
+        )
         return jsonify(
             {
                 "members": [
                     {
-                        "user_id": m.id,
-                        "full_name": m.name,
-                        "email": m.email,
-                        "role": m.role,
+                        "user_id": user_id,
+                        "full_name": name,
+                        "email": email,
+                        "role": role,
                     }
-                    for m in members
+                    for user_id, name, email, role in rows
                 ]
             }
         )
 
     except Exception as e:
-        logger.exception(f"Error getting team members: {e}")
-        return jsonify({"error": "Failed to get team members"}), 500
+        logger.exception("Error getting team members: %s", e)
+        return error_response(_ERR_GET_TEAM_MEMBERS_FAILED, 500)
 
 
 # -----------------------------------------------------------------------
@@ -297,51 +319,43 @@ def api_add_comment():
     try:
         team_id = current_user.team_id
         if not team_id:
-            return jsonify({"error": "No team found"}), 400
+            return error_response(_ERR_NO_TEAM, 400)
 
         data = request.get_json(silent=True)
         if not data:
-            return jsonify({"error": "JSON body required"}), 400
+            return error_response(_ERR_JSON_BODY_REQUIRED, 400)
 
         checklist_progress_id = data.get("checklist_progress_id")
         if not checklist_progress_id:
-            return jsonify({"error": "checklist_progress_id is required"}), 400
-
-        # IDOR check: checklist must belong to user's team
-        progress = _validate_checklist_ownership(checklist_progress_id, team_id)
-        if not progress:
-            return jsonify({"error": "Checklist not found"}), 404
+            return error_response(_ERR_PROGRESS_ID_REQUIRED, 400)
 
         item_key = data.get("item_key", "")
         content = data.get("content", "")
         assigned_to = data.get("assigned_to") or None
 
-        # Validate assigned_to is a team member
-        if assigned_to:
-            assignee = User.query.filter_by(
-                id=assigned_to, team_id=team_id, is_active=True
-            ).first()
-            if not assignee:
-                return jsonify({"error": "Assigned user is not a team member"}), 400
-
         from webapp.services.readiness_checks import add_checklist_comment
 
+        # IDOR check: the insert only succeeds if the checklist (and any
+        # assignee) belongs to the user's team
         comment = add_checklist_comment(
             checklist_progress_id=checklist_progress_id,
             item_key=item_key,
             user_id=current_user.id,
             content=content,
             assigned_to=assigned_to,
+            team_id=team_id,
         )
 
         return jsonify({"success": True, "comment": comment.to_dict()})
 
+    except ChecklistNotFoundError:
+        return error_response(_ERR_CHECKLIST_NOT_FOUND, 404)
     except ValueError as ve:
         return jsonify({"error": str(ve)}), 400
     except Exception as e:
         db.session.rollback()
-        logger.exception(f"Error adding comment: {e}")
-        return jsonify({"error": "Failed to add comment"}), 500
+        logger.exception("Error adding comment: %s", e)
+        return error_response(_ERR_ADD_COMMENT_FAILED, 500)
 
 
 @readiness_bp.route("/api/readiness/comments", methods=["GET"])
@@ -356,16 +370,16 @@ def api_get_comments():
     try:
         team_id = current_user.team_id
         if not team_id:
-            return jsonify({"error": "No team found"}), 400
+            return error_response(_ERR_NO_TEAM, 400)
 
         checklist_progress_id = request.args.get("checklist_progress_id")
         if not checklist_progress_id:
-            return jsonify({"error": "checklist_progress_id is required"}), 400
+            return error_response(_ERR_PROGRESS_ID_REQUIRED, 400)
 
         # IDOR check
         progress = _validate_checklist_ownership(checklist_progress_id, team_id)
         if not progress:
-            return jsonify({"error": "Checklist not found"}), 404
+            return error_response(_ERR_CHECKLIST_NOT_FOUND, 404)
 
         from webapp.services.readiness_checks import get_checklist_comments
 
@@ -374,5 +388,5 @@ def api_get_comments():
         return jsonify({"success": True, "comments": comments})
 
     except Exception as e:
-        logger.exception(f"Error getting comments: {e}")
-        return jsonify({"error": "Failed to get comments"}), 500
+        logger.exception("Error getting comments: %s", e)
+        return error_response(_ERR_GET_COMMENTS_FAILED, 500)
@@ -15,6 +15,7 @@ from flask import Blueprint, jsonify, request
 from flask_login import current_user, login_required
 
 from webapp.models import db
+from webapp.services.bas_deadlines import get_deadline_status, get_reminders_for_user
 
 logger = logging.getLogger(__name__)
 
@@ -33,14 +34,10 @@ def api_get_bas_reminders():
         - status: Overall status
     """
     try:
-        from webapp.services.bas_deadlines import (
-            get_deadline_status,
-            get_reminders_for_user,
-        )
-
         reminders = get_reminders_for_user(current_user.id)
 
-        # Serialize date objects
+        # The app's JSON provider renders bare dates as HTTP dates; the
+        # reminder UI expects ISO dates, so convert them here.
         for r in reminders:
             if "period_end" in r:
                 r["period_end"] = r["period_end"].isoformat()
@@ -13,13 +13,23 @@ Endpoints:
 """
 
 import logging
+import secrets
 from datetime import timedelta
 
 from flask import Blueprint, jsonify, render_template, request
 from flask_bcrypt import generate_password_hash
 from flask_login import current_user, login_required
-
-from webapp.models import AccountantShare, Team, User, db
+from sqlalchemy import delete
+from sqlalchemy.orm import selectinload
+
+from webapp.models import (
+    AccountantShare,
+    Team,
+    User,
+    db,
+    generate_uuid,
+    raiseload_if_enabled,
+)
 from webapp.time_utils import utcnow
 from webapp.utils import sanitize_input, validate_email
 
@@ -27,6 +37,28 @@ logger = logging.getLogger(__name__)
 
 sharing_bp = Blueprint("sharing", __name__)
 
+# Hash of a random secret that is never stored or shown anywhere
+_unusable_password_hash: str | None = None
+# bcrypt's minimum cost factor
+_PLACEHOLDER_HASH_ROUNDS = 4
+
+
+def _get_unusable_password_hash() -> str:
+    """Return a bcrypt hash no password is known to match.
+
+    Invited accountants must reset their password before logging in, so
+    their placeholder hash only needs to be unguessable. Generating it once
+    per process keeps bcrypt's deliberate cost off every invite request.
+    The secret is 256 random bits and never persisted, so the minimum work
+    factor is enough; extra rounds only slow down the first invite.
+    """
+    global _unusable_password_hash
+    if _unusable_password_hash is None:
+        _unusable_password_hash = generate_password_hash(
+            secrets.token_urlsafe(32), rounds=_PLACEHOLDER_HASH_ROUNDS
+        ).decode("utf-8")
+    return _unusable_password_hash
+
 
 def _require_owner_or_admin():
     """Check that current user is owner or admin. Returns error response or None."""
@@ -87,35 +119,33 @@ def api_invite_accountant():
 
         # Find or create accountant user
         accountant = User.query.filter_by(email=email).first()
-        if not accountant:
+        if accountant:
+            # Check for existing share
+            existing = AccountantShare.query.filter_by(
+                team_id=team_id, accountant_user_id=accountant.id
+            ).first()
+            if existing:
+                return (
+                    jsonify(
+                        {"error": "This accountant already has access to your team"}
+                    ),
+                    409,
+                )
+        else:
             if not name:
                 return jsonify({"error": "Name is required for new accountant"}), 400
 
-            # Create accountant account with a random password (they'll need to reset)
-            import secrets
-
-            temp_password = secrets.token_urlsafe(16)
-            pw_hash = generate_password_hash(temp_password).decode("utf-8")
-
+            # Create accountant account with an unusable password (they'll need to reset).
+            # Assigning the ID up front lets the user and share insert in one
+            # flush at commit, with no separate flush to obtain it.
             accountant = User(
+                id=generate_uuid(),
                 email=email,
-                password_hash=pw_hash,
+                password_hash=_get_unusable_password_hash(),
                 name=name,
                 role="accountant",
                 is_active=True,
             )
-            db.session.add(accountant)
-            db.session.flush()
-
-        # Check for existing share
-        existing = AccountantShare.query.filter_by(
-            team_id=team_id, accountant_user_id=accountant.id
-        ).first()
-        if existing:
-            return (
-                jsonify({"error": "This accountant already has access to your team"}),
-                409,
-            )
 
         expires_at = None
         if expires_days and int(expires_days) > 0:
@@ -128,7 +158,7 @@ def api_invite_accountant():
             access_level="read_only",
             expires_at=expires_at,
         )
-        db.session.add(share)
+        db.session.add_all([accountant, share])
         db.session.commit()
 
         return jsonify({"success": True, "share": share.to_dict()}), 201
@@ -148,13 +178,20 @@ def api_list_invites():
         if not team_id:
             return jsonify({"success": True, "shares": []})
 
-        shares = AccountantShare.query.filter_by(team_id=team_id).all()
-        return jsonify(
-            {
-                "success": True,
-                "shares": [s.to_dict() for s in shares if not s.is_expired()],
-            }
+        # Filter and serialize against one instant so both agree on expiry
+        now = utcnow()
+        # to_dict() reads the accountant; load them all in one extra query and
+        # (in tests) fail loudly if it ever touches another relationship
+        shares = (
+            AccountantShare.query.options(
+                selectinload(AccountantShare.accountant), *raiseload_if_enabled()
+            )
+            .filter(
+                AccountantShare.team_id == team_id, AccountantShare.not_expired(now)
+            )
+            .all()
         )
+        return jsonify({"success": True, "shares": [s.to_dict(now) for s in shares]})
 
     except Exception as e:
         logger.exception(f"Error listing invites: {e}")
@@ -170,14 +207,18 @@ def api_revoke_invite(share_id: str):
         if error:
             return error
 
-        share = db.session.get(AccountantShare, share_id)
-        if not share:
-            return jsonify({"error": "Share not found"}), 404
-
-        if share.team_id != current_user.team_id:
+        # Delete in one statement; only a miss needs a lookup to pick the error
+        result = db.session.execute(
+            delete(AccountantShare).where(
+                AccountantShare.id == share_id,
+                AccountantShare.team_id == current_user.team_id,
+            )
+        )
+        if result.rowcount == 0:  # type: ignore[attr-defined]
+            if db.session.get(AccountantShare, share_id) is None:
+                return jsonify({"error": "Share not found"}), 404
             return jsonify({"error": "Access denied"}), 403
 
-        db.session.delete(share)
         db.session.commit()
 
         return jsonify({"success": True})
@@ -193,29 +234,31 @@ def api_revoke_invite(share_id: str):
 def api_shared_with_me():
     """List teams shared with the current accountant user."""
     try:
-        shares = AccountantShare.query.filter_by(
-            accountant_user_id=current_user.id
-        ).all()
-
-        result = []
-        for share in shares:
-            if share.is_expired():
-                continue
-            team = db.session.get(Team, share.team_id)
-            if team:
-                result.append(
-                    {
-                        "share_id": share.id,
-                        "team": team.to_dict(),
-                        "access_level": share.access_level,
-                        "shared_at": (
-                            share.created_at.isoformat() if share.created_at else None
-                        ),
-                        "expires_at": (
-                            share.expires_at.isoformat() if share.expires_at else None
-                        ),
-                    }
-                )
+        # One query for the shares and their teams instead of a lookup per share
+        rows = (
+            db.session.query(AccountantShare, Team)
+            .join(Team, Team.id == AccountantShare.team_id)
+            .filter(
+                AccountantShare.accountant_user_id == current_user.id,
+                AccountantShare.not_expired(),
+            )
+            .all()
+        )
+
+        result = [
+            {
+                "share_id": share.id,
+                "team": team.to_dict(),
+                "access_level": share.access_level,
+                "shared_at": (
+                    share.created_at.isoformat() if share.created_at else None
+                ),
+                "expires_at": (
+                    share.expires_at.isoformat() if share.expires_at else None
+                ),
+            }
+            for share, team in rows
+        ]
 
         return jsonify({"success": True, "shared_teams": result})
 
@@ -6,6 +6,7 @@ Provides routes for managing custom skills:
 - GET /skills/<id> - Skill detail page
 - POST /api/skills/upload - Upload SKILL.md file
 - POST /api/skills/create - Create via form
+- POST /api/skills/batch - Get several skills with content
 - PUT /api/skills/<id> - Update skill
 - DELETE /api/skills/<id> - Delete skill
 - POST /api/skills/<id>/share - Promote to team
@@ -13,9 +14,11 @@ Provides routes for managing custom skills:
 
 import logging
 import re
-import uuid
 
-from flask import Blueprint, jsonify, render_template, request
+from flask import Blueprint, current_app, jsonify, render_template, request
+
+from webapp.blueprints._responses import conditional_json_response, json_etag
+from webapp.services.ttl_cache import TTLCache
 
 # Support both local and deployed import paths
 try:
@@ -65,9 +68,29 @@ def rate_limit(limit_string):
 # Maximum file size for SKILL.md (100KB)
 MAX_SKILL_FILE_SIZE = 100 * 1024
 
+# Allowance for multipart boundaries and the scope field in an upload body
+_UPLOAD_OVERHEAD_BYTES = 8 * 1024
+
 # Filename validation pattern
 SAFE_FILENAME_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*\.md$")
 
+# Canonical hyphenated UUID, as produced by str(uuid.uuid4()) for skill IDs
+_UUID_MATCH = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+).match
+
+# Encoded skill listing bodies keyed by (user_id, team_id, version). The
+# version comes from the database, so a change made through any worker makes
+# every worker miss; superseded entries age out with the TTL.
+_SKILL_LIST_CACHE_TTL_SECONDS = 60
+_skill_list_cache = TTLCache(ttl_seconds=_SKILL_LIST_CACHE_TTL_SECONDS)
+
+# Listing groups, in response order
+_SKILL_SOURCES = ("private", "shared", "public")
+
+# Maximum number of skill IDs accepted by the batch endpoint
+MAX_BATCH_SKILL_IDS = 50
+
 
 def get_current_user():
     """Get current authenticated user."""
@@ -112,13 +135,21 @@ def login_required(f):
     return decorated_function
 
 
+def _content_too_large(content: str) -> bool:
+    """Check the UTF-8 size of content, skipping the encode for short text."""
+    # A character encodes to at most 4 bytes, and to at least 1
+    if len(content) * 4 <= MAX_SKILL_FILE_SIZE:
+        return False
+    if len(content) > MAX_SKILL_FILE_SIZE:
+        return True
+    return len(content.encode("utf-8")) > MAX_SKILL_FILE_SIZE
+
+
 def validate_uuid(value: str) -> bool:
     """Validate UUID format."""
-    try:
-        uuid.UUID(value)
-        return True
-    except (ValueError, AttributeError):
+    if not isinstance(value, str):
         return False
+    return _UUID_MATCH(value) is not None
 
 
 # =============================================================================
@@ -191,7 +222,10 @@ def api_list_skills():
     """
     List all skills for the current user.
 
-    Returns skills grouped by source: private, shared, public.
+    Returns skills grouped by source: private, shared, public. The ETag is
+    built from the database version of the user's skills and the deployed
+    public skills, so every worker agrees on it and a matching If-None-Match
+    gets a 304 without assembling the listing.
     """
     try:
         user = get_current_user()
@@ -202,16 +236,29 @@ def api_list_skills():
         team_id = get_user_team_id()
 
         registry = get_registry()
-        all_skills = registry.discover_all_skills(user_id, team_id)
-
-        # Convert to serializable format
-        result = {
-            "private": [s.to_dict() for s in all_skills["private"]],
-            "shared": [s.to_dict() for s in all_skills["shared"]],
-            "public": [s.to_dict() for s in all_skills["public"]],
-        }
+        version = get_custom_skill_service().get_skill_list_version(user_id, team_id)
+        public_version = sorted(
+            (meta.name, meta.version) for meta in registry.discover_skills()
+        )
+        etag = json_etag(repr((user_id, team_id, version, public_version)))
+        if request.if_none_match.contains_weak(etag):
+            # make_conditional turns this into an empty 304
+            return conditional_json_response("", etag)
+
+        cache_key = (user_id, team_id, version)
+        body = _skill_list_cache.get(cache_key)
+        if body is None:
+            all_skills = registry.discover_all_skills(user_id, team_id)
+
+            # Convert to serializable format
+            result = {
+                source: [skill.to_dict() for skill in all_skills[source]]
+                for source in _SKILL_SOURCES
+            }
+            body = current_app.json.dumps({"success": True, "skills": result})
+            _skill_list_cache.set(cache_key, body)
 
-        return jsonify({"success": True, "skills": result})
+        return conditional_json_response(body, etag)
 
     except Exception as e:
         logger.error(f"Error listing skills: {e}")
@@ -256,6 +303,64 @@ def api_get_skill(skill_id: str):
         return jsonify({"error": "Failed to get skill"}), 500
 
 
+@skills_bp.route("/api/skills/batch", methods=["POST"])
+@rate_limit("100 per hour")
+@login_required
+def api_get_skills_batch():
+    """
+    Get several custom skills by ID, including content.
+
+    Request (JSON):
+        - ids: List of skill IDs (max 50)
+
+    Response:
+        - skills: Skill dicts keyed by ID; unknown or inaccessible IDs are omitted
+
+    Only the caller's private skills and their team's shared skills are
+    returned. Content missing from the cache is downloaded concurrently.
+    """
+    try:
+        user = get_current_user()
+        if not user:
+            return jsonify({"error": "Authentication required"}), 401
+
+        data = request.get_json(silent=True)
+        if not data:
+            return jsonify({"error": "JSON body required"}), 400
+
+        skill_ids = data.get("ids")
+        if not isinstance(skill_ids, list) or not skill_ids:
+            return jsonify({"error": "ids must be a non-empty list"}), 400
+        if len(skill_ids) > MAX_BATCH_SKILL_IDS:
+            return (
+                jsonify({"error": f"At most {MAX_BATCH_SKILL_IDS} ids per request"}),
+                400,
+            )
+        if not all(validate_uuid(skill_id) for skill_id in skill_ids):
+            return jsonify({"error": "Invalid skill ID"}), 400
+
+        team_id = get_user_team_id()
+        service = get_custom_skill_service()
+        skills = [
+            skill
+            for skill in service.get_skills(list(dict.fromkeys(skill_ids)))
+            if (skill.scope == "private" and skill.user_id == user.id)
+            or (skill.scope == "shared" and team_id and skill.team_id == team_id)
+        ]
+        contents = service.get_skills_content(skills)
+        result = {}
+        for skill in skills:
+            skill_dict = skill.to_dict()
+            skill_dict["content"] = contents[skill.id]
+            result[skill.id] = skill_dict
+
+        return jsonify({"success": True, "skills": result})
+
+    except Exception as e:
+        logger.error(f"Error getting skills batch: {e}")
+        return jsonify({"error": "Failed to get skills"}), 500
+
+
 @skills_bp.route("/api/skills/upload", methods=["POST"])
 @rate_limit("20 per hour")
 @login_required
@@ -272,6 +377,20 @@ def api_upload_skill():
         if not user:
             return jsonify({"error": "Authentication required"}), 401
 
+        # Reject oversized bodies before parsing the multipart form
+        if (
+            request.content_length is not None
+            and request.content_length > MAX_SKILL_FILE_SIZE + _UPLOAD_OVERHEAD_BYTES
+        ):
+            return (
+                jsonify(
+                    {
+                        "error": f"File too large. Maximum size is {MAX_SKILL_FILE_SIZE // 1024}KB"
+                    }
+                ),
+                400,
+            )
+
         # Check for file
         if "file" not in request.files:
             return jsonify({"error": "No file uploaded"}), 400
@@ -284,8 +403,8 @@ def api_upload_skill():
         if not file.filename.lower().endswith(".md"):
             return jsonify({"error": "File must be a Markdown file (.md)"}), 400
 
-        # Read content
-        content = file.read()
+        # Read at most one byte past the limit
+        content = file.stream.read(MAX_SKILL_FILE_SIZE + 1)
 
         # Check size
         if len(content) > MAX_SKILL_FILE_SIZE:
@@ -371,7 +490,7 @@ def api_create_skill():
             return jsonify({"error": "Content is required"}), 400
 
         # Check size
-        if len(content.encode("utf-8")) > MAX_SKILL_FILE_SIZE:
+        if _content_too_large(content):
             return (
                 jsonify(
                     {
@@ -450,7 +569,7 @@ def api_update_skill(skill_id: str):
             return jsonify({"error": "Content is required"}), 400
 
         # Check size
-        if len(content.encode("utf-8")) > MAX_SKILL_FILE_SIZE:
+        if _content_too_large(content):
             return (
                 jsonify(
                     {
@@ -6,58 +6,92 @@ Routes for STP lodgement status and payroll totals tracking.
 Endpoints:
 - GET  /stp-tracker/              - Render main page
 - GET  /stp-tracker/api/generate  - Generate STP summary
+- POST /stp-tracker/api/jobs      - Generate STP summary in the background
 - GET  /stp-tracker/api/download  - Export to Excel
 """
 
 import logging
-from datetime import datetime
-from functools import wraps
+from datetime import date
 
 from flask import (
     Blueprint,
+    Response,
     current_app,
     jsonify,
     render_template,
     request,
     send_file,
-    session,
 )
 
 from webapp.app_services.stp_tracker_service import (
     export_to_excel,
     generate_stp_summary,
 )
+from webapp.blueprints._auth import current_user_id
+from webapp.blueprints._auth import login_required_or_testing as _login_required
+from webapp.blueprints._downloads import XLSX_MIMETYPE, new_export_buffer
+from webapp.blueprints._responses import error_body, error_response
+from webapp.blueprints._session_utils import (
+    get_xero_credentials as _get_xero_credentials,
+)
+from webapp.services.task_queue import TASK_STATUS_SUCCEEDED, get_task, get_task_queue
+from webapp.services.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 stp_tracker_bp = Blueprint("stp_tracker", __name__, url_prefix="/stp-tracker")
 
+# Fixed error bodies, serialized once
+_ERR_XERO_NOT_CONNECTED = error_body("Xero not connected")
+_ERR_INVALID_FINANCIAL_YEAR = error_body("Invalid financial_year")
+_ERR_GENERATE_FAILED = error_body("Failed to generate STP summary")
+_ERR_DOWNLOAD_FAILED = error_body("Failed to download")
+
+# Recent summaries, so a download right after a preview skips Xero
+_RESULT_CACHE_TTL_SECONDS = 300
+_result_cache = TTLCache(ttl_seconds=_RESULT_CACHE_TTL_SECONDS)
+
 
-def _login_required(f):
-    """Require login decorator. Bypassed in testing mode."""
+def _default_financial_year(today: date) -> int:
+    """Financial year containing ``today`` (e.g. 2025 for FY2024-25)."""
+    return today.year + 1 if today.month >= 7 else today.year
 
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if current_app.config.get("TESTING"):
-            return f(*args, **kwargs)
-        try:
-            from flask_login import current_user
 
-            if not current_user.is_authenticated:
-                return jsonify({"error": "Authentication required"}), 401
-        except (ImportError, AttributeError):
-            pass
-        return f(*args, **kwargs)
+def _compute_stp_summary(
+    access_token: str, tenant_id: str, financial_year: int
+) -> dict:
+    """Generate the STP summary, reusing a recent successful result.
+
+    The access token is not part of the cache key: it rotates often and
+    does not change the result for a tenant.
+    """
+    key = (tenant_id, financial_year)
+    result = _result_cache.get(key)
+    if result is None:
+        result = generate_stp_summary(access_token, tenant_id, financial_year)
+        if result.get("success"):
+            _result_cache.set(key, result)
+    return result
 
-    return decorated_function
 
+def _parse_stp_request() -> tuple[tuple[str, str, int], None] | tuple[None, Response]:
+    """Resolve Xero credentials and the requested financial year.
 
-def _get_xero_credentials() -> tuple[str | None, str | None]:
-    """Get Xero access token and tenant ID from session."""
-    conn = session.get("xero_connection", {})
-    access_token = conn.get("access_token") or session.get("xero_access_token")
-    tenant_id = conn.get("tenant_id") or session.get("xero_tenant_id")
-    return access_token, tenant_id
+    Returns ``((access_token, tenant_id, financial_year), None)``, or
+    ``(None, error_response)`` when the request cannot be served.
+    """
+    access_token, tenant_id = _get_xero_credentials()
+    if not access_token or not tenant_id:
+        return None, error_response(_ERR_XERO_NOT_CONNECTED, 400)
+
+    fy = request.args.get("financial_year")
+    if not fy:
+        return (access_token, tenant_id, _default_financial_year(date.today())), None
+
+    try:
+        return (access_token, tenant_id, int(fy)), None
+    except ValueError:
+        return None, error_response(_ERR_INVALID_FINANCIAL_YEAR, 400)
 
 
 @stp_tracker_bp.route("/")
@@ -71,66 +105,79 @@ def index():
 @_login_required
 def api_generate():
     """Generate STP summary for a financial year."""
-    access_token, tenant_id = _get_xero_credentials()
-
-    if not access_token or not tenant_id:
-        return jsonify({"error": "Xero not connected"}), 400
-
-    fy = request.args.get("financial_year")
-
-    if not fy:
-        # Default to current FY
-        now = datetime.now()
-        fy = now.year if now.month >= 7 else now.year
+    params, error = _parse_stp_request()
+    if error is not None:
+        return error
+    access_token, tenant_id, financial_year = params
 
     try:
-        financial_year = int(fy)
-    except ValueError:
-        return jsonify({"error": "Invalid financial_year"}), 400
-
-    try:
-        result = generate_stp_summary(access_token, tenant_id, financial_year)
+        result = _compute_stp_summary(access_token, tenant_id, financial_year)
         return jsonify(result)
     except Exception as e:
         logger.exception("Error generating STP summary: %s", e)
-        return jsonify({"error": "Failed to generate STP summary"}), 500
+        return error_response(_ERR_GENERATE_FAILED, 500)
+
+
+@stp_tracker_bp.route("/api/jobs", methods=["POST"])
+@_login_required
+def api_submit_job():
+    """
+    Queue STP summary generation and return immediately.
+
+    Poll ``GET /api/jobs/<job_id>``; once it has succeeded, its ``result``
+    matches the ``/api/generate`` response. Pass the ``job_id`` to
+    ``/api/download`` to export that result without calling Xero again.
+    """
+    params, error = _parse_stp_request()
+    if error is not None:
+        return error
+
+    job_id = get_task_queue(current_app).submit(
+        "stp_summary", _compute_stp_summary, *params, user_id=current_user_id()
+    )
+    return jsonify({"job_id": job_id}), 202
+
+
+def _finished_job_result(job_id: str, financial_year: int) -> dict | None:
+    """Result of the caller's succeeded STP job for ``financial_year``, if any."""
+    task = get_task(job_id, current_user_id())
+    if task is None or task.kind != "stp_summary":
+        return None
+    if task.status != TASK_STATUS_SUCCEEDED or not task.result:
+        return None
+    label = f"FY{financial_year - 1}-{str(financial_year)[-2:]}"
+    if task.result.get("financial_year") != label:
+        return None
+    return task.result  # type: ignore[no-any-return]
 
 
 @stp_tracker_bp.route("/api/download", methods=["GET"])
 @_login_required
 def api_download():
     """Download STP summary as Excel."""
-    access_token, tenant_id = _get_xero_credentials()
-
-    if not access_token or not tenant_id:
-        return jsonify({"error": "Xero not connected"}), 400
-
-    fy = request.args.get("financial_year")
-
-    if not fy:
-        now = datetime.now()
-        fy = now.year if now.month >= 7 else now.year
+    params, error = _parse_stp_request()
+    if error is not None:
+        return error
+    access_token, tenant_id, financial_year = params
 
     try:
-        financial_year = int(fy)
-    except ValueError:
-        return jsonify({"error": "Invalid financial_year"}), 400
-
-    try:
-        result = generate_stp_summary(access_token, tenant_id, financial_year)
+        job_id = request.args.get("job_id")
+        result = _finished_job_result(job_id, financial_year) if job_id else None
+        if result is None:
+            result = _compute_stp_summary(access_token, tenant_id, financial_year)
 
         if not result.get("success"):
             return jsonify({"error": result.get("error", "Generation failed")}), 500
 
-        excel_file = export_to_excel(result)
+        excel_file = export_to_excel(result, new_export_buffer())
 
         filename = f"stp_summary_fy{financial_year - 1}_{financial_year}.xlsx"
         return send_file(
             excel_file,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            mimetype=XLSX_MIMETYPE,
             as_attachment=True,
             download_name=filename,
         )
     except Exception as e:
         logger.exception("Error downloading STP summary: %s", e)
-        return jsonify({"error": "Failed to download"}), 500
+        return error_response(_ERR_DOWNLOAD_FAILED, 500)
@@ -9,8 +9,13 @@ Endpoints:
 """
 
 import logging
+from functools import wraps
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
+from flask_login import current_user
+
+from webapp.ai.token_tracker import get_token_tracker
+from webapp.blueprints._responses import conditional_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -39,15 +44,11 @@ def rate_limit(limit_string):
 
 def get_current_user():
     """Get current authenticated user."""
-    from flask import current_app
-
     if current_app.config.get("TESTING"):
         return None
 
-    from flask_login import current_user as _current_user
-
-    if _current_user.is_authenticated:
-        return _current_user
+    if current_user.is_authenticated:
+        return current_user
     return None
 
 
@@ -61,18 +62,13 @@ def get_user_team_id():
 
 def login_required(f):
     """Require login decorator. Bypassed in testing mode."""
-    from functools import wraps
-
-    from flask import current_app
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if current_app.config.get("TESTING"):
             return f(*args, **kwargs)
 
-        from flask_login import current_user as _current_user
-
-        if not _current_user.is_authenticated:
+        if not current_user.is_authenticated:
             return {"error": "Authentication required"}, 401
 
         return f(*args, **kwargs)
@@ -106,8 +102,6 @@ def api_get_usage():
         - enforcement_enabled: bool
     """
     try:
-        from webapp.ai.token_tracker import get_token_tracker
-
         tracker = get_token_tracker()
 
         user = get_current_user()
@@ -116,8 +110,6 @@ def api_get_usage():
 
         # In testing mode, provide default response
         if user_id is None and team_id is None:
-            from flask import current_app
-
             if current_app.config.get("TESTING"):
                 return jsonify(
                     {
@@ -138,7 +130,7 @@ def api_get_usage():
 
         usage = tracker.get_usage(user_id, team_id)
 
-        return jsonify(usage)
+        return conditional_json_response(current_app.json.dumps(usage))
 
     except Exception as e:
         logger.exception(f"Error getting usage: {e}")
@@ -158,8 +150,6 @@ def api_check_usage():
         - limit: int - Monthly token limit
     """
     try:
-        from webapp.ai.token_tracker import get_token_tracker
-
         tracker = get_token_tracker()
 
         user = get_current_user()
@@ -168,8 +158,6 @@ def api_check_usage():
 
         # In testing mode, always allow
         if user_id is None and team_id is None:
-            from flask import current_app
-
             if current_app.config.get("TESTING"):
                 return jsonify(
                     {
@@ -179,15 +167,16 @@ def api_check_usage():
                     }
                 )
 
-        allowed, remaining = tracker.check_limit(user_id, team_id)
-        usage = tracker.get_usage(user_id, team_id)
+        allowed, remaining, usage = tracker.check_and_get_usage(user_id, team_id)
 
-        return jsonify(
-            {
-                "allowed": allowed,
-                "remaining": remaining,
-                "limit": usage["current_period"]["limit"],
-            }
+        return conditional_json_response(
+            current_app.json.dumps(
+                {
+                    "allowed": allowed,
+                    "remaining": remaining,
+                    "limit": usage["current_period"]["limit"],
+                }
+            )
         )
 
     except Exception as e:
@@ -0,0 +1,92 @@
+"""gzip compression for text responses (JSON, CSV, HTML)."""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+from collections.abc import Iterable, Iterator
+
+from flask import Flask, Response, request
+
+# Already-compressed formats (xlsx, pdf, images) are left alone on purpose
+DEFAULT_COMPRESS_MIMETYPES = frozenset(
+    {
+        "application/json",
+        "text/csv",
+        "text/html",
+        "text/plain",
+        "text/css",
+        "text/javascript",
+        "application/javascript",
+    }
+)
+DEFAULT_COMPRESS_MIN_SIZE = 500
+DEFAULT_COMPRESS_LEVEL = 6
+
+# wbits for zlib.compressobj that produce a gzip container
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def _gzip_stream(chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    """Compress a streamed body chunk by chunk, flushing after each one."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _should_compress(response: Response, mimetypes: frozenset[str]) -> bool:
+    if response.mimetype not in mimetypes:
+        return False
+    response.vary.add("Accept-Encoding")
+    return not (
+        response.direct_passthrough
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or "Content-Encoding" in response.headers
+        or request.method == "HEAD"
+        or not request.accept_encodings["gzip"]
+    )
+
+
+def init_response_compression(app: Flask) -> None:
+    """Register an ``after_request`` hook that gzips eligible responses.
+
+    Reads ``COMPRESS_ENABLED``, ``COMPRESS_MIMETYPES``, ``COMPRESS_MIN_SIZE``
+    and ``COMPRESS_LEVEL`` from the app config. Streamed responses (such as
+    CSV exports built from generators) are compressed as they are yielded,
+    and strong ETags on compressed responses are weakened.
+    """
+    if not app.config.get("COMPRESS_ENABLED", True):
+        return
+
+    mimetypes = frozenset(
+        app.config.get("COMPRESS_MIMETYPES", DEFAULT_COMPRESS_MIMETYPES)
+    )
+    min_size = int(app.config.get("COMPRESS_MIN_SIZE", DEFAULT_COMPRESS_MIN_SIZE))
+    level = int(app.config.get("COMPRESS_LEVEL", DEFAULT_COMPRESS_LEVEL))
+
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        if not _should_compress(response, mimetypes):
+            return response
+
+        if response.is_streamed:
+            response.response = _gzip_stream(response.iter_encoded(), level)
+            response.headers.pop("Content-Length", None)
+        else:
+            body = response.get_data()
+            if len(body) < min_size:
+                return response
+            response.set_data(gzip.compress(body, compresslevel=level, mtime=0))
+
+        # The gzipped bytes differ from the identity body, so a strong ETag no
+        # longer holds. If-None-Match uses weak comparison, so a client sending
+        # back W/"x" still matches the view's "x" and gets its 304.
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        response.headers["Content-Encoding"] = "gzip"
+        return response
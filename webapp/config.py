@@ -10,6 +10,15 @@ class Config:
     DEBUG = False
     TESTING = False
 
+    # JSON responses: API clients don't need sorted keys or indentation
+    JSON_SORT_KEYS = False
+    JSON_COMPACT = True
+
+    # gzip text responses (JSON, CSV, HTML) above this many bytes
+    COMPRESS_ENABLED = os.environ.get("COMPRESS_ENABLED", "true").lower() == "true"
+    COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", "500"))
+    COMPRESS_LEVEL = int(os.environ.get("COMPRESS_LEVEL", "6"))
+
     # Database
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL", "sqlite:///app.db")
     # Fix for Railway PostgreSQL URL format
@@ -22,6 +31,19 @@ class Config:
         "pool_pre_ping": True,
         "pool_recycle": 300,
     }
+    # Pool sizing applies to server databases; SQLite uses its own pool classes
+    if not SQLALCHEMY_DATABASE_URI.startswith("sqlite"):
+        SQLALCHEMY_ENGINE_OPTIONS.update(
+            pool_size=int(os.environ.get("DB_POOL_SIZE", "10")),
+            max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", "20")),
+            pool_timeout=int(os.environ.get("DB_POOL_TIMEOUT", "30")),
+        )
+    # Make list queries raise on unplanned lazy loads (see raiseload_if_enabled).
+    # On in tests to catch N+1s; off by default so production degrades to a
+    # slower query instead of a 500.
+    SQLALCHEMY_RAISELOAD = (
+        os.environ.get("SQLALCHEMY_RAISELOAD", "false").lower() == "true"
+    )
 
     # Cloudflare R2 Storage
     R2_ACCOUNT_ID = os.environ.get("R2_ACCOUNT_ID")
@@ -101,6 +123,11 @@ class Config:
     BACKGROUND_JOB_RETRY_BACKOFF_SECONDS = float(
         os.environ.get("BACKGROUND_JOB_RETRY_BACKOFF_SECONDS", "2.0")
     )
+    BACKGROUND_JOB_MAX_RETRY_DELAY_SECONDS = float(
+        os.environ.get("BACKGROUND_JOB_MAX_RETRY_DELAY_SECONDS", "60")
+    )
+    # Shared job thread pool; never fewer workers than registered jobs
+    BACKGROUND_JOB_MAX_WORKERS = int(os.environ.get("BACKGROUND_JOB_MAX_WORKERS", "4"))
 
     # Operational alerts
     OP_ALERTS_ENABLED = os.environ.get("OP_ALERTS_ENABLED", "false").lower() == "true"
@@ -127,6 +154,15 @@ class Config:
         os.environ.get("RUNTIME_HEALTH_SNAPSHOT_MAX_ROWS", "2000")
     )
 
+    # Background report generation (see webapp/services/task_queue.py)
+    TASK_QUEUE_MAX_WORKERS = int(os.environ.get("TASK_QUEUE_MAX_WORKERS", "4"))
+    TASK_QUEUE_EAGER = False
+    TASK_RESULT_RETENTION_HOURS = int(
+        os.environ.get("TASK_RESULT_RETENTION_HOURS", "24")
+    )
+    # Unfinished tasks older than this lost their worker and are marked failed
+    TASK_STALE_AFTER_MINUTES = int(os.environ.get("TASK_STALE_AFTER_MINUTES", "30"))
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -145,7 +181,11 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_ENGINE_OPTIONS: dict = {}
+    SQLALCHEMY_RAISELOAD = True
     R2_STORAGE_ENABLED = False
+    # Run background tasks inline so tests see their results immediately
+    TASK_QUEUE_EAGER = True
     # Use mock AI client in tests
     ANTHROPIC_API_KEY = None
     AI_PROVIDER = "anthropic"
@@ -0,0 +1,103 @@
+"""orjson-backed Flask JSON provider and JSON column codec, with stdlib fallback."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# json.dumps arguments that orjson output already satisfies
+_ORJSON_KWARGS = frozenset({"indent", "separators"})
+_ORJSON_OPTIONS = (
+    (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    if orjson is not None
+    else 0
+)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize with orjson, keeping Flask's output semantics.
+
+    Dates and dataclasses are passed through to Flask's ``default`` hook
+    so responses keep the same shape as the stdlib provider. Calls with
+    ``json.dumps`` arguments orjson cannot honour, and payloads orjson
+    rejects (e.g. integers above 64 bits), fall back to the stdlib path.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        indent = kwargs.get("indent")
+        if kwargs.keys() - _ORJSON_KWARGS or indent not in (None, 2):
+            return super().dumps(obj, **kwargs)
+
+        option = _ORJSON_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def init_json_provider(app: Flask) -> None:
+    """Install the orjson provider on the app when orjson is available.
+
+    ``JSON_SORT_KEYS`` and ``JSON_COMPACT`` from the app config are applied
+    to whichever provider ends up installed.
+    """
+    if orjson is None:
+        logger.info("orjson not installed; using the default JSON provider")
+    else:
+        app.json = ORJSONProvider(app)
+    if "JSON_SORT_KEYS" in app.config:
+        app.json.sort_keys = app.config["JSON_SORT_KEYS"]
+    if "JSON_COMPACT" in app.config:
+        app.json.compact = app.config["JSON_COMPACT"]
+
+
+def dumps_column_json(value: Any) -> str:
+    """Serialize a JSON column value with orjson, as SQLAlchemy expects a str.
+
+    Falls back to ``json.dumps`` for values orjson rejects, so anything the
+    default column serializer stored is still accepted.
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(value)
+
+
+def init_column_json(app: Flask) -> None:
+    """Have SQLAlchemy encode and decode JSON columns with orjson.
+
+    Must run before ``db.init_app`` creates the engine. Explicit
+    ``json_serializer``/``json_deserializer`` entries in
+    ``SQLALCHEMY_ENGINE_OPTIONS`` are left alone.
+    """
+    if orjson is None:
+        return
+    # Copy so the config class's shared dict is not mutated
+    options = dict(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    options.setdefault("json_serializer", dumps_column_json)
+    options.setdefault("json_deserializer", orjson.loads)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
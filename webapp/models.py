@@ -1,19 +1,42 @@
 """Database models for Custom Skills Infrastructure."""
 
-import uuid
+import os
 from datetime import datetime, timedelta
 
+from flask import current_app
 from flask_login import UserMixin
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from webapp.time_utils import utcnow
 
 db = SQLAlchemy()
 
+_UUID_VARIANT_NIBBLES = "89ab"
+
 
 def generate_uuid() -> str:
-    """Generate a UUID string."""
-    return str(uuid.uuid4())
+    """Generate a random (version 4) UUID string.
+
+    Formats 16 bytes from ``os.urandom`` directly, in the same form as
+    ``str(uuid.uuid4())`` but without building a ``UUID`` object.
+    """
+    h = os.urandom(16).hex()
+    # Version nibble is 4; the variant nibble keeps two random bits (8-b)
+    variant = _UUID_VARIANT_NIBBLES[int(h[16], 16) & 3]
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
+
+
+def raiseload_if_enabled() -> tuple[LoaderOption, ...]:
+    """Return ``raiseload("*")`` when ``SQLALCHEMY_RAISELOAD`` is set.
+
+    Spread into ``.options()`` on queries whose relationships are all loaded
+    up front, so a stray lazy load fails the tests instead of adding an N+1.
+    """
+    if current_app.config.get("SQLALCHEMY_RAISELOAD"):
+        return (raiseload("*"),)
+    return ()
 
 
 def default_expires_at() -> datetime:
@@ -44,6 +67,8 @@ class User(UserMixin, db.Model):  # type: ignore[name-defined]
 
     team = db.relationship("Team", foreign_keys=[team_id], backref="members")
 
+    __table_args__ = (db.Index("ix_users_team_active", "team_id", "is_active"),)
+
     def to_dict(self) -> dict:
         """Convert user to dictionary for API responses."""
         return {
@@ -118,14 +143,23 @@ class AccountantShare(db.Model):  # type: ignore[name-defined]
         db.UniqueConstraint("team_id", "accountant_user_id", name="uq_team_accountant"),
     )
 
-    def is_expired(self) -> bool:
-        """Check if this share has expired."""
+    def is_expired(self, now: datetime | None = None) -> bool:
+        """Check if this share has expired (as of ``now``, default: current time)."""
         if self.expires_at is None:
             return False
-        return utcnow() > self.expires_at  # type: ignore[no-any-return]
+        return (now or utcnow()) > self.expires_at  # type: ignore[no-any-return]
 
-    def to_dict(self) -> dict:
-        """Convert share to dictionary."""
+    @classmethod
+    def not_expired(cls, now: datetime | None = None):
+        """SQL counterpart of ``not is_expired()`` for filtering queries."""
+        return db.or_(cls.expires_at.is_(None), cls.expires_at > (now or utcnow()))
+
+    def to_dict(self, now: datetime | None = None) -> dict:
+        """Convert share to dictionary.
+
+        Pass ``now`` when serializing many shares so they are all judged
+        against the same instant.
+        """
         return {
             "id": self.id,
             "team_id": self.team_id,
@@ -134,7 +168,7 @@ class AccountantShare(db.Model):  # type: ignore[name-defined]
             "access_level": self.access_level,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "is_expired": self.is_expired(),
+            "is_expired": self.is_expired(now),
             "accountant_email": self.accountant.email if self.accountant else None,
             "accountant_name": self.accountant.name if self.accountant else None,
         }
@@ -349,14 +383,42 @@ class Conversation(db.Model):  # type: ignore[name-defined]
     updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow)
     expires_at = db.Column(db.DateTime, default=default_expires_at, index=True)
 
-    # Relationship to messages
+    # Relationship to messages, oldest first. Callers that render several
+    # conversations add ``selectinload(Conversation.messages)`` to batch it.
     messages = db.relationship(
-        "Message", backref="conversation", cascade="all, delete-orphan", lazy="dynamic"
+        "Message",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        order_by="Message.created_at",
     )
 
-    def to_dict(self, include_messages: bool = False) -> dict:
-        """Convert conversation to dictionary."""
-        message_query = Message.query.filter_by(conversation_id=self.id)
+    @classmethod
+    def message_counts(cls, conversation_ids: list[str]) -> dict[str, int]:
+        """Count messages for several conversations in one grouped query."""
+        if not conversation_ids:
+            return {}
+        rows = (
+            db.session.query(Message.conversation_id, db.func.count(Message.id))
+            .filter(Message.conversation_id.in_(conversation_ids))
+            .group_by(Message.conversation_id)
+            .all()
+        )
+        return {conversation_id: count for conversation_id, count in rows}
+
+    def to_dict(
+        self, include_messages: bool = False, message_count: int | None = None
+    ) -> dict:
+        """Convert conversation to dictionary.
+
+        List views pass ``message_count`` from :meth:`message_counts` so each
+        row does not issue its own ``COUNT`` query.
+        """
+        messages = None
+        if include_messages:
+            messages = Message.to_dicts(Message.conversation_id == self.id)
+            message_count = len(messages)
+        elif message_count is None:
+            message_count = self.query_messages().count()
         data: dict = {
             "id": self.id,
             "user_id": self.user_id,
@@ -364,18 +426,36 @@ class Conversation(db.Model):  # type: ignore[name-defined]
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "message_count": message_query.count(),
+            "message_count": message_count,
         }
-        if include_messages:
-            data["messages"] = [
-                m.to_dict() for m in message_query.order_by(Message.created_at).all()
-            ]
+        if messages is not None:
+            data["messages"] = messages
         return data
 
+    def query_messages(self):
+        """Query this conversation's messages without loading the collection."""
+        return Message.query.filter_by(conversation_id=self.id).order_by(
+            Message.created_at
+        )
+
     def __repr__(self) -> str:
         return f"<Conversation {self.id[:8]}... ({self.user_id})>"
 
 
+# Columns read by Message.to_dicts; keep in step with Message._serialize
+_MESSAGE_FIELDS = (
+    "id",
+    "conversation_id",
+    "role",
+    "content",
+    "model",
+    "skills_used",
+    "input_tokens",
+    "output_tokens",
+    "created_at",
+)
+
+
 class Message(db.Model):  # type: ignore[name-defined]
     """
     Message model for storing individual chat messages within a conversation.
@@ -395,18 +475,40 @@ class Message(db.Model):  # type: ignore[name-defined]
     output_tokens = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=utcnow, index=True)
 
+    conversation = db.relationship("Conversation", back_populates="messages")
+
     def to_dict(self) -> dict:
         """Convert message to dictionary."""
+        return self._serialize(self)
+
+    @classmethod
+    def to_dicts(cls, *criteria) -> list[dict]:
+        """Serialize matching messages, oldest first, without loading ORM objects.
+
+        Selects the columns as plain rows, which skips identity-map bookkeeping
+        for long conversations. Rows expose the same attribute names as the
+        model, so they share :meth:`to_dict`'s shaping.
+        """
+        columns = [getattr(cls, name) for name in _MESSAGE_FIELDS]
+        rows = db.session.execute(
+            db.select(*columns).where(*criteria).order_by(cls.created_at)
+        )
+        return [cls._serialize(row) for row in rows]
+
+    @staticmethod
+    def _serialize(message) -> dict:
         return {
-            "id": self.id,
-            "conversation_id": self.conversation_id,
-            "role": self.role,
-            "content": self.content,
-            "model": self.model,
-            "skills_used": self.skills_used or [],
-            "input_tokens": self.input_tokens,
-            "output_tokens": self.output_tokens,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "id": message.id,
+            "conversation_id": message.conversation_id,
+            "role": message.role,
+            "content": message.content,
+            "model": message.model,
+            "skills_used": message.skills_used or [],
+            "input_tokens": message.input_tokens,
+            "output_tokens": message.output_tokens,
+            "created_at": (
+                message.created_at.isoformat() if message.created_at else None
+            ),
         }
 
     def __repr__(self) -> str:
@@ -425,13 +527,34 @@ class SkillUsage(db.Model):  # type: ignore[name-defined]
     skill_source = db.Column(
         db.String(20), nullable=False
     )  # 'public', 'private', 'shared'
-    user_id = db.Column(db.String(36), index=True)
-    team_id = db.Column(db.String(36), index=True)
+    user_id = db.Column(db.String(36))
+    team_id = db.Column(db.String(36))
     trigger = db.Column(db.String(255))
     confidence = db.Column(db.Float)
     conversation_id = db.Column(db.String(36))
     created_at = db.Column(db.DateTime, default=utcnow, index=True)
 
+    # Analytics filter by team or user over a date range and aggregate the
+    # included columns (counting rows, not ids), which Postgres can then
+    # answer from the index alone. These also serve plain team_id/user_id
+    # lookups, so those columns carry no single-column index.
+    __table_args__ = (
+        db.Index(
+            "ix_skill_usages_team_created",
+            "team_id",
+            "created_at",
+            postgresql_include=["skill_name", "skill_source", "confidence"],
+        ),
+        db.Index(
+            "ix_skill_usages_user_created",
+            "user_id",
+            "created_at",
+            postgresql_include=["skill_name", "skill_source", "confidence"],
+        ),
+        # Per-skill stats and the 30-day trend
+        db.Index("ix_skill_usages_name_created", "skill_name", "created_at"),
+    )
+
     def to_dict(self) -> dict:
         """Convert skill usage to dictionary."""
         return {
@@ -477,6 +600,17 @@ class TokenUsage(db.Model):  # type: ignore[name-defined]
             "period_month",
             name="uq_token_usage_period",
         ),
+        # The constraint above treats NULL user_id/team_id as distinct, and
+        # users without a team always have a NULL team_id. Coalescing the
+        # keys makes one record per period hold for those rows too.
+        db.Index(
+            "uq_token_usage_period_keys",
+            db.text("coalesce(user_id, '')"),
+            db.text("coalesce(team_id, '')"),
+            "period_year",
+            "period_month",
+            unique=True,
+        ),
     )
 
     def to_dict(self) -> dict:
@@ -527,3 +661,33 @@ class RuntimeHealthSnapshot(db.Model):  # type: ignore[name-defined]
 
     def __repr__(self) -> str:
         return f"<RuntimeHealthSnapshot {self.status} {self.created_at}>"
+
+
+class BackgroundTask(db.Model):  # type: ignore[name-defined]
+    """Status and result of slow work run outside the request thread."""
+
+    __tablename__ = "background_tasks"
+
+    id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
+    kind = db.Column(db.String(50), nullable=False)
+    user_id = db.Column(db.String(36), db.ForeignKey("users.id"), nullable=True)
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    result = db.Column(db.JSON, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=utcnow, index=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def to_dict(self) -> dict:
+        """Convert task to dictionary."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"<BackgroundTask {self.kind} {self.status}>"
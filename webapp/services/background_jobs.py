@@ -26,6 +26,9 @@ except Exception:  # pragma: no cover - exercised in integration environments
     BackgroundScheduler = None
     CronTrigger = None
 
+# Set on shutdown so jobs waiting to retry stop instead of sleeping it out
+_SHUTDOWN_EVENT = threading.Event()
+
 
 @dataclass(frozen=True)
 class ManagedJob:
@@ -40,6 +43,7 @@ class ManagedJob:
     max_runtime_seconds: int | None = None
     max_retries: int | None = None
     retry_backoff_seconds: float | None = None
+    max_retry_delay_seconds: float | None = None
     allow_overlap: bool = False
 
 
@@ -110,7 +114,18 @@ def start_background_scheduler(
     default_retry_backoff_seconds = float(
         app.config.get("BACKGROUND_JOB_RETRY_BACKOFF_SECONDS", 2.0)
     )
+    default_max_retry_delay_seconds = float(
+        app.config.get("BACKGROUND_JOB_MAX_RETRY_DELAY_SECONDS", 60.0)
+    )
     job_locks: dict[str, threading.Lock] = {}
+    # One pool for every job run. Threads start lazily; a run that times out
+    # keeps its worker until it returns, so size for that beyond one per job.
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(
+            len(jobs), int(app.config.get("BACKGROUND_JOB_MAX_WORKERS", 4))
+        ),
+        thread_name_prefix="bg-job",
+    )
 
     for job in jobs:
         cron_value = _read_str_env(job.cron_env_var) if job.cron_env_var else None
@@ -141,6 +156,7 @@ def start_background_scheduler(
             app=app,
             job=job,
             lock=job_locks.setdefault(job.job_id, threading.Lock()),
+            executor=executor,
             max_runtime_seconds=_resolve_int(
                 job.max_runtime_seconds,
                 default_max_runtime_seconds,
@@ -152,6 +168,11 @@ def start_background_scheduler(
                 default_retry_backoff_seconds,
                 minimum=0.1,
             ),
+            max_retry_delay_seconds=_resolve_float(
+                job.max_retry_delay_seconds,
+                default_max_retry_delay_seconds,
+                minimum=0.1,
+            ),
         )
 
         try:
@@ -215,6 +236,7 @@ def start_background_scheduler(
         report.started = True
         app.extensions["background_scheduler"] = scheduler
         atexit.register(_shutdown_scheduler, scheduler)
+        atexit.register(executor.shutdown, wait=False, cancel_futures=True)
     except Exception as exc:  # pragma: no cover - rare runtime branch
         reason = f"{type(exc).__name__}: {exc}"
         report.warnings.append(f"Scheduler failed to start ({reason}).")
@@ -244,6 +266,7 @@ def start_background_scheduler(
 
 
 def _shutdown_scheduler(scheduler: BackgroundScheduler) -> None:
+    _SHUTDOWN_EVENT.set()
     try:
         scheduler.shutdown(wait=False)
     except Exception:
@@ -255,9 +278,11 @@ def _wrap_job(
     app: Flask,
     job: ManagedJob,
     lock: threading.Lock,
+    executor: concurrent.futures.Executor,
     max_runtime_seconds: int,
     max_retries: int,
     retry_backoff_seconds: float,
+    max_retry_delay_seconds: float,
 ) -> Callable[[], None]:
     def runner() -> None:
         if not job.allow_overlap:
@@ -280,18 +305,27 @@ def _wrap_job(
 
         runtime_health.mark_job_started(job.job_id)
         started = time.monotonic()
+        pending: concurrent.futures.Future[object] | None = None
         try:
-            _run_job_with_retries(
+            pending = _run_job_with_retries(
                 app=app,
                 job=job,
+                executor=executor,
                 max_runtime_seconds=max_runtime_seconds,
                 max_retries=max_retries,
                 retry_backoff_seconds=retry_backoff_seconds,
+                max_retry_delay_seconds=max_retry_delay_seconds,
                 started_monotonic=started,
             )
         finally:
             if acquired:
-                lock.release()
+                if pending is None:
+                    lock.release()
+                else:
+                    # A timed-out run still occupies a pool worker; hold the
+                    # overlap guard until it finishes so a hung job cannot
+                    # take another worker on every tick
+                    pending.add_done_callback(lambda _future: lock.release())
 
     return runner
 
@@ -300,24 +334,31 @@ def _run_job_with_retries(
     *,
     app: Flask,
     job: ManagedJob,
+    executor: concurrent.futures.Executor,
     max_runtime_seconds: int,
     max_retries: int,
     retry_backoff_seconds: float,
+    max_retry_delay_seconds: float,
     started_monotonic: float,
-) -> None:
+) -> concurrent.futures.Future[object] | None:
+    """Run ``job`` with retries; return the run still in flight after a timeout."""
     attempt = 0
     while attempt <= max_retries:
-        outcome = _run_job_once(job.func, max_runtime_seconds=max_runtime_seconds)
+        outcome = _run_job_once(
+            job.func, executor=executor, max_runtime_seconds=max_runtime_seconds
+        )
         if outcome["ok"]:
             duration_ms = int((time.monotonic() - started_monotonic) * 1000)
             runtime_health.mark_job_success(job.job_id, duration_ms=duration_ms)
-            return
+            return None
 
         reason = str(outcome["reason"])
         timed_out = bool(outcome["timed_out"])
         should_retry = attempt < max_retries and not timed_out
         if should_retry:
-            delay_seconds = retry_backoff_seconds * (2**attempt)
+            delay_seconds = min(
+                retry_backoff_seconds * (2**attempt), max_retry_delay_seconds
+            )
             logger.warning(
                 "Job %s failed on attempt %s/%s (%s). Retrying in %.1fs",
                 job.job_id,
@@ -326,7 +367,11 @@ def _run_job_with_retries(
                 reason,
                 delay_seconds,
             )
-            time.sleep(delay_seconds)
+            if _SHUTDOWN_EVENT.wait(delay_seconds):
+                runtime_health.mark_job_skipped(
+                    job.job_id, "retry abandoned (scheduler shutting down)"
+                )
+                return None
             attempt += 1
             continue
 
@@ -341,34 +386,38 @@ def _run_job_with_retries(
             details={"reason": reason, "attempts": attempt + 1},
             dedupe_key=f"scheduler_job_failure:{job.job_id}:{reason.split(':', 1)[0]}",
         )
-        return
+        pending = outcome["pending"]
+        return pending if isinstance(pending, concurrent.futures.Future) else None
+    return None
 
 
 def _run_job_once(
     job_func: Callable[[], object],
     *,
+    executor: concurrent.futures.Executor,
     max_runtime_seconds: int,
 ) -> dict[str, object]:
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
     future = executor.submit(job_func)
     try:
         future.result(timeout=max_runtime_seconds)
-        return {"ok": True, "timed_out": False, "reason": ""}
+        return {"ok": True, "timed_out": False, "reason": "", "pending": None}
     except concurrent.futures.TimeoutError:
+        # Drops the run if it is still queued; a started run cannot be stopped
+        # and finishes in the background
         future.cancel()
         return {
             "ok": False,
             "timed_out": True,
             "reason": f"timed out after {max_runtime_seconds}s",
+            "pending": future,
         }
     except Exception as exc:
         return {
             "ok": False,
             "timed_out": False,
             "reason": f"{type(exc).__name__}: {exc}",
+            "pending": None,
         }
-    finally:
-        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def _read_bool_env(name: str, *, default: bool) -> bool:
@@ -8,7 +8,9 @@ Monthly deadlines: 21st of following month
 Special: December quarter due 28 Feb, GST annual due 28 Feb
 """
 
+import calendar
 from datetime import date, timedelta
+from functools import lru_cache
 
 # Quarterly BAS due dates (quarter_end_month -> due_month, due_day)
 QUARTERLY_DEADLINES = {
@@ -115,8 +117,6 @@ def _get_monthly_deadlines_for_period(
     current = date(start_date.year, start_date.month, 1)
 
     for _ in range(months_ahead + 2):
-        import calendar
-
         last_day = calendar.monthrange(current.year, current.month)[1]
         period_end = date(current.year, current.month, last_day)
         due = _get_monthly_deadline(current.year, current.month)
@@ -157,6 +157,20 @@ def get_upcoming_deadlines(
         List of deadline dicts with quarter/period, period_end, due_date, days_remaining
     """
     today = reference_date or date.today()
+    # Copy so callers can serialize or annotate entries without touching the cache
+    return [
+        dict(dl)
+        for dl in _compute_upcoming_deadlines(
+            frequency, days_ahead, today, lodge_method
+        )
+    ]
+
+
+@lru_cache(maxsize=64)
+def _compute_upcoming_deadlines(
+    frequency: str, days_ahead: int, today: date, lodge_method: str
+) -> tuple[dict, ...]:
+    """Compute upcoming deadlines; memoized since the date is part of the key."""
     cutoff = today + timedelta(days=days_ahead)
 
     if frequency == "monthly":
@@ -188,7 +202,7 @@ def get_upcoming_deadlines(
             upcoming.append(dl)
 
     upcoming.sort(key=lambda x: x["due_date"])
-    return upcoming
+    return tuple(upcoming)
 
 
 def _get_status(days_remaining: int) -> str:
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime
 
 from flask import Flask
 
-from webapp.models import Conversation, db
+from webapp.models import Conversation, Message, db
 from webapp.services.runtime_health import runtime_health
 from webapp.services.runtime_health_persistence import persist_runtime_health_snapshot
+from webapp.time_utils import utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +17,14 @@ logger = logging.getLogger(__name__)
 def cleanup_expired_conversations(app: Flask) -> int:
     """Delete expired conversations and return deleted row count."""
     with app.app_context():
-        now = datetime.now(UTC).replace(tzinfo=None)
-        expired = Conversation.query.filter(Conversation.expires_at <= now).all()
-        count = len(expired)
-
-        for conversation in expired:
-            db.session.delete(conversation)
+        now = utcnow()
+        # Delete in bulk rather than loading each conversation and its
+        # messages for the ORM cascade; the expires_at index finds the rows
+        expired = Conversation.query.filter(Conversation.expires_at <= now)
+        Message.query.filter(
+            Message.conversation_id.in_(expired.with_entities(Conversation.id))
+        ).delete(synchronize_session=False)
+        count = int(expired.delete(synchronize_session=False))
 
         if count > 0:
             db.session.commit()
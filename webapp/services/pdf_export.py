@@ -9,6 +9,7 @@ import logging
 from datetime import datetime
 
 from flask import render_template_string
+from sqlalchemy.orm import selectinload
 
 from webapp.time_utils import utcnow
 
@@ -198,12 +199,7 @@ def export_conversation(conversation_id: str, business_name: str = "") -> bytes:
     if not conversation:
         raise ValueError(f"Conversation {conversation_id} not found")
 
-    messages = [
-        msg.to_dict()
-        for msg in Message.query.filter_by(conversation_id=conversation.id)
-        .order_by(Message.created_at)
-        .all()
-    ]
+    messages = Message.to_dicts(Message.conversation_id == conversation.id)
 
     html = render_template_string(
         CONVERSATION_TEMPLATE,
@@ -264,8 +260,9 @@ def export_compliance_summary(
 
     conversations_data = []
     total_tokens = 0
+    query = query.options(selectinload(Conversation.messages))  # type: ignore[arg-type]
     for conv in query.order_by(Conversation.created_at.desc()).all():
-        msgs = conv.messages.all()
+        msgs = conv.messages
         skills = set()
         conv_tokens = 0
         for m in msgs:
@@ -318,26 +315,30 @@ def export_bulk_conversations(
     Returns:
         PDF file as bytes
     """
-    from webapp.models import Conversation, Message, db
+    from webapp.models import Conversation
+
+    # Load every conversation and its messages in two queries, then restore
+    # the requested order
+    by_id = {
+        conversation.id: conversation
+        for conversation in Conversation.query.options(
+            selectinload(Conversation.messages)  # type: ignore[arg-type]
+        )
+        .filter(Conversation.id.in_(conversation_ids))
+        .all()
+    }
 
     all_sections = []
     for cid in conversation_ids:
-        conversation = db.session.get(Conversation, cid)
+        conversation = by_id.get(cid)
         if not conversation:
             continue
 
-        messages = [
-            msg.to_dict()
-            for msg in Message.query.filter_by(conversation_id=conversation.id)
-            .order_by(Message.created_at)
-            .all()
-        ]
-
         all_sections.append(
             {
                 "title": conversation.title or "Untitled",
                 "conversation_id": conversation.id,
-                "messages": messages,
+                "messages": [msg.to_dict() for msg in conversation.messages],
             }
         )
 
@@ -9,9 +9,24 @@ import html
 from collections import defaultdict
 from datetime import date
 
-from webapp.models import ChecklistComment, ChecklistProgress, db
+from sqlalchemy import exists, insert, literal, select
+from sqlalchemy.orm import selectinload
+
+from webapp.models import (
+    ChecklistComment,
+    ChecklistProgress,
+    User,
+    db,
+    generate_uuid,
+    raiseload_if_enabled,
+)
 from webapp.time_utils import utcnow
 
+
+class ChecklistNotFoundError(LookupError):
+    """Raised when a checklist does not exist or belongs to another team."""
+
+
 MONTH_END_CHECKLIST = [
     {
         "key": "bank_rec",
@@ -172,6 +187,25 @@ def get_eofy_checklist() -> list[dict]:
     return [dict(item, completed=False) for item in EOFY_CHECKLIST]
 
 
+def _progress_filters(
+    team_id: str,
+    checklist_type: str,
+    period: str,
+    tenant_id: str | None = None,
+) -> list:
+    """WHERE criteria for one progress record, scoped by tenant when provided."""
+    return [
+        ChecklistProgress.team_id == team_id,
+        ChecklistProgress.checklist_type == checklist_type,
+        ChecklistProgress.period == period,
+        (
+            ChecklistProgress.tenant_id == tenant_id
+            if tenant_id
+            else ChecklistProgress.tenant_id.is_(None)
+        ),
+    ]
+
+
 def _load_progress_record(
     team_id: str,
     checklist_type: str,
@@ -179,16 +213,33 @@ def _load_progress_record(
     tenant_id: str | None = None,
 ) -> ChecklistProgress | None:
     """Load the ORM progress record, filtered by tenant when provided."""
-    query = ChecklistProgress.query.filter_by(
-        team_id=team_id,
-        checklist_type=checklist_type,
-        period=period,
-    )
-    if tenant_id:
-        query = query.filter_by(tenant_id=tenant_id)
-    else:
-        query = query.filter(ChecklistProgress.tenant_id.is_(None))
-    return query.first()  # type: ignore[no-any-return]
+    return ChecklistProgress.query.filter(  # type: ignore[no-any-return]
+        *_progress_filters(team_id, checklist_type, period, tenant_id)
+    ).first()
+
+
+def _resolve_current_checklist(
+    reference_date: date | None = None,
+) -> tuple[str, str, list[dict]]:
+    """Return (checklist_type, period, template items) for a date."""
+    today = reference_date or date.today()
+
+    # Use EOFY checklist in May, June, July
+    if today.month in (5, 6, 7):
+        # EOFY period is the FY ending June 30
+        fy_year = today.year if today.month <= 6 else today.year
+        return "eofy", f"{fy_year}-06", EOFY_CHECKLIST
+    return "month_end", today.strftime("%Y-%m"), MONTH_END_CHECKLIST
+
+
+def _completion_stats(completed: int, total: int) -> dict:
+    """Summary counters shared by the full checklist and status views."""
+    return {
+        "total": total,
+        "completed": completed,
+        "percentage": round((completed / total) * 100, 1) if total else 0,
+        "is_complete": completed == total,
+    }
 
 
 def get_current_checklist(
@@ -212,19 +263,8 @@ def get_current_checklist(
         Dict with checklist_type, period, items, progress stats,
         and checklist_progress_id when saved progress exists.
     """
-    today = reference_date or date.today()
-
-    # Use EOFY checklist in May, June, July
-    if today.month in (5, 6, 7):
-        checklist_type = "eofy"
-        items = get_eofy_checklist()
-        # EOFY period is the FY ending June 30
-        fy_year = today.year if today.month <= 6 else today.year
-        period = f"{fy_year}-06"
-    else:
-        checklist_type = "month_end"
-        items = get_month_end_checklist()
-        period = today.strftime("%Y-%m")
+    checklist_type, period, template = _resolve_current_checklist(reference_date)
+    items = [dict(item, completed=False) for item in template]
 
     # Load saved progress
     progress = _load_progress_record(team_id, checklist_type, period, tenant_id)
@@ -243,10 +283,7 @@ def get_current_checklist(
         "checklist_type": checklist_type,
         "period": period,
         "items": items,
-        "total": len(items),
-        "completed": completed_count,
-        "percentage": round((completed_count / len(items)) * 100, 1) if items else 0,
-        "is_complete": completed_count == len(items),
+        **_completion_stats(completed_count, len(items)),
         "tenant_id": tenant_id,
         "tenant_name": tenant_name,
         "checklist_progress_id": progress.id if progress else None,
@@ -254,6 +291,46 @@ def get_current_checklist(
     return result
 
 
+def get_current_checklist_summary(
+    team_id: str,
+    reference_date: date | None = None,
+    tenant_id: str | None = None,
+) -> dict:
+    """
+    Get completion counts for the current checklist without its items.
+
+    Selects only the saved ``items`` column and skips building the
+    per-item list, for cheap status polling.
+
+    Args:
+        team_id: Team ID
+        reference_date: Optional reference date
+        tenant_id: Optional Xero tenant ID for per-org progress
+
+    Returns:
+        Dict with checklist_type, period, total, completed, percentage
+        and is_complete.
+    """
+    checklist_type, period, template = _resolve_current_checklist(reference_date)
+
+    saved_items = (
+        db.session.query(ChecklistProgress.items)
+        .filter(*_progress_filters(team_id, checklist_type, period, tenant_id))
+        .limit(1)
+        .scalar()
+    )
+    completed_count = 0
+    if saved_items:
+        saved = {item["key"]: item.get("completed", False) for item in saved_items}
+        completed_count = sum(1 for item in template if saved.get(item["key"]))
+
+    return {
+        "checklist_type": checklist_type,
+        "period": period,
+        **_completion_stats(completed_count, len(template)),
+    }
+
+
 def save_checklist_progress(
     team_id: str,
     user_id: str,
@@ -351,22 +428,30 @@ def add_checklist_comment(
     user_id: str,
     content: str,
     assigned_to: str | None = None,
+    team_id: str | None = None,
 ) -> ChecklistComment:
     """
     Add a comment/note to a checklist item.
 
+    When ``team_id`` is given, the checklist ownership and assignee
+    membership checks run inside the INSERT itself, so the comment is
+    validated and written in a single round-trip.
+
     Args:
         checklist_progress_id: FK to ChecklistProgress
         item_key: Which checklist item this note is for
         user_id: Author's user ID
         content: The note text (max 2000 chars, HTML-escaped)
         assigned_to: Optional user ID to assign the item to
+        team_id: Optional team that must own the checklist (and assignee)
 
     Returns:
         The created ChecklistComment
 
     Raises:
-        ValueError: If item_key is invalid or content is empty/too long
+        ValueError: If item_key is invalid, content is empty, or the
+            assignee is not an active member of ``team_id``
+        ChecklistNotFoundError: If the checklist does not belong to ``team_id``
     """
     if item_key not in _ALL_ITEM_KEYS:
         raise ValueError(f"Invalid item_key: {item_key}")
@@ -380,6 +465,11 @@ def add_checklist_comment(
     # Escape HTML to prevent stored XSS
     content = html.escape(content)
 
+    if team_id is not None:
+        return _insert_team_comment(
+            checklist_progress_id, item_key, user_id, content, assigned_to, team_id
+        )
+
     comment = ChecklistComment(
         checklist_progress_id=checklist_progress_id,
         item_key=item_key,
@@ -392,6 +482,69 @@ def add_checklist_comment(
     return comment
 
 
+def _insert_team_comment(
+    checklist_progress_id: str,
+    item_key: str,
+    user_id: str,
+    content: str,
+    assigned_to: str | None,
+    team_id: str,
+) -> ChecklistComment:
+    """INSERT ... SELECT ... RETURNING a comment, guarded by team ownership checks."""
+    comment_id = generate_uuid()
+    conditions = [
+        ChecklistProgress.id == checklist_progress_id,
+        ChecklistProgress.team_id == team_id,
+    ]
+    if assigned_to:
+        conditions.append(
+            exists().where(
+                User.id == assigned_to,
+                User.team_id == team_id,
+                User.is_active.is_(True),
+            )
+        )
+
+    values = select(
+        literal(comment_id),
+        ChecklistProgress.id,
+        literal(item_key),
+        literal(user_id),
+        literal(content),
+        literal(assigned_to),
+        literal(utcnow()),
+    ).where(*conditions)
+    stmt = (
+        insert(ChecklistComment)
+        .from_select(
+            [
+                "id",
+                "checklist_progress_id",
+                "item_key",
+                "user_id",
+                "content",
+                "assigned_to",
+                "created_at",
+            ],
+            values,
+        )
+        .returning(ChecklistComment)
+    )
+
+    comment = db.session.scalars(stmt).first()
+    if comment is None:
+        # Slow path: work out which guard rejected the insert.
+        owned = ChecklistProgress.query.filter_by(
+            id=checklist_progress_id, team_id=team_id
+        ).first()
+        if not owned:
+            raise ChecklistNotFoundError(checklist_progress_id)
+        raise ValueError("Assigned user is not a team member")
+
+    db.session.commit()
+    return comment
+
+
 def get_checklist_comments(
     checklist_progress_id: str,
 ) -> dict[str, list[dict]]:
@@ -404,8 +557,15 @@ def get_checklist_comments(
     Returns:
         Dict mapping item_key to list of comment dicts
     """
+    # to_dict() reads the author and assignee; load them in one extra query each
+    # and (in tests) raise on any other lazy load rather than querying per comment
     comments = (
-        ChecklistComment.query.filter_by(checklist_progress_id=checklist_progress_id)
+        ChecklistComment.query.options(
+            selectinload(ChecklistComment.author),  # type: ignore[arg-type]
+            selectinload(ChecklistComment.assignee),  # type: ignore[arg-type]
+            *raiseload_if_enabled(),
+        )
+        .filter_by(checklist_progress_id=checklist_progress_id)
         .order_by(ChecklistComment.created_at.asc())
         .all()
     )
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 
 from flask import Flask
 
 from webapp.models import RuntimeHealthSnapshot, db
 from webapp.services.operational_alerts import send_operational_alert
+from webapp.time_utils import utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +64,7 @@ def _trim_runtime_health_snapshots(app: Flask) -> None:
     retention_days = int(app.config.get("RUNTIME_HEALTH_SNAPSHOT_RETENTION_DAYS", 30))
     max_rows = int(app.config.get("RUNTIME_HEALTH_SNAPSHOT_MAX_ROWS", 2000))
 
-    cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=retention_days)
+    cutoff = utcnow() - timedelta(days=retention_days)
     RuntimeHealthSnapshot.query.filter(
         RuntimeHealthSnapshot.created_at < cutoff
     ).delete(synchronize_session=False)
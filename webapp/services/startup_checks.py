@@ -180,6 +180,14 @@ def run_startup_config_audit(app: Flask) -> dict[str, list[str]]:
         else:
             warnings.append(message)
 
+    # Debug mode and propagated exceptions add per-error overhead and leak
+    # tracebacks; a production deploy should run with both left off.
+    if not app.config.get("TESTING") and _is_production_deployment():
+        if app.config.get("DEBUG"):
+            errors.append("DEBUG is enabled in a production deployment.")
+        if app.config.get("PROPAGATE_EXCEPTIONS"):
+            errors.append("PROPAGATE_EXCEPTIONS is enabled in a production deployment.")
+
     database_uri = app.config.get("SQLALCHEMY_DATABASE_URI", "")
     if is_production and str(database_uri).startswith("sqlite:///"):
         errors.append(
@@ -283,7 +291,10 @@ def _is_production_context(app: Flask) -> bool:
         return False
     if app.config.get("DEBUG"):
         return False
+    return _is_production_deployment()
+
 
+def _is_production_deployment() -> bool:
     explicit_env = (
         os.getenv("FLASK_ENV")
         or os.getenv("APP_ENV")
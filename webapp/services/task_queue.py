@@ -0,0 +1,220 @@
+"""Run slow request work on a thread pool and track it in the database.
+
+Endpoints that would otherwise hold a gunicorn worker for a full Xero
+round-trip submit the work here and return a task id straight away. Task
+status and results live in the ``background_tasks`` table, so any worker
+process can answer the follow-up status poll.
+"""
+
+from __future__ import annotations
+
+import atexit
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+from flask import Flask
+from sqlalchemy import update
+
+from webapp.models import BackgroundTask, db, generate_uuid
+from webapp.time_utils import utcnow
+
+logger = logging.getLogger(__name__)
+
+TASK_STATUS_QUEUED = "queued"
+TASK_STATUS_RUNNING = "running"
+TASK_STATUS_SUCCEEDED = "succeeded"
+TASK_STATUS_FAILED = "failed"
+
+# Shown to clients instead of the exception text, which may hold secrets
+_TASK_FAILED_MESSAGE = "Task failed"
+# Recorded on tasks whose worker went away (restart, deploy) before finishing
+_TASK_INTERRUPTED_MESSAGE = "Task was interrupted; please try again"
+
+
+class TaskQueue:
+    """Thread pool that records task progress in ``BackgroundTask`` rows.
+
+    With ``eager=True`` tasks run inline on submit, which keeps tests
+    deterministic.
+    """
+
+    def __init__(self, app: Flask, max_workers: int = 4, eager: bool = False):
+        self._app = app
+        self._eager = eager
+        self._max_workers = max_workers
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def size(self) -> int:
+        """Number of submitted tasks that have not finished yet."""
+        with self._lock:
+            return self._pending
+
+    def submit(
+        self,
+        kind: str,
+        func: Callable[..., Any],
+        *args: Any,
+        user_id: str | None = None,
+    ) -> str:
+        """Record a queued task, schedule ``func(*args)`` and return the task id.
+
+        ``func`` runs inside an app context and must return a JSON-serializable
+        value, which becomes the task result.
+        """
+        # Assign the id up front so the committed row is never reloaded here
+        task_id = generate_uuid()
+        db.session.add(
+            BackgroundTask(
+                id=task_id, kind=kind, user_id=user_id, status=TASK_STATUS_QUEUED
+            )
+        )
+        db.session.commit()
+
+        with self._lock:
+            self._pending += 1
+        if self._eager:
+            self._run(task_id, func, args)
+        else:
+            self._get_executor().submit(self._run, task_id, func, args)
+        return task_id
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work, by default without waiting for running tasks.
+
+        The atexit hook must not hold up a worker's exit, so queued tasks are
+        dropped and running ones abandoned; their rows are later marked
+        failed by :func:`fail_stale_tasks`. Pass ``wait=True`` to drain.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="task-queue",
+                )
+                atexit.register(self.shutdown)
+            return self._executor
+
+    def _run(self, task_id: str, func: Callable[..., Any], args: tuple) -> None:
+        try:
+            with self._app.app_context():
+                _set_task_state(task_id, status=TASK_STATUS_RUNNING)
+                try:
+                    result = func(*args)
+                except Exception:
+                    logger.exception("Background task %s failed", task_id)
+                    db.session.rollback()
+                    _set_task_state(
+                        task_id,
+                        status=TASK_STATUS_FAILED,
+                        error=_TASK_FAILED_MESSAGE,
+                        finished_at=utcnow(),
+                    )
+                else:
+                    _set_task_state(
+                        task_id,
+                        status=TASK_STATUS_SUCCEEDED,
+                        result=result,
+                        finished_at=utcnow(),
+                    )
+        except Exception:
+            logger.exception("Could not record state for background task %s", task_id)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+def _set_task_state(task_id: str, **values: Any) -> None:
+    db.session.execute(
+        update(BackgroundTask).where(BackgroundTask.id == task_id).values(**values)
+    )
+    db.session.commit()
+
+
+def init_task_queue(app: Flask) -> TaskQueue:
+    """Create the app's task queue and expose it as ``app.extensions["task_queue"]``.
+
+    Reads ``TASK_QUEUE_MAX_WORKERS`` and ``TASK_QUEUE_EAGER`` from the app
+    config. Registering under ``task_queue`` also surfaces the pending count
+    in the runtime health report.
+    """
+    queue = TaskQueue(
+        app,
+        max_workers=int(app.config.get("TASK_QUEUE_MAX_WORKERS", 4)),
+        eager=bool(app.config.get("TASK_QUEUE_EAGER", False)),
+    )
+    app.extensions["task_queue"] = queue
+    return queue
+
+
+def get_task_queue(app: Flask) -> TaskQueue:
+    """Return the task queue registered by :func:`init_task_queue`."""
+    return app.extensions["task_queue"]  # type: ignore[no-any-return]
+
+
+def get_task(task_id: str, user_id: str | None) -> BackgroundTask | None:
+    """Load a task, hiding tasks that belong to another user."""
+    task: BackgroundTask | None = db.session.get(BackgroundTask, task_id)
+    if task is None or task.user_id != user_id:
+        return None
+    return task
+
+
+def fail_stale_tasks(app: Flask) -> int:
+    """Mark unfinished tasks older than ``TASK_STALE_AFTER_MINUTES`` as failed.
+
+    Tasks run in the submitting worker's thread pool, so a worker restart or
+    deploy leaves their rows queued or running with nothing left to finish
+    them. Failing them stops status polls from waiting forever and lets
+    :func:`purge_finished_tasks` clean them up.
+    """
+    stale_minutes = int(app.config.get("TASK_STALE_AFTER_MINUTES", 30))
+    with app.app_context():
+        now = utcnow()
+        result = db.session.execute(
+            update(BackgroundTask)
+            .where(
+                BackgroundTask.created_at < now - timedelta(minutes=stale_minutes),
+                BackgroundTask.status.in_((TASK_STATUS_QUEUED, TASK_STATUS_RUNNING)),
+            )
+            .values(
+                status=TASK_STATUS_FAILED,
+                error=_TASK_INTERRUPTED_MESSAGE,
+                finished_at=now,
+            )
+        )
+        db.session.commit()
+        count = int(result.rowcount)  # type: ignore[attr-defined]
+        if count:
+            logger.warning("Marked %s interrupted background tasks as failed", count)
+        return count
+
+
+def purge_finished_tasks(app: Flask) -> int:
+    """Delete finished tasks older than ``TASK_RESULT_RETENTION_HOURS``.
+
+    Stale unfinished tasks are failed first (see :func:`fail_stale_tasks`), so
+    orphaned rows are purged once they age past the retention window too.
+    """
+    fail_stale_tasks(app)
+    retention_hours = int(app.config.get("TASK_RESULT_RETENTION_HOURS", 24))
+    with app.app_context():
+        cutoff = utcnow() - timedelta(hours=retention_hours)
+        count = BackgroundTask.query.filter(
+            BackgroundTask.created_at < cutoff,
+            BackgroundTask.status.in_((TASK_STATUS_SUCCEEDED, TASK_STATUS_FAILED)),
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        if count:
+            logger.info("Purged %s finished background tasks", count)
+        return int(count)
@@ -0,0 +1,59 @@
+"""Small in-process cache with per-entry expiry."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Hashable
+from threading import Lock
+from typing import Any
+
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire after ``ttl_seconds``.
+
+    Entries live in the worker process only, so each gunicorn worker keeps
+    its own copy. When ``max_entries`` is reached, expired entries are
+    dropped first and then the oldest insertions.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for ``key``, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key`` for ``ttl_seconds``."""
+        now = time.monotonic()
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                self._evict(now)
+            self._entries[key] = (value, now + self.ttl_seconds)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict(self, now: float) -> None:
+        for key in [k for k, (_, exp) in self._entries.items() if now >= exp]:
+            del self._entries[key]
+        while len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
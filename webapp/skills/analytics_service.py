@@ -8,9 +8,9 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func
+from sqlalchemy import func, insert
 
 from webapp.models import SkillUsage, db
 from webapp.time_utils import utcnow
@@ -82,6 +82,25 @@ class SkillAnalyticsService:
 
         return usage
 
+    def log_usages(self, usages: list[dict[str, Any]]) -> int:
+        """
+        Log several skill usage events with one INSERT and one commit.
+
+        Args:
+            usages: Dicts taking the same keyword arguments as ``log_usage``
+
+        Returns:
+            Number of events logged
+        """
+        if not usages:
+            return 0
+
+        db.session.execute(insert(SkillUsage), usages)
+        db.session.commit()
+
+        logger.debug(f"Logged {len(usages)} skill usages")
+        return len(usages)
+
     def get_top_skills(
         self,
         period_days: int = 30,
@@ -106,7 +125,7 @@ class SkillAnalyticsService:
         query = db.session.query(
             SkillUsage.skill_name,
             SkillUsage.skill_source,
-            func.count(SkillUsage.id).label("usage_count"),
+            func.count().label("usage_count"),
             func.avg(SkillUsage.confidence).label("avg_confidence"),
         ).filter(SkillUsage.created_at >= since)
 
@@ -116,7 +135,7 @@ class SkillAnalyticsService:
             query = query.filter(SkillUsage.team_id == team_id)
 
         query = query.group_by(SkillUsage.skill_name, SkillUsage.skill_source)
-        query = query.order_by(func.count(SkillUsage.id).desc())
+        query = query.order_by(func.count().desc())
         query = query.limit(limit)
 
         results = query.all()
@@ -167,7 +186,7 @@ class SkillAnalyticsService:
         source_query = (
             db.session.query(
                 SkillUsage.skill_source,
-                func.count(SkillUsage.id).label("count"),
+                func.count().label("count"),
             )
             .filter(SkillUsage.user_id == user_id)
             .group_by(SkillUsage.skill_source)
@@ -221,7 +240,7 @@ class SkillAnalyticsService:
         daily_usage = (
             db.session.query(
                 func.date(SkillUsage.created_at).label("date"),
-                func.count(SkillUsage.id).label("count"),
+                func.count().label("count"),
             )
             .filter(
                 SkillUsage.skill_name == skill_name,
@@ -237,14 +256,14 @@ class SkillAnalyticsService:
         top_triggers = (
             db.session.query(
                 SkillUsage.trigger,
-                func.count(SkillUsage.id).label("count"),
+                func.count().label("count"),
             )
             .filter(
                 SkillUsage.skill_name == skill_name,
                 SkillUsage.trigger.isnot(None),
             )
             .group_by(SkillUsage.trigger)
-            .order_by(func.count(SkillUsage.id).desc())
+            .order_by(func.count().desc())
             .limit(5)
             .all()
         )
@@ -296,7 +315,7 @@ class SkillAnalyticsService:
         source_query = (
             db.session.query(
                 SkillUsage.skill_source,
-                func.count(SkillUsage.id).label("count"),
+                func.count().label("count"),
             )
             .filter(SkillUsage.created_at >= since)
             .group_by(SkillUsage.skill_source)
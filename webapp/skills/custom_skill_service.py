@@ -9,8 +9,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+from webapp.services.ttl_cache import TTLCache
+
 from . import SkillLoader
 from .r2_skill_loader import (
     R2SkillLoader,
@@ -25,6 +29,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# SKILL.md content downloaded from R2, keyed by (storage_key, content_hash).
+# An edit changes the hash, so stale content is never served.
+SKILL_CONTENT_CACHE_TTL_SECONDS = 600
+SKILL_CONTENT_CACHE_MAX_ENTRIES = 128
+
+# R2 downloads run in parallel when several skills' content is requested at once
+SKILL_CONTENT_MAX_CONCURRENT_DOWNLOADS = 8
+
 
 class CustomSkillServiceError(Exception):
     """Base exception for custom skill service errors."""
@@ -92,6 +104,10 @@ class CustomSkillService:
         """
         self.r2_loader = r2_loader
         self.skill_loader = SkillLoader()
+        self._content_cache = TTLCache(
+            ttl_seconds=SKILL_CONTENT_CACHE_TTL_SECONDS,
+            max_entries=SKILL_CONTENT_CACHE_MAX_ENTRIES,
+        )
 
     def _get_r2_loader(self) -> R2SkillLoader:
         """Get R2 loader, using singleton if not injected."""
@@ -473,10 +489,32 @@ tags: {private_skill.tags or []}
         result: CustomSkill | None = db.session.get(CustomSkill, skill_id)
         return result
 
+    def get_skills(self, skill_ids: list[str]) -> list[CustomSkill]:
+        """
+        Get several custom skills by ID in one query.
+
+        Args:
+            skill_ids: Skill IDs
+
+        Returns:
+            CustomSkill instances found (missing IDs are omitted)
+        """
+        from webapp.models import CustomSkill
+
+        if not skill_ids:
+            return []
+        result: list[CustomSkill] = CustomSkill.query.filter(
+            CustomSkill.id.in_(skill_ids)
+        ).all()
+        return result
+
     def get_skill_content(self, skill_id: str) -> str | None:
         """
         Get full skill content from R2.
 
+        Content is cached per content hash, so repeat reads of an unchanged
+        skill skip the R2 round-trip.
+
         Args:
             skill_id: Skill ID
 
@@ -489,15 +527,105 @@ tags: {private_skill.tags or []}
         if not custom_skill:
             return None
 
+        cache_key = (custom_skill.storage_key, custom_skill.content_hash)
+        content: str | None = self._content_cache.get(cache_key)
+        if content is not None:
+            return content
+
         try:
             r2_loader = self._get_r2_loader()
             if r2_loader.is_enabled:
-                return r2_loader.download(custom_skill.storage_key)
+                content = r2_loader.download(custom_skill.storage_key)
+                if content is not None:
+                    self._content_cache.set(cache_key, content)
+                return content
         except (R2StorageDisabledError, R2SkillLoaderError) as e:
             logger.warning(f"Could not load skill content from R2: {e}")
 
         return None
 
+    def get_skill_list_version(
+        self, user_id: str, team_id: str | None = None
+    ) -> tuple[int, datetime | None]:
+        """
+        Get a version stamp for the custom skills a user can list.
+
+        The stamp is read from the database, so every worker agrees on it:
+        creating, editing, sharing or deleting a skill changes the row count
+        or the latest ``updated_at``.
+
+        Args:
+            user_id: User ID (for private skills)
+            team_id: Team ID (for shared skills)
+
+        Returns:
+            (row count, latest updated_at) of the user's private and team's
+            shared skills
+        """
+        from sqlalchemy import and_, func, or_
+
+        from webapp.models import CustomSkill, db
+
+        visible = and_(CustomSkill.user_id == user_id, CustomSkill.scope == "private")
+        if team_id:
+            visible = or_(
+                visible,
+                and_(CustomSkill.team_id == team_id, CustomSkill.scope == "shared"),
+            )
+        count, latest = db.session.execute(
+            db.select(func.count(), func.max(CustomSkill.updated_at)).where(
+                visible, CustomSkill.is_active.is_(True)
+            )
+        ).one()
+        return int(count), latest
+
+    def get_skills_content(self, skills: list[CustomSkill]) -> dict[str, str | None]:
+        """
+        Get full skill content for several skills.
+
+        Cached content is used where possible; the remaining skills are
+        downloaded from R2 concurrently, a few at a time.
+
+        Args:
+            skills: CustomSkill instances
+
+        Returns:
+            SKILL.md content keyed by skill ID (None if not found)
+        """
+        contents: dict[str, str | None] = {}
+        # (skill_id, cache_key) for misses; worker threads only see storage keys
+        missing: list[tuple[str, tuple[str, str | None]]] = []
+        for skill in skills:
+            cache_key = (skill.storage_key, skill.content_hash)
+            content = self._content_cache.get(cache_key)
+            if content is None:
+                missing.append((skill.id, cache_key))
+            contents[skill.id] = content
+        if not missing:
+            return contents
+
+        r2_loader = self._get_r2_loader()
+        if not r2_loader.is_enabled:
+            return contents
+
+        def _download(storage_key: str) -> str | None:
+            try:
+                return r2_loader.download(storage_key)
+            except (R2StorageDisabledError, R2SkillLoaderError) as e:
+                logger.warning(f"Could not load skill content from R2: {e}")
+                return None
+
+        workers = min(SKILL_CONTENT_MAX_CONCURRENT_DOWNLOADS, len(missing))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            downloaded = executor.map(
+                _download, [cache_key[0] for _, cache_key in missing]
+            )
+            for (skill_id, cache_key), content in zip(missing, downloaded, strict=True):
+                if content is not None:
+                    self._content_cache.set(cache_key, content)
+                contents[skill_id] = content
+        return contents
+
     def list_user_skills(self, user_id: str) -> list[CustomSkill]:
         """
         List all private skills for a user.
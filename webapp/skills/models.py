@@ -87,21 +87,22 @@ class Skill:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert skill to dictionary for API responses."""
+        metadata = self.metadata
         return {
-            "name": self.name,
-            "description": self.description,
-            "version": self.metadata.version,
-            "author": self.metadata.author,
-            "triggers": self.triggers,
-            "industries": self.industries,
-            "tags": self.metadata.tags,
+            "name": metadata.name,
+            "description": metadata.description,
+            "version": metadata.version,
+            "author": metadata.author,
+            "triggers": metadata.triggers,
+            "industries": metadata.industries,
+            "tags": metadata.tags,
             "source": self.source,
             "owner_id": self.owner_id,
             "path": self.path,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMatch:
     """Result of matching a user message to skills."""
 